@@ -50,6 +50,7 @@ REQUIRES = [
     "connexion~=2.13.0",
     "flask~=2.0",
     "jmespath~=0.10",
+    "importlib-metadata; python_version < '3.8'",
 ]
 
 LAMBDA_REQUIRES = [
@@ -19,6 +19,7 @@ from aws_xray_sdk.ext.flask.middleware import XRayMiddleware
 
 from pcluster.api.awslambda.serverless_wsgi import handle_request
 from pcluster.api.flask_app import ParallelClusterFlaskApp
+from pcluster.templates.cdk_builder import CDKTemplateBuilder
 
 logger = Logger(service="pcluster", location="%(filename)s:%(lineno)s:%(funcName)s()")
 tracer = Tracer(service="pcluster")
@@ -28,6 +29,8 @@ pcluster_api = None  # pylint: disable=invalid-name
 
 profile = environ.get("PROFILE", "prod")
 is_dev_profile = profile == "dev"
+# Load the CDK libraries when the container is initialized rather than in the first request building a template
+warm_up_cdk = environ.get("WARM_UP_CDK", "true").lower() == "true"  # pylint: disable=invalid-name
 
 if is_dev_profile:
     logger.info("Running with dev profile")
@@ -37,7 +40,19 @@ if is_dev_profile:
 
 @tracer.capture_method
 def _init_flask_app():
-    return ParallelClusterFlaskApp(swagger_ui=is_dev_profile, validate_responses=is_dev_profile)
+    pcluster_flask_app = ParallelClusterFlaskApp(swagger_ui=is_dev_profile, validate_responses=is_dev_profile)
+    if warm_up_cdk:
+        _warm_up_cdk()
+    return pcluster_flask_app
+
+
+@tracer.capture_method
+def _warm_up_cdk():
+    try:
+        CDKTemplateBuilder.warm_up()
+    except Exception as e:
+        # Not fatal, the error is raised again by the requests building a template
+        logger.warning("Unable to warm up the CDK libraries: %s", e)
 
 
 @logger.inject_lambda_context(log_event=is_dev_profile)
@@ -9,6 +9,7 @@
 # pylint: disable=W0613
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
 
 from pcluster.api.controllers.common import (
@@ -16,8 +17,11 @@ from pcluster.api.controllers.common import (
     configure_aws_region,
     configure_aws_region_from_config,
     convert_errors,
+    get_regions,
     get_validator_suppressors,
     http_success_status_code,
+    is_multi_region,
+    list_across_regions,
     validate_cluster,
 )
 from pcluster.api.converters import (
@@ -54,17 +58,31 @@ from pcluster.api.models import (
 )
 from pcluster.api.util import assert_valid_node_js
 from pcluster.aws.aws_api import AWSApi
-from pcluster.aws.common import StackNotFoundError
+from pcluster.aws.batch import BatchClient
+from pcluster.aws.cfn import CfnClient
+from pcluster.aws.common import AWSClientError, StackNotFoundError
+from pcluster.aws.dynamo import DynamoResource
+from pcluster.aws.ec2 import Ec2Client
+from pcluster.aws.s3 import S3Client
 from pcluster.config.config_patch import ConfigPatch
 from pcluster.config.update_policy import UpdatePolicy
+from pcluster.constants import (
+    DESCRIBE_CLUSTER_MAX_WORKERS,
+    PCLUSTER_CLUSTER_NAME_TAG,
+    PCLUSTER_NODE_TYPE_TAG,
+    PCLUSTER_S3_ARTIFACTS_DICT,
+)
 from pcluster.models.cluster import (
     Cluster,
     ClusterActionError,
     ClusterUpdateError,
     ConfigValidationError,
+    NodeType,
     NotFoundClusterActionError,
 )
-from pcluster.models.cluster_resources import ClusterStack
+from pcluster.models.cluster_resources import ClusterInstance, ClusterStack
+from pcluster.models.compute_fleet_status_manager import ComputeFleetStatus, ComputeFleetStatusManager
+from pcluster.models.s3_bucket import S3Bucket, S3FileType
 from pcluster.utils import get_installed_version, to_utc_datetime
 from pcluster.validators.common import FailureLevel
 
@@ -208,69 +226,109 @@ def describe_cluster(cluster_name, region=None):
     :rtype: DescribeClusterResponseContent
     """
     cluster = Cluster(cluster_name)
-    validate_cluster(cluster)
-    cfn_stack = cluster.stack
+    with ThreadPoolExecutor(max_workers=DESCRIBE_CLUSTER_MAX_WORKERS) as executor:
+        # The head node is retrieved by cluster name tag, hence the lookup does not need to wait for the stack
+        head_node_future = executor.submit(_get_head_node, cluster)
+        validate_cluster(cluster)
+        cfn_stack = cluster.stack
+
+        fleet_status_future = executor.submit(lambda: cluster.compute_fleet_status)
+        # The bucket and the config of the cluster are initialized lazily without locking, hence the lookups
+        # depending on them run on this thread, while the head node and the fleet status are retrieved
+        config_url = _get_config_presigned_url(cluster)
+        plugin_metadata = cluster.get_plugin_metadata()
+
+        response = DescribeClusterResponseContent(
+            creation_time=to_utc_datetime(cfn_stack.creation_time),
+            version=cfn_stack.version,
+            cluster_configuration=ClusterConfigurationStructure(url=config_url),
+            tags=[Tag(value=tag.get("Value"), key=tag.get("Key")) for tag in cfn_stack.tags],
+            cloud_formation_stack_status=cfn_stack.status,
+            cluster_name=cluster_name,
+            compute_fleet_status=fleet_status_future.result().value,
+            cloudformation_stack_arn=cfn_stack.id,
+            last_updated_time=to_utc_datetime(cfn_stack.last_updated_time),
+            region=os.environ.get("AWS_DEFAULT_REGION"),
+            cluster_status=cloud_formation_status_to_cluster_status(cfn_stack.status),
+            scheduler=Scheduler(type=cluster.stack.scheduler, metadata=plugin_metadata),
+        )
 
-    fleet_status = cluster.compute_fleet_status
+        head_node = head_node_future.result()
+        if head_node:
+            response.head_node = _head_node_to_ec2_instance(head_node)
 
-    config_url = "NOT_AVAILABLE"
-    try:
-        config_url = cluster.config_presigned_url
-    except ClusterActionError as e:
-        # Do not fail request when S3 bucket is not available
-        LOGGER.error(e)
+    return response
 
-    response = DescribeClusterResponseContent(
-        creation_time=to_utc_datetime(cfn_stack.creation_time),
-        version=cfn_stack.version,
-        cluster_configuration=ClusterConfigurationStructure(url=config_url),
-        tags=[Tag(value=tag.get("Value"), key=tag.get("Key")) for tag in cfn_stack.tags],
-        cloud_formation_stack_status=cfn_stack.status,
-        cluster_name=cluster_name,
-        compute_fleet_status=fleet_status.value,
-        cloudformation_stack_arn=cfn_stack.id,
-        last_updated_time=to_utc_datetime(cfn_stack.last_updated_time),
-        region=os.environ.get("AWS_DEFAULT_REGION"),
-        cluster_status=cloud_formation_status_to_cluster_status(cfn_stack.status),
-        scheduler=Scheduler(type=cluster.stack.scheduler, metadata=cluster.get_plugin_metadata()),
-    )
 
+def _get_head_node(cluster: Cluster):
     try:
-        head_node = cluster.head_node_instance
-        response.head_node = EC2Instance(
-            instance_id=head_node.id,
-            launch_time=to_utc_datetime(head_node.launch_time),
-            public_ip_address=head_node.public_ip,
-            instance_type=head_node.instance_type,
-            state=InstanceState.from_dict(head_node.state),
-            private_ip_address=head_node.private_ip,
-        )
+        return cluster.head_node_instance
     except ClusterActionError as e:
         # This should not be treated as a failure cause head node might not be running in some cases
         LOGGER.info(e)
+        return None
 
-    return response
+
+def _get_config_presigned_url(cluster: Cluster):
+    try:
+        return cluster.config_presigned_url
+    except ClusterActionError as e:
+        # Do not fail request when S3 bucket is not available
+        LOGGER.error(e)
+        return "NOT_AVAILABLE"
 
 
-@configure_aws_region()
+def _head_node_to_ec2_instance(head_node: ClusterInstance) -> EC2Instance:
+    return EC2Instance(
+        instance_id=head_node.id,
+        launch_time=to_utc_datetime(head_node.launch_time),
+        public_ip_address=head_node.public_ip,
+        instance_type=head_node.instance_type,
+        state=InstanceState.from_dict(head_node.state),
+        private_ip_address=head_node.private_ip,
+    )
+
+
+@configure_aws_region(allow_multi_region=True)
 @convert_errors()
-def list_clusters(region=None, next_token=None, cluster_status=None):
+def list_clusters(region=None, next_token=None, cluster_status=None, details=None):
     """
     Retrieve the list of existing clusters managed by the API. Deleted clusters are not listed by default.
 
-    :param region: List clusters deployed to a given AWS Region.
+    :param region: List clusters deployed to a given AWS Region, to a comma-separated list of regions or to 'all'
+    the enabled regions.
     :type region: str
     :param next_token: Token to use for paginated requests.
     :type next_token: str
     :param cluster_status: Filter by cluster status. (Defaults to all clusters.)
     :type cluster_status: list | bytes
+    :param details: Include the compute fleet status, the head node and the configuration URL of each cluster.
+    (Defaults to &#39;false&#39;.)
+    :type details: bool
 
     :rtype: ListClustersResponseContent
     """
-    stacks, next_token = AWSApi.instance().cfn.list_pcluster_stacks(next_token=next_token)
+    if is_multi_region(region):
+        clusters, failed_regions, next_token = list_across_regions(
+            get_regions(region),
+            next_token,
+            lambda region_name, region_next_token: _list_clusters(
+                region_next_token, cluster_status, details, region_name
+            ),
+        )
+        return ListClustersResponseContent(clusters=clusters, failed_regions=failed_regions, next_token=next_token)
+
+    clusters, next_token = _list_clusters(next_token, cluster_status, details)
+    return ListClustersResponseContent(clusters=clusters, next_token=next_token)
+
+
+def _list_clusters(next_token: str, cluster_status: List[str], details: bool, region: str = None):
+    """List the clusters in the given region, or in the region set in the environment if not specified."""
+    cfn = CfnClient(region=region) if region else AWSApi.instance().cfn
+    stacks, next_token = cfn.list_pcluster_stacks(next_token=next_token)
     stacks = [ClusterStack(stack) for stack in stacks]
 
-    clusters = []
+    clusters, cluster_stacks = [], []
     for stack in stacks:
         current_cluster_status = cloud_formation_status_to_cluster_status(stack.status)
         if not cluster_status or current_cluster_status in cluster_status:
@@ -278,14 +336,111 @@ def list_clusters(region=None, next_token=None, cluster_status=None):
                 cluster_name=stack.cluster_name,
                 cloudformation_stack_status=stack.status,
                 cloudformation_stack_arn=stack.id,
-                region=os.environ.get("AWS_DEFAULT_REGION"),
+                region=region or os.environ.get("AWS_DEFAULT_REGION"),
                 version=stack.version,
                 cluster_status=current_cluster_status,
                 scheduler=Scheduler(type=stack.scheduler),
             )
             clusters.append(cluster_info)
+            cluster_stacks.append(stack)
 
-    return ListClustersResponseContent(clusters=clusters, next_token=next_token)
+    if details and clusters:
+        _add_clusters_details(clusters, cluster_stacks, region)
+
+    return clusters, next_token
+
+
+def _add_clusters_details(clusters: List[ClusterInfoSummary], stacks: List[ClusterStack], region: str = None):
+    """
+    Add compute fleet status, head node and configuration URL to the given cluster summaries.
+
+    Rather than describing each of the clusters, the head nodes of all the clusters are retrieved with a single
+    describe_instances call and the compute fleet statuses with batched DynamoDB and Batch calls.
+    """
+    head_nodes = _describe_head_nodes(Ec2Client(region=region) if region else AWSApi.instance().ec2, stacks)
+    fleet_statuses = _get_compute_fleet_statuses(stacks, region)
+    s3_client = S3Client(region=region) if region else AWSApi.instance().s3
+
+    for cluster_info, stack in zip(clusters, stacks):
+        cluster_info.compute_fleet_status = fleet_statuses[stack.cluster_name].value
+        cluster_info.cluster_configuration = ClusterConfigurationStructure(url=_get_config_url(s3_client, stack))
+        if stack.cluster_name in head_nodes:
+            cluster_info.head_node = _head_node_to_ec2_instance(head_nodes[stack.cluster_name])
+
+
+def _describe_head_nodes(ec2: Ec2Client, stacks: List[ClusterStack]) -> Dict[str, ClusterInstance]:
+    """Return the head nodes of the clusters of the given stacks, indexed by cluster name."""
+    filters = [
+        {"Name": f"tag:{PCLUSTER_CLUSTER_NAME_TAG}", "Values": [stack.cluster_name for stack in stacks]},
+        {"Name": f"tag:{PCLUSTER_NODE_TYPE_TAG}", "Values": [NodeType.HEAD_NODE.value]},
+        {"Name": "instance-state-name", "Values": ["pending", "running", "stopping", "stopped"]},
+    ]
+    head_nodes = {}
+    try:
+        next_token = None
+        while True:
+            instances, next_token = ec2.describe_instances(filters, next_token)
+            for instance in instances:
+                head_node = ClusterInstance(instance)
+                head_nodes[head_node.cluster_name] = head_node
+            if not next_token:
+                break
+    except AWSClientError as e:
+        # Do not fail request when head nodes cannot be described, as done by DescribeCluster
+        LOGGER.error("Unable to retrieve head nodes information. %s", e)
+    return head_nodes
+
+
+def _get_compute_fleet_statuses(stacks: List[ClusterStack], region: str = None) -> Dict[str, ComputeFleetStatus]:
+    """Return the compute fleet statuses of the clusters of the given stacks, indexed by cluster name."""
+    fleet_statuses = {stack.cluster_name: ComputeFleetStatus.UNKNOWN for stack in stacks}
+    # Compute fleet status is available only when the stack is not in a transitional state
+    stacks = [stack for stack in stacks if stack.is_working_status or stack.status == "UPDATE_IN_PROGRESS"]
+
+    batch_stacks = [stack for stack in stacks if stack.scheduler == "awsbatch"]
+    if batch_stacks:
+        batch = BatchClient(region=region) if region else AWSApi.instance().batch
+        try:
+            states = batch.get_compute_environments_state([stack.batch_compute_environment for stack in batch_stacks])
+            for stack in batch_stacks:
+                if stack.batch_compute_environment in states:
+                    fleet_statuses[stack.cluster_name] = ComputeFleetStatus(states[stack.batch_compute_environment])
+        except AWSClientError as e:
+            LOGGER.warning("Unable to retrieve compute environments state. %s", e)
+
+    managed_stacks = [stack for stack in stacks if stack.scheduler != "awsbatch"]
+    if managed_stacks:
+        statuses = ComputeFleetStatusManager.get_statuses(
+            [
+                ComputeFleetStatusManager.get_manager(stack.cluster_name, stack.version, stack.scheduler)
+                for stack in managed_stacks
+            ],
+            ddb_resource=DynamoResource(region=region) if region else None,
+        )
+        fleet_statuses.update(zip([stack.cluster_name for stack in managed_stacks], statuses))
+
+    return fleet_statuses
+
+
+def _get_config_url(s3_client: S3Client, stack: ClusterStack) -> str:
+    """Return a pre-signed URL of the cluster configuration, without checking the bucket as done by DescribeCluster."""
+    if not stack.s3_bucket_name or not stack.s3_artifact_directory:
+        return "NOT_AVAILABLE"
+    bucket = S3Bucket(
+        service_name=stack.cluster_name,
+        stack_name=stack.name,
+        artifact_directory=stack.s3_artifact_directory,
+        name=stack.s3_bucket_name,
+    )
+    try:
+        return s3_client.create_presigned_url(
+            bucket.name,
+            bucket.get_object_key(S3FileType.CONFIGS, PCLUSTER_S3_ARTIFACTS_DICT.get("source_config_name")),
+            stack.original_config_version,
+        )
+    except AWSClientError as e:
+        LOGGER.error(e)
+        return "NOT_AVAILABLE"
 
 
 @convert_errors()
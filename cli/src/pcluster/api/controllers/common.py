@@ -11,10 +11,13 @@
 #  or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 #  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 #  limitations under the License.
+import base64
 import functools
+import json
 import logging
 import os
-from typing import List, Optional, Set, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
 
 import boto3
 from pkg_resources import packaging
@@ -27,22 +30,30 @@ from pcluster.api.errors import (
     NotFoundException,
     ParallelClusterApiException,
 )
+from pcluster.api.models import RegionError
 from pcluster.aws.common import BadRequestError, LimitExceededError, StackNotFoundError
+from pcluster.aws.ec2 import Ec2Client
 from pcluster.config.common import AllValidatorsSuppressor, TypeMatchValidatorsSuppressor, ValidatorSuppressor
-from pcluster.constants import SUPPORTED_REGIONS
+from pcluster.constants import MULTI_REGION_MAX_WORKERS, SUPPORTED_REGIONS
 from pcluster.models.cluster import Cluster
 from pcluster.models.common import BadRequest, Conflict, LimitExceeded, NotFound, parse_config
 from pcluster.utils import get_installed_version, to_utc_datetime
 
 LOGGER = logging.getLogger(__name__)
 
+ALL_REGIONS = "all"
 
-def _set_region(region):
+
+def _validate_region(region):
     if not region:
         raise BadRequestException("region needs to be set")
     if region not in SUPPORTED_REGIONS:
         raise BadRequestException(f"invalid or unsupported region '{region}'")
 
+
+def _set_region(region):
+    _validate_region(region)
+
     LOGGER.info("Setting AWS Region to %s", region)
     os.environ["AWS_DEFAULT_REGION"] = region
 
@@ -61,19 +72,98 @@ def configure_aws_region_from_config(region: Union[None, str], config_str: str):
     _set_region(region or config_region or boto3.Session().region_name)
 
 
-def configure_aws_region():
+def is_multi_region(region: Optional[str]) -> bool:
+    """Tell if the given region parameter targets multiple regions, i.e. it is 'all' or a comma-separated list."""
+    return bool(region) and (region == ALL_REGIONS or "," in region)
+
+
+def get_regions(region: str) -> List[str]:
+    """
+    Return the list of regions targeted by a multi-region parameter.
+
+    'all' is resolved to the supported regions of the current partition that are enabled for the account.
+    """
+    if region == ALL_REGIONS:
+        # Regions are described from the default region, hence only the ones of its partition are returned
+        enabled_regions = Ec2Client(region=boto3.Session().region_name or "us-east-1").get_enabled_regions()
+        return [supported_region for supported_region in SUPPORTED_REGIONS if supported_region in enabled_regions]
+
+    regions = list(dict.fromkeys(item.strip() for item in region.split(",") if item.strip()))
+    for item in regions:
+        _validate_region(item)
+    return regions
+
+
+def list_across_regions(
+    regions: List[str], next_token: Optional[str], list_function: Callable[[str, Optional[str]], Tuple[list, str]]
+) -> Tuple[list, Optional[List[RegionError]], Optional[str]]:
+    """
+    Call the given list function concurrently on multiple regions and merge the results.
+
+    Regions are paginated independently: the returned next token encodes the next token of every region having
+    more results and only those regions are queried again when it is passed back.
+    A region that cannot be listed is reported as a RegionError instead of failing the whole call.
+
+    :param list_function: function taking a region and a next token and returning a tuple (items, next_token)
+    :return: a tuple (items, failed_regions, next_token), with the items ordered as the given regions
+    """
+    region_tokens = _decode_multi_region_token(next_token) if next_token else dict.fromkeys(regions)
+    regions = [region for region in regions if region in region_tokens]
+
+    def _list_region(region):
+        try:
+            return list_function(region, region_tokens[region]), None
+        except Exception as e:
+            LOGGER.error("Unable to list resources in region %s: %s", region, e)
+            return None, str(e)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(MULTI_REGION_MAX_WORKERS, len(regions)))) as executor:
+        results = list(executor.map(_list_region, regions))
+
+    items, failed_regions, next_tokens = [], [], {}
+    for region, (result, error) in zip(regions, results):
+        if error is not None:
+            failed_regions.append(RegionError(region=region, message=error))
+            continue
+        region_items, region_next_token = result
+        items.extend(region_items)
+        if region_next_token:
+            next_tokens[region] = region_next_token
+
+    return items, failed_regions or None, _encode_multi_region_token(next_tokens) if next_tokens else None
+
+
+def _encode_multi_region_token(region_tokens: Dict[str, str]) -> str:
+    return base64.urlsafe_b64encode(json.dumps(region_tokens, sort_keys=True).encode("utf-8")).decode("utf-8")
+
+
+def _decode_multi_region_token(next_token: str) -> Dict[str, str]:
+    try:
+        region_tokens = json.loads(base64.urlsafe_b64decode(next_token.encode("utf-8")))
+    except Exception:
+        region_tokens = None
+    if not isinstance(region_tokens, dict) or not all(isinstance(token, str) for token in region_tokens.values()):
+        raise BadRequestException(f"invalid next token '{next_token}' for a multi-region request")
+    return region_tokens
+
+
+def configure_aws_region(allow_multi_region: bool = False):
     """
     Handle region validation and configuration for API controllers.
 
     When a controller is decorated with @configure_aws_region, the region value passed either as a query string
     argument or as a body parameter is validated and then set in the environment so that all AWS clients make use
     of it.
+
+    :param allow_multi_region: when set, a region parameter targeting multiple regions is passed through as is and
+    the controller is in charge of creating clients bound to each of the regions.
     """
 
     def _decorator_validate_region(func):
         @functools.wraps(func)
         def _wrapper_validate_region(*args, **kwargs):
-            _set_region(kwargs.get("region") or boto3.Session().region_name)
+            if not (allow_multi_region and is_multi_region(kwargs.get("region"))):
+                _set_region(kwargs.get("region") or boto3.Session().region_name)
             return func(*args, **kwargs)
 
         return _wrapper_validate_region
@@ -14,8 +14,11 @@ from pcluster.api.controllers.common import (
     configure_aws_region,
     configure_aws_region_from_config,
     convert_errors,
+    get_regions,
     get_validator_suppressors,
     http_success_status_code,
+    is_multi_region,
+    list_across_regions,
 )
 from pcluster.api.converters import (
     cloud_formation_status_to_image_status,
@@ -48,6 +51,7 @@ from pcluster.api.models.delete_image_response_content import DeleteImageRespons
 from pcluster.api.models.image_build_status import ImageBuildStatus
 from pcluster.api.util import assert_valid_node_js
 from pcluster.aws.aws_api import AWSApi
+from pcluster.aws.cfn import CfnClient
 from pcluster.aws.common import AWSClientError
 from pcluster.aws.ec2 import Ec2Client
 from pcluster.constants import SUPPORTED_ARCHITECTURES, SUPPORTED_OSES
@@ -311,7 +315,7 @@ def _image_info_to_ami_info(image):
     )
 
 
-@configure_aws_region()
+@configure_aws_region(allow_multi_region=True)
 @convert_errors()
 def list_images(image_status, region=None, next_token=None):
     """
@@ -319,18 +323,34 @@ def list_images(image_status, region=None, next_token=None):
 
     :param image_status: Filter by image status.
     :type image_status: dict | bytes
-    :param region: List images built in a given AWS Region.
+    :param region: List images built in a given AWS Region, in a comma-separated list of regions or in 'all'
+    the enabled regions.
     :type region: str
     :param next_token: Token to use for paginated requests.
     :type next_token: str
 
     :rtype: ListImagesResponseContent
     """
+    if is_multi_region(region):
+        images, failed_regions, next_token = list_across_regions(
+            get_regions(region),
+            next_token,
+            lambda region_name, region_next_token: _list_images(image_status, region_next_token, region_name),
+        )
+        return ListImagesResponseContent(images=images, failed_regions=failed_regions, next_token=next_token)
+
+    images, next_token = _list_images(image_status, next_token)
+    return ListImagesResponseContent(images=images, next_token=next_token)
+
+
+def _list_images(image_status, next_token, region=None):
+    """List the images in the given region, or in the region set in the environment if not specified."""
     if image_status == ImageStatusFilteringOption.AVAILABLE:
-        return ListImagesResponseContent(images=_get_available_images())
+        ec2 = Ec2Client(region=region) if region else AWSApi.instance().ec2
+        return _get_available_images(ec2, region), None
     else:
-        images, next_token = _get_images_in_progress(image_status, next_token)
-        return ListImagesResponseContent(images=images, next_token=next_token)
+        cfn = CfnClient(region=region) if region else AWSApi.instance().cfn
+        return _get_images_in_progress(cfn, region, image_status, next_token)
 
 
 def _handle_config_validation_error(e: ConfigValidationError) -> BuildImageBadRequestException:
@@ -342,16 +362,16 @@ def _handle_config_validation_error(e: ConfigValidationError) -> BuildImageBadRe
     )
 
 
-def _get_available_images():
-    return [_image_info_to_image_info_summary(image) for image in AWSApi.instance().ec2.get_images()]
+def _get_available_images(ec2: Ec2Client, region: str):
+    return [_image_info_to_image_info_summary(image, region) for image in ec2.get_images()]
 
 
-def _get_images_in_progress(image_status, next_token):
-    stacks, next_token = AWSApi.instance().cfn.get_imagebuilder_stacks(next_token=next_token)
-    imagebuilder_stacks = [ImageBuilderStack(stack) for stack in stacks]
+def _get_images_in_progress(cfn: CfnClient, region: str, image_status, next_token):
+    stacks, next_token = cfn.get_imagebuilder_stacks(next_token=next_token)
+    imagebuilder_stacks = [ImageBuilderStack(stack, cfn) for stack in stacks]
     cloudformation_states = _image_status_to_cloudformation_status(image_status)
     summaries = [
-        _imagebuilder_stack_to_image_info_summary(stack)
+        _imagebuilder_stack_to_image_info_summary(stack, region)
         for stack in imagebuilder_stacks
         if stack.status in cloudformation_states
     ]
@@ -373,22 +393,22 @@ def _image_status_to_cloudformation_status(image_status):
     return mapping.get(image_status, set())
 
 
-def _imagebuilder_stack_to_image_info_summary(stack):
+def _imagebuilder_stack_to_image_info_summary(stack, region=None):
     return ImageInfoSummary(
         image_id=stack.pcluster_image_id,
         image_build_status=cloud_formation_status_to_image_status(stack.status),
         cloudformation_stack_status=stack.status,
         cloudformation_stack_arn=stack.id,
-        region=os_lib.environ.get("AWS_DEFAULT_REGION"),
+        region=region or os_lib.environ.get("AWS_DEFAULT_REGION"),
         version=stack.version,
     )
 
 
-def _image_info_to_image_info_summary(image):
+def _image_info_to_image_info_summary(image, region=None):
     return ImageInfoSummary(
         image_id=image.pcluster_image_id,
         image_build_status=ImageBuildStatus.BUILD_COMPLETE,
         ec2_ami_info=Ec2AmiInfoSummary(ami_id=image.id),
-        region=os_lib.environ.get("AWS_DEFAULT_REGION"),
+        region=region or os_lib.environ.get("AWS_DEFAULT_REGION"),
         version=image.version,
     )
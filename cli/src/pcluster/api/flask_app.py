@@ -94,6 +94,7 @@ class ParallelClusterFlaskApp:
         @self.flask_app.before_request
         def _clear_cache():
             # Cache is meant to be reused only within a single request
+            LOGGER.debug("Cache statistics: %s", Cache.get_stats())
             Cache.clear_all()
             AWSApi.reset()
 
@@ -67,6 +67,7 @@ from pcluster.api.models.log_stream import LogStream
 from pcluster.api.models.metadata import Metadata
 from pcluster.api.models.node_type import NodeType
 from pcluster.api.models.not_found_exception_response_content import NotFoundExceptionResponseContent
+from pcluster.api.models.region_error import RegionError
 from pcluster.api.models.requested_compute_fleet_status import RequestedComputeFleetStatus
 from pcluster.api.models.scheduler import Scheduler
 from pcluster.api.models.stack_event import StackEvent
@@ -14,7 +14,10 @@ import re
 from pcluster.api import util
 from pcluster.api.models.base_model_ import Model
 from pcluster.api.models.cloud_formation_stack_status import CloudFormationStackStatus
+from pcluster.api.models.cluster_configuration_structure import ClusterConfigurationStructure
 from pcluster.api.models.cluster_status import ClusterStatus
+from pcluster.api.models.compute_fleet_status import ComputeFleetStatus
+from pcluster.api.models.ec2_instance import EC2Instance
 from pcluster.api.models.scheduler import Scheduler
 
 
@@ -33,6 +36,9 @@ class ClusterInfoSummary(Model):
         version=None,
         cluster_status=None,
         scheduler=None,
+        compute_fleet_status=None,
+        head_node=None,
+        cluster_configuration=None,
     ):
         """ClusterInfoSummary - a model defined in OpenAPI
 
@@ -50,6 +56,12 @@ class ClusterInfoSummary(Model):
         :type cluster_status: ClusterStatus
         :param scheduler: The scheduler of this ClusterInfoSummary.  # noqa: E501
         :type scheduler: Scheduler
+        :param compute_fleet_status: The compute_fleet_status of this ClusterInfoSummary.
+        :type compute_fleet_status: ComputeFleetStatus
+        :param head_node: The head_node of this ClusterInfoSummary.
+        :type head_node: EC2Instance
+        :param cluster_configuration: The cluster_configuration of this ClusterInfoSummary.
+        :type cluster_configuration: ClusterConfigurationStructure
         """
         self.openapi_types = {
             "cluster_name": str,
@@ -59,6 +71,9 @@ class ClusterInfoSummary(Model):
             "version": str,
             "cluster_status": ClusterStatus,
             "scheduler": Scheduler,
+            "compute_fleet_status": ComputeFleetStatus,
+            "head_node": EC2Instance,
+            "cluster_configuration": ClusterConfigurationStructure,
         }
 
         self.attribute_map = {
@@ -69,6 +84,9 @@ class ClusterInfoSummary(Model):
             "version": "version",
             "cluster_status": "clusterStatus",
             "scheduler": "scheduler",
+            "compute_fleet_status": "computeFleetStatus",
+            "head_node": "headNode",
+            "cluster_configuration": "clusterConfiguration",
         }
 
         self._cluster_name = cluster_name
@@ -78,6 +96,9 @@ class ClusterInfoSummary(Model):
         self._version = version
         self._cluster_status = cluster_status
         self._scheduler = scheduler
+        self._compute_fleet_status = compute_fleet_status
+        self._head_node = head_node
+        self._cluster_configuration = cluster_configuration
 
     @classmethod
     def from_dict(cls, dikt) -> "ClusterInfoSummary":
@@ -264,3 +285,72 @@ class ClusterInfoSummary(Model):
         """
 
         self._scheduler = scheduler
+
+    @property
+    def compute_fleet_status(self):
+        """Gets the compute_fleet_status of this ClusterInfoSummary.
+
+        Status of the compute fleet. Only returned when listing clusters with details.
+
+        :return: The compute_fleet_status of this ClusterInfoSummary.
+        :rtype: ComputeFleetStatus
+        """
+        return self._compute_fleet_status
+
+    @compute_fleet_status.setter
+    def compute_fleet_status(self, compute_fleet_status):
+        """Sets the compute_fleet_status of this ClusterInfoSummary.
+
+        Status of the compute fleet. Only returned when listing clusters with details.
+
+        :param compute_fleet_status: The compute_fleet_status of this ClusterInfoSummary.
+        :type compute_fleet_status: ComputeFleetStatus
+        """
+
+        self._compute_fleet_status = compute_fleet_status
+
+    @property
+    def head_node(self):
+        """Gets the head_node of this ClusterInfoSummary.
+
+        Head node of the cluster. Only returned when listing clusters with details.
+
+        :return: The head_node of this ClusterInfoSummary.
+        :rtype: EC2Instance
+        """
+        return self._head_node
+
+    @head_node.setter
+    def head_node(self, head_node):
+        """Sets the head_node of this ClusterInfoSummary.
+
+        Head node of the cluster. Only returned when listing clusters with details.
+
+        :param head_node: The head_node of this ClusterInfoSummary.
+        :type head_node: EC2Instance
+        """
+
+        self._head_node = head_node
+
+    @property
+    def cluster_configuration(self):
+        """Gets the cluster_configuration of this ClusterInfoSummary.
+
+        Configuration of the cluster. Only returned when listing clusters with details.
+
+        :return: The cluster_configuration of this ClusterInfoSummary.
+        :rtype: ClusterConfigurationStructure
+        """
+        return self._cluster_configuration
+
+    @cluster_configuration.setter
+    def cluster_configuration(self, cluster_configuration):
+        """Sets the cluster_configuration of this ClusterInfoSummary.
+
+        Configuration of the cluster. Only returned when listing clusters with details.
+
+        :param cluster_configuration: The cluster_configuration of this ClusterInfoSummary.
+        :type cluster_configuration: ClusterConfigurationStructure
+        """
+
+        self._cluster_configuration = cluster_configuration
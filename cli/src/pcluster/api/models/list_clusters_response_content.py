@@ -14,6 +14,7 @@ from typing import List
 from pcluster.api import util
 from pcluster.api.models.base_model_ import Model
 from pcluster.api.models.cluster_info_summary import ClusterInfoSummary
+from pcluster.api.models.region_error import RegionError
 
 
 class ListClustersResponseContent(Model):
@@ -22,19 +23,26 @@ class ListClustersResponseContent(Model):
     Do not edit the class manually.
     """
 
-    def __init__(self, next_token=None, clusters=None):
+    def __init__(self, next_token=None, failed_regions=None, clusters=None):
         """ListClustersResponseContent - a model defined in OpenAPI
 
         :param next_token: The next_token of this ListClustersResponseContent.
         :type next_token: str
+        :param failed_regions: The failed_regions of this ListClustersResponseContent.
+        :type failed_regions: List[RegionError]
         :param clusters: The clusters of this ListClustersResponseContent.
         :type clusters: List[ClusterInfoSummary]
         """
-        self.openapi_types = {"next_token": str, "clusters": List[ClusterInfoSummary]}
+        self.openapi_types = {
+            "next_token": str,
+            "failed_regions": List[RegionError],
+            "clusters": List[ClusterInfoSummary],
+        }
 
-        self.attribute_map = {"next_token": "nextToken", "clusters": "clusters"}
+        self.attribute_map = {"next_token": "nextToken", "failed_regions": "failedRegions", "clusters": "clusters"}
 
         self._next_token = next_token
+        self._failed_regions = failed_regions
         self._clusters = clusters
 
     @classmethod
@@ -71,6 +79,29 @@ class ListClustersResponseContent(Model):
 
         self._next_token = next_token
 
+    @property
+    def failed_regions(self):
+        """Gets the failed_regions of this ListClustersResponseContent.
+
+        Regions that could not be queried when listing across multiple regions.
+
+        :return: The failed_regions of this ListClustersResponseContent.
+        :rtype: List[RegionError]
+        """
+        return self._failed_regions
+
+    @failed_regions.setter
+    def failed_regions(self, failed_regions):
+        """Sets the failed_regions of this ListClustersResponseContent.
+
+        Regions that could not be queried when listing across multiple regions.
+
+        :param failed_regions: The failed_regions of this ListClustersResponseContent.
+        :type failed_regions: List[RegionError]
+        """
+
+        self._failed_regions = failed_regions
+
     @property
     def clusters(self):
         """Gets the clusters of this ListClustersResponseContent.
@@ -14,6 +14,7 @@ from typing import List
 from pcluster.api import util
 from pcluster.api.models.base_model_ import Model
 from pcluster.api.models.image_info_summary import ImageInfoSummary
+from pcluster.api.models.region_error import RegionError
 
 
 class ListImagesResponseContent(Model):
@@ -22,20 +23,27 @@ class ListImagesResponseContent(Model):
     Do not edit the class manually.
     """
 
-    def __init__(self, images=None, next_token=None):
+    def __init__(self, images=None, next_token=None, failed_regions=None):
         """ListImagesResponseContent - a model defined in OpenAPI
 
         :param images: The images of this ListImagesResponseContent.
         :type images: List[ImageInfoSummary]
         :param next_token: The next_token of this ListImagesResponseContent.
         :type next_token: str
+        :param failed_regions: The failed_regions of this ListImagesResponseContent.
+        :type failed_regions: List[RegionError]
         """
-        self.openapi_types = {"images": List[ImageInfoSummary], "next_token": str}
+        self.openapi_types = {
+            "images": List[ImageInfoSummary],
+            "next_token": str,
+            "failed_regions": List[RegionError],
+        }
 
-        self.attribute_map = {"images": "images", "next_token": "nextToken"}
+        self.attribute_map = {"images": "images", "next_token": "nextToken", "failed_regions": "failedRegions"}
 
         self._images = images
         self._next_token = next_token
+        self._failed_regions = failed_regions
 
     @classmethod
     def from_dict(cls, dikt) -> "ListImagesResponseContent":
@@ -93,3 +101,26 @@ class ListImagesResponseContent(Model):
         """
 
         self._next_token = next_token
+
+    @property
+    def failed_regions(self):
+        """Gets the failed_regions of this ListImagesResponseContent.
+
+        Regions that could not be queried when listing across multiple regions.
+
+        :return: The failed_regions of this ListImagesResponseContent.
+        :rtype: List[RegionError]
+        """
+        return self._failed_regions
+
+    @failed_regions.setter
+    def failed_regions(self, failed_regions):
+        """Sets the failed_regions of this ListImagesResponseContent.
+
+        Regions that could not be queried when listing across multiple regions.
+
+        :param failed_regions: The failed_regions of this ListImagesResponseContent.
+        :type failed_regions: List[RegionError]
+        """
+
+        self._failed_regions = failed_regions
@@ -0,0 +1,96 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at http://aws.amazon.com/apache2.0/
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=R0801
+
+
+from pcluster.api import util
+from pcluster.api.models.base_model_ import Model
+
+
+class RegionError(Model):
+    """NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+
+    Do not edit the class manually.
+    """
+
+    def __init__(self, region=None, message=None):
+        """RegionError - a model defined in OpenAPI
+
+        :param region: The region of this RegionError.
+        :type region: str
+        :param message: The message of this RegionError.
+        :type message: str
+        """
+        self.openapi_types = {"region": str, "message": str}
+
+        self.attribute_map = {"region": "region", "message": "message"}
+
+        self._region = region
+        self._message = message
+
+    @classmethod
+    def from_dict(cls, dikt) -> "RegionError":
+        """Returns the dict as a model
+
+        :param dikt: A dict.
+        :type: dict
+        :return: The RegionError of this RegionError.
+        :rtype: RegionError
+        """
+        return util.deserialize_model(dikt, cls)
+
+    @property
+    def region(self):
+        """Gets the region of this RegionError.
+
+        Region that could not be queried.
+
+        :return: The region of this RegionError.
+        :rtype: str
+        """
+        return self._region
+
+    @region.setter
+    def region(self, region):
+        """Sets the region of this RegionError.
+
+        Region that could not be queried.
+
+        :param region: The region of this RegionError.
+        :type region: str
+        """
+        if region is None:
+            raise ValueError("Invalid value for `region`, must not be `None`")
+
+        self._region = region
+
+    @property
+    def message(self):
+        """Gets the message of this RegionError.
+
+        Error message.
+
+        :return: The message of this RegionError.
+        :rtype: str
+        """
+        return self._message
+
+    @message.setter
+    def message(self, message):
+        """Sets the message of this RegionError.
+
+        Error message.
+
+        :param message: The message of this RegionError.
+        :type message: str
+        """
+        if message is None:
+            raise ValueError("Invalid value for `message`, must not be `None`")
+
+        self._message = message
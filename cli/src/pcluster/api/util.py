@@ -157,9 +157,17 @@ def _deserialize_dict(data, boxed_type):
     return {k: _deserialize(v, boxed_type) for k, v in six.iteritems(data)}
 
 
+# Node.js is validated once per process, since the executable is not expected to change while the process is running
+_node_js_validated = False  # pylint: disable=invalid-name
+
+
 def assert_valid_node_js():
+    global _node_js_validated  # pylint: disable=global-statement,invalid-name
+    if _node_js_validated:
+        return
     _assert_node_executable()
     _assert_node_version()
+    _node_js_validated = True
 
 
 def _assert_node_executable():
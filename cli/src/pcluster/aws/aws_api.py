@@ -35,6 +35,8 @@ class AWSApi:
     A singleton instance can be retrieved from everywhere in the code by calling AWSApi.instance().
     Specific API client wrappers are provided through properties of this instance; for instance AWSApi.instance().ec2
     will return the client wrapper for EC2 service.
+    The underlying boto3 clients are taken from the Boto3ClientPool, hence resetting the instance is cheap and only
+    clears the caches held by the client wrappers.
     """
 
     _instance = None
@@ -10,10 +10,12 @@
 # limitations under the License.
 import logging
 import re
+from typing import Dict, List
 
 from botocore.exceptions import ClientError, EndpointConnectionError
 
 from pcluster.aws.common import AWSExceptionHandler, Boto3Client, get_region
+from pcluster.constants import BATCH_DESCRIBE_COMPUTE_ENVIRONMENTS_MAX_ITEMS
 
 LOGGER = logging.getLogger(__name__)
 
@@ -21,8 +23,8 @@ LOGGER = logging.getLogger(__name__)
 class BatchClient(Boto3Client):
     """Batch Boto3 client."""
 
-    def __init__(self):
-        super().__init__("batch")
+    def __init__(self, region: str = None):
+        super().__init__("batch", region=region)
 
     @AWSExceptionHandler.handle_client_exception
     def enable_compute_environment(self, ce_name: str, min_vcpus: int, max_vcpus: int, desired_vcpus: int):
@@ -49,6 +51,18 @@ class BatchClient(Boto3Client):
             "state"
         ]
 
+    @AWSExceptionHandler.handle_client_exception
+    def get_compute_environments_state(self, ce_names: List[str]) -> Dict[str, str]:
+        """Get the state (ENABLED/DISABLED) of multiple compute environments, indexed by compute environment name."""
+        states = {}
+        for i in range(0, len(ce_names), BATCH_DESCRIBE_COMPUTE_ENVIRONMENTS_MAX_ITEMS):
+            for compute_environment in self._paginate_results(
+                self._client.describe_compute_environments,
+                computeEnvironments=ce_names[i : i + BATCH_DESCRIBE_COMPUTE_ENVIRONMENTS_MAX_ITEMS],  # noqa: E203
+            ):
+                states[compute_environment["computeEnvironmentName"]] = compute_environment["state"]
+        return states
+
     @AWSExceptionHandler.handle_client_exception
     def get_compute_environment_capacity(self, ce_name: str):
         """Describe compute environment and return ."""
@@ -23,8 +23,8 @@ LOGGER = logging.getLogger(__name__)
 class CfnClient(Boto3Client):
     """Implement CFN Boto3 client."""
 
-    def __init__(self):
-        super().__init__("cloudformation")
+    def __init__(self, region: str = None):
+        super().__init__("cloudformation", region=region)
 
     @AWSExceptionHandler.handle_client_exception
     def create_stack(self, stack_name: str, disable_rollback: bool, tags: list, template_body: str):
@@ -87,7 +87,6 @@ class CfnClient(Boto3Client):
         )
 
     @AWSExceptionHandler.handle_client_exception
-    @AWSExceptionHandler.retry_on_boto3_throttling
     def describe_stack(self, stack_name: str):
         """Get information for the given stack."""
         try:
@@ -99,7 +98,6 @@ class CfnClient(Boto3Client):
             raise
 
     @AWSExceptionHandler.handle_client_exception
-    @AWSExceptionHandler.retry_on_boto3_throttling
     def get_stack_events(self, stack_name, next_token=None):
         """Return the events of a stack, start from next_token if provided."""
         if next_token:
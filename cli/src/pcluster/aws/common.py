@@ -10,17 +10,32 @@
 # limitations under the License.
 
 import functools
+import hashlib
+import json
 import logging
 import os
+import pickle  # nosec
+import random
+import tempfile
 import threading
 import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
 from enum import Enum
-from typing import Dict
+from typing import Dict, List
 
 import boto3
 from botocore.config import Config
 from botocore.exceptions import BotoCoreError, ClientError, ParamValidationError
 
+from pcluster.constants import (
+    BOTO3_MAX_POOL_CONNECTIONS,
+    BOTO3_RETRY_MAX_ATTEMPTS,
+    BOTO3_RETRY_MAX_BACKOFF,
+    CACHE_MAX_SIZE,
+    PERSISTENT_CACHE_MAX_SIZE,
+)
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -33,12 +48,13 @@ class AWSClientError(Exception):
         VALIDATION_ERROR = "ValidationError"
         REQUEST_LIMIT_EXCEEDED = "RequestLimitExceeded"
         THROTTLING_EXCEPTION = "ThrottlingException"
+        THROTTLING = "Throttling"
         CONDITIONAL_CHECK_FAILED_EXCEPTION = "ConditionalCheckFailedException"
 
         @classmethod
         def throttling_error_codes(cls):
             """Return a set of error codes returned when service rate limits are exceeded."""
-            return {cls.REQUEST_LIMIT_EXCEEDED.value, cls.THROTTLING_EXCEPTION.value}
+            return {cls.REQUEST_LIMIT_EXCEEDED.value, cls.THROTTLING_EXCEPTION.value, cls.THROTTLING.value}
 
     def __init__(self, function_name: str, message: str, error_code: str = None):
         super().__init__(message)
@@ -111,39 +127,301 @@ class AWSExceptionHandler:
 
     @staticmethod
     def retry_on_boto3_throttling(func):
-        """Retry boto3 calls on throttling, can be used as a decorator."""
+        """
+        Retry boto3 calls on throttling with jittered exponential backoff, can be used as a decorator.
+
+        Clients of the Boto3ClientPool already retry throttled requests with the botocore standard retry mode,
+        so this decorator must not wrap their calls, which would multiply the attempts.
+        """
 
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
+            attempt = 0
             while True:
                 try:
                     return func(*args, **kwargs)
                 except ClientError as e:
-                    if e.response["Error"]["Code"] != "Throttling":
+                    attempt += 1
+                    if (
+                        e.response["Error"]["Code"] not in AWSClientError.ErrorCode.throttling_error_codes()
+                        or attempt >= BOTO3_RETRY_MAX_ATTEMPTS
+                    ):
                         raise
-                    LOGGER.debug("Throttling when calling %s function. Will retry in %d seconds.", func.__name__, 5)
-                    time.sleep(5)
+                    delay = random.uniform(0, min(BOTO3_RETRY_MAX_BACKOFF, 2**attempt))  # nosec
+                    LOGGER.debug(
+                        "Throttling when calling %s function. Will retry in %.2f seconds.", func.__name__, delay
+                    )
+                    time.sleep(delay)
 
         return wrapper
 
 
+class AWSCallsRecorder:
+    """
+    Recorder of the AWS calls and of the cache lookups done by the current thread.
+
+    Recording is active only within the record() block, so that the calls can be attributed to the code running
+    in the block even when multiple threads perform AWS calls at the same time. Blocks can be nested, calls are
+    counted by all the active recordings of the thread.
+    """
+
+    _local = threading.local()
+
+    @staticmethod
+    def _get_active_stats():
+        if not hasattr(AWSCallsRecorder._local, "stats"):
+            AWSCallsRecorder._local.stats = []
+        return AWSCallsRecorder._local.stats
+
+    @staticmethod
+    @contextmanager
+    def record(cache_lookups: bool = False):
+        """
+        Record the calls done by the current thread in the block, yielding the dict collecting the statistics.
+
+        :param cache_lookups: when set, the names of the cached functions looked up are collected too, in the
+        cacheLookups set of the statistics
+        """
+        stats = {"awsCalls": {}, "cacheHits": 0, "cacheMisses": 0}
+        if cache_lookups:
+            stats["cacheLookups"] = set()
+        active_stats = AWSCallsRecorder._get_active_stats()
+        active_stats.append(stats)
+        try:
+            yield stats
+        finally:
+            active_stats.remove(stats)
+
+    @staticmethod
+    def record_aws_call(service: str, operation: str):
+        """Count an AWS call, if recording is active in the current thread."""
+        call = f"{service}:{operation}"
+        for stats in AWSCallsRecorder._get_active_stats():
+            stats["awsCalls"][call] = stats["awsCalls"].get(call, 0) + 1
+
+    @staticmethod
+    def record_cache_lookup(hit: bool, function_name: str = None):
+        """Count a cache hit or miss of the given function, if recording is active in the current thread."""
+        for stats in AWSCallsRecorder._get_active_stats():
+            stats["cacheHits" if hit else "cacheMisses"] += 1
+            if function_name and "cacheLookups" in stats:
+                stats["cacheLookups"].add(function_name)
+
+
 def _log_boto3_calls(params, **kwargs):
     service = kwargs["event_name"].split(".")[-2]
     operation = kwargs["event_name"].split(".")[-1]
-    region = kwargs["context"].get("client_region", boto3.session.Session().region_name)
+    region = kwargs["context"].get("client_region") or boto3.session.Session().region_name
     LOGGER.info(
         "Executing boto3 call: region=%s, service=%s, operation=%s, params=%s", region, service, operation, params
     )
+    AWSCallsRecorder.record_aws_call(service, operation)
+
+
+class AdaptiveRateLimiter:
+    """
+    Client-side rate limiter shared by all the clients of a service, adapting to throttling errors.
+
+    The limiter is a token bucket which is disabled until the first throttling error is received.
+    From then on, the allowed request rate is reduced on every throttling error and slowly increased on every
+    successful request. Throttled requests are retried by botocore with jittered exponential backoff.
+    The time every call spent waiting on the limiter and on retries after throttling errors is logged
+    and accumulated in the statistics of the limiter.
+    """
+
+    MIN_RATE = 0.5  # requests per second
+    MAX_RATE = 1000.0
+    RATE_DECREASE_FACTOR = 0.7
+    RATE_INCREASE_STEP = 0.5
+
+    _RETRY_START_TIME = "pcluster_retry_start_time"
+    _THROTTLE_WAIT = "pcluster_throttle_wait"
+
+    _limiters = {}
+    _limiters_lock = threading.Lock()
+
+    def __init__(self, service_name: str):
+        self.service_name = service_name
+        self.throttling_errors = 0
+        self.throttled_calls = 0
+        self.throttle_wait_seconds = 0.0
+        self._rate = None  # Maximum requests per second, None when the limiter is disabled
+        self._tokens = 0.0
+        self._last_refill_time = 0.0
+        self._request_times = deque()  # Times of the requests sent in the last second
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def for_service(service_name: str):
+        """Return the limiter of the given service."""
+        with AdaptiveRateLimiter._limiters_lock:
+            if service_name not in AdaptiveRateLimiter._limiters:
+                AdaptiveRateLimiter._limiters[service_name] = AdaptiveRateLimiter(service_name)
+            return AdaptiveRateLimiter._limiters[service_name]
+
+    @staticmethod
+    def get_stats():
+        """Return a dict with the throttling statistics of every service."""
+        return {
+            service_name: {
+                "throttling_errors": limiter.throttling_errors,
+                "throttled_calls": limiter.throttled_calls,
+                "throttle_wait_seconds": round(limiter.throttle_wait_seconds, 3),
+                "rate_limit": limiter.rate,
+            }
+            for service_name, limiter in AdaptiveRateLimiter._limiters.items()
+        }
+
+    @property
+    def rate(self):
+        """Return the maximum number of requests per second allowed, None if the limiter is disabled."""
+        return self._rate
+
+    def register(self, client):
+        """Register the limiter to the events emitted by the given boto3 client."""
+        client.meta.events.register("request-created.*.*", self._on_request_created)
+        client.meta.events.register("needs-retry.*.*", self._on_needs_retry)
+        client.meta.events.register("after-call.*.*", self._on_call_completed)
+        client.meta.events.register("after-call-error.*.*", self._on_call_completed)
+
+    def acquire(self):
+        """Wait until the request can be sent according to the current rate, return the seconds slept, if any."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if self._rate is not None:
+                    self._tokens = min(max(self._rate, 1.0), self._tokens + (now - self._last_refill_time) * self._rate)
+                    self._last_refill_time = now
+                if self._rate is None or self._tokens >= 1:
+                    if self._rate is not None:
+                        self._tokens -= 1
+                    self._request_times.append(now)
+                    while self._request_times[0] < now - 1:
+                        self._request_times.popleft()
+                    return waited
+                delay = (1 - self._tokens) / self._rate
+            time.sleep(delay)
+            waited += delay
+
+    def on_throttling_error(self):
+        """Reduce the allowed request rate, enabling the limiter if needed."""
+        with self._lock:
+            self.throttling_errors += 1
+            if self._rate is None:
+                self._tokens = 0.0
+                self._last_refill_time = time.monotonic()
+                current_rate = len(self._request_times)
+            else:
+                current_rate = self._rate
+            self._rate = max(self.MIN_RATE, current_rate * self.RATE_DECREASE_FACTOR)
+
+    def on_success(self):
+        """Increase the allowed request rate, disabling the limiter when the maximum rate is reached."""
+        with self._lock:
+            if self._rate is not None:
+                self._rate += self.RATE_INCREASE_STEP
+                if self._rate >= self.MAX_RATE:
+                    self._rate = None
+
+    def _on_request_created(self, request, **kwargs):
+        context = request.context
+        retry_start_time = context.pop(self._RETRY_START_TIME, None)
+        waited = time.monotonic() - retry_start_time if retry_start_time else 0.0
+        waited += self.acquire()
+        if waited:
+            context[self._THROTTLE_WAIT] = context.get(self._THROTTLE_WAIT, 0.0) + waited
+
+    def _on_needs_retry(self, response, request_dict, **kwargs):
+        if not response:
+            return
+        error_code = response[1].get("Error", {}).get("Code")
+        if error_code in AWSClientError.ErrorCode.throttling_error_codes():
+            self.on_throttling_error()
+            # The retry delay is measured when the next attempt is created
+            request_dict["context"][self._RETRY_START_TIME] = time.monotonic()
+        elif not error_code:
+            self.on_success()
+
+    def _on_call_completed(self, context, event_name, **kwargs):
+        waited = context.get(self._THROTTLE_WAIT)
+        if waited:
+            with self._lock:
+                self.throttled_calls += 1
+                self.throttle_wait_seconds += waited
+            LOGGER.info("Boto3 call %s waited %.2f seconds on throttling", ".".join(event_name.split(".")[-2:]), waited)
+
+
+class Boto3ClientPool:
+    """
+    Process-wide pool of boto3 clients shared by all the Boto3Client wrappers.
+
+    Creating a boto3 client is expensive, since it loads the service model and builds the endpoint resolver.
+    Clients are then created once per service, region, credentials and configuration and reused across
+    AWSApi instances, API requests and regions. Boto3 clients are thread-safe, while their creation is not,
+    hence it is serialized.
+    """
+
+    _clients = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get_max_pool_connections():
+        """Return the maximum number of connections kept open by each client."""
+        return int(os.environ.get("PCLUSTER_BOTO3_MAX_POOL_CONNECTIONS", BOTO3_MAX_POOL_CONNECTIONS))
+
+    @staticmethod
+    def get_client(service_name: str, botocore_config_kwargs: Dict = None, region: str = None):
+        """
+        Return the pooled client for the given service, with the credentials in use.
+
+        :param region: region the client is bound to, defaults to the region in use.
+        """
+        with Boto3ClientPool._lock:
+            if boto3.DEFAULT_SESSION is None:
+                boto3.setup_default_session()
+            session = boto3.DEFAULT_SESSION
+            region = region or session.region_name
+            credentials = session.get_credentials()
+            key = (
+                service_name,
+                region,
+                credentials.access_key if credentials else None,
+                json.dumps(botocore_config_kwargs, sort_keys=True),
+            )
+            client = Boto3ClientPool._clients.get(key)
+            if not client:
+                config = Config(
+                    **{
+                        "max_pool_connections": Boto3ClientPool.get_max_pool_connections(),
+                        "retries": {"mode": "standard", "max_attempts": BOTO3_RETRY_MAX_ATTEMPTS},
+                        **(botocore_config_kwargs or {}),
+                    }
+                )
+                client = boto3.client(service_name, region_name=region, config=config)
+                client.meta.events.register("provide-client-params.*.*", _log_boto3_calls)
+                AdaptiveRateLimiter.for_service(service_name).register(client)
+                Boto3ClientPool._clients[key] = client
+            return client
+
+    @staticmethod
+    def clear():
+        """Remove all the clients from the pool."""
+        with Boto3ClientPool._lock:
+            Boto3ClientPool._clients.clear()
 
 
 class Boto3Client:
     """Boto3 client Class."""
 
-    def __init__(self, client_name: str, botocore_config_kwargs: Dict = None):
-        self._client = boto3.client(
-            client_name, config=Config(**botocore_config_kwargs) if botocore_config_kwargs else None
-        )
-        self._client.meta.events.register("provide-client-params.*.*", _log_boto3_calls)
+    def __init__(self, client_name: str, botocore_config_kwargs: Dict = None, region: str = None):
+        self._region = region
+        self._client = Boto3ClientPool.get_client(client_name, botocore_config_kwargs, region=region)
+
+    @property
+    def region(self):
+        """Return the region the client has been explicitly bound to, None if it uses the region in use."""
+        return self._region
 
     def _paginate_results(self, method, **kwargs):
         """
@@ -162,15 +440,306 @@ class Boto3Client:
 class Boto3Resource:
     """Boto3 resource Class."""
 
-    def __init__(self, resource_name: str):
-        self._resource = boto3.resource(resource_name)
+    def __init__(self, resource_name: str, region: str = None):
+        # Resource creation relies on the default session, which is not thread-safe
+        with Boto3ClientPool._lock:
+            self._resource = boto3.resource(resource_name, region_name=region)
         self._resource.meta.client.meta.events.register("provide-client-params.*.*", _log_boto3_calls)
 
 
+class PersistentCache:
+    """
+    File system cache storing the results of slow-changing AWS calls across CLI invocations.
+
+    The cache is opt-in and is enabled by setting the PCLUSTER_PERSISTENT_CACHE_ENABLED environment variable to true.
+    Entries are stored one per file under a directory specific to region, account and ParallelCluster version,
+    each with its own expiration time. Since entries are unpickled, they are only read from and written to directories
+    owned by the current user and not accessible by other users.
+    The size of the entries is computed once per process and then tracked at each write. When the size limit is
+    exceeded, the oldest accessed entries are evicted until the size is below a fraction of the limit, so that the
+    cache directory is not scanned at every write.
+    Entries can be stored in a named partition, a separate directory with its own size limit, so that big entries
+    (f.i. the indexed log events) do not evict the others.
+    """
+
+    max_size = PERSISTENT_CACHE_MAX_SIZE
+    # Directory under the cache root containing the partitions, excluded from the default partition
+    _PARTITIONS_DIR = "partitions"
+    # Fraction of max_size the size of the entries is reduced to by an eviction
+    _EVICTION_TARGET = 0.8
+    # Size of the entries of each cache directory, tracked since the first write of the process
+    _sizes = {}
+    _sizes_lock = threading.Lock()
+
+    @staticmethod
+    def is_enabled():
+        """Tell if the persistent cache is enabled."""
+        return Cache.is_enabled() and os.environ.get("PCLUSTER_PERSISTENT_CACHE_ENABLED", "false").lower() == "true"
+
+    @staticmethod
+    def get_cache_dir(create: bool = False):
+        """Return the root directory of the persistent cache, creating it accessible only by the user if requested."""
+        from pcluster.utils import get_cache_dir  # pylint: disable=import-outside-toplevel
+
+        return get_cache_dir(create=create)
+
+    @staticmethod
+    def _get_partition_dir(partition: str = None):
+        """Return the directory storing the entries of the given partition, the cache root for the default one."""
+        if not partition:
+            return os.path.abspath(PersistentCache.get_cache_dir())
+        return os.path.join(
+            os.path.abspath(PersistentCache.get_cache_dir()), PersistentCache._PARTITIONS_DIR, partition
+        )
+
+    @staticmethod
+    def _get_namespace_dir(region: str = None, partition: str = None):
+        """Return the directory storing the entries for the given region (or the current one), account and version."""
+        from pcluster.aws.aws_api import AWSApi  # pylint: disable=import-outside-toplevel
+        from pcluster.utils import get_installed_version  # pylint: disable=import-outside-toplevel
+
+        namespace = f"{region or get_region()}-{AWSApi.instance().sts.get_account_id()}-{get_installed_version()}"
+        return os.path.join(PersistentCache._get_partition_dir(partition), namespace)
+
+    @staticmethod
+    def _get_entry_path(function, args, kwargs, partition: str = None):
+        # Client wrappers are not part of the key because region and account are already part of the namespace
+        key_args = [arg for arg in args if not isinstance(arg, (Boto3Client, Boto3Resource))]
+        key = json.dumps([key_args, kwargs], sort_keys=True, default=repr)
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        # Clients bound to an explicit region store their entries in the namespace of that region
+        region = next((arg.region for arg in args if isinstance(arg, Boto3Client) and arg.region), None)
+        return os.path.join(
+            PersistentCache._get_namespace_dir(region, partition), f"{function.__qualname__}-{digest}.pickle"
+        )
+
+    @staticmethod
+    def _check_directories(entry_path: str, create: bool = False):
+        """
+        Check that every directory from the cache root to the entry is owned by the current user with mode 0700.
+
+        Other users able to write to any of them could replace the entries, which are unpickled when read.
+        """
+        cache_dir = os.path.abspath(PersistentCache.get_cache_dir(create=create))
+        relative_dir = os.path.relpath(os.path.dirname(os.path.abspath(entry_path)), cache_dir)
+        directories = [cache_dir]
+        if relative_dir != os.curdir:
+            for name in relative_dir.split(os.sep):
+                directories.append(os.path.join(directories[-1], name))
+        for directory in directories:
+            if create and not os.path.isdir(directory):
+                os.makedirs(directory, mode=0o700, exist_ok=True)
+            if hasattr(os, "getuid"):
+                directory_stat = os.stat(directory)
+                if directory_stat.st_uid != os.getuid() or directory_stat.st_mode & 0o077:
+                    raise PermissionError(
+                        f"Directory {directory} must be owned by the current user and accessible only by them (0700)"
+                    )
+
+    @staticmethod
+    def get(function, args, kwargs, partition: str = None):
+        """Return a tuple (found, value) with the not expired entry stored for the given function call."""
+        try:
+            entry_path = PersistentCache._get_entry_path(function, args, kwargs, partition)
+            if not os.path.isfile(entry_path):
+                return False, None
+            PersistentCache._check_directories(entry_path)
+            with open(entry_path, "rb") as entry_file:
+                entry = pickle.load(entry_file)  # nosec nosemgrep
+            if entry["expiration_time"] <= time.time():
+                entry_size = os.path.getsize(entry_path)
+                os.remove(entry_path)
+                PersistentCache._track_size(-entry_size, compute=False, partition=partition)
+                return False, None
+            # Update the modification time to keep track of the last access for the eviction policy
+            os.utime(entry_path)
+            return True, entry["value"]
+        except FileNotFoundError:
+            return False, None
+        except PermissionError as e:
+            LOGGER.warning("Unable to read persistent cache entry for %s: %s", function.__qualname__, e)
+            return False, None
+        except Exception as e:
+            LOGGER.debug("Unable to read persistent cache entry for %s: %s", function.__qualname__, e)
+            return False, None
+
+    @staticmethod
+    def put(function, args, kwargs, value, ttl: int, partition: str = None, max_size: int = None):
+        """
+        Store the value returned by the given function call, with the given time to live in seconds.
+
+        :param partition: name of the partition storing the entry, the default one if not set
+        :param max_size: size limit of the partition, max_size if not set
+        """
+        try:
+            entry_path = PersistentCache._get_entry_path(function, args, kwargs, partition)
+            PersistentCache._check_directories(entry_path, create=True)
+            # Write to a temporary file and rename it, so that concurrent readers never see a partial entry
+            file_descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(entry_path), suffix=".tmp")
+            try:
+                with os.fdopen(file_descriptor, "wb") as temp_file:
+                    pickle.dump({"expiration_time": time.time() + ttl, "value": value}, temp_file)
+                entry_size = os.path.getsize(temp_path)
+                replaced_size = os.path.getsize(entry_path) if os.path.isfile(entry_path) else 0
+                os.replace(temp_path, entry_path)
+            except Exception:
+                os.remove(temp_path)
+                raise
+            PersistentCache._track_size(entry_size - replaced_size, partition=partition, max_size=max_size)
+        except PermissionError as e:
+            LOGGER.warning("Unable to write persistent cache entry for %s: %s", function.__qualname__, e)
+        except Exception as e:
+            LOGGER.debug("Unable to write persistent cache entry for %s: %s", function.__qualname__, e)
+
+    @staticmethod
+    def _track_size(delta: int, compute: bool = True, partition: str = None, max_size: int = None):
+        """
+        Update the size of the entries of the partition by the given number of bytes, evicting entries if it exceeds
+        its size limit.
+
+        The size is computed by scanning the partition directory only the first time, when compute is set.
+        """
+        cache_dir = PersistentCache._get_partition_dir(partition)
+        max_size = max_size or PersistentCache.max_size
+        with PersistentCache._sizes_lock:
+            size = PersistentCache._sizes.get(cache_dir)
+            if size is None:
+                if not compute:
+                    return
+                # The entry just written is already part of the scanned entries
+                size = sum(entry_size for _, entry_size, _ in PersistentCache._list_entries(cache_dir))
+            else:
+                size += delta
+            if size > max_size:
+                size = PersistentCache._evict(cache_dir, max_size)
+            PersistentCache._sizes[cache_dir] = size
+
+    @staticmethod
+    def _list_entries(cache_dir: str):
+        """Return a list of tuples (access time, size, path) of the entries in the given cache directory."""
+        entries = []
+        for dir_path, dir_names, file_names in os.walk(cache_dir):
+            if dir_path == cache_dir and PersistentCache._PARTITIONS_DIR in dir_names:
+                # Partitions are tracked separately
+                dir_names.remove(PersistentCache._PARTITIONS_DIR)
+            for file_name in file_names:
+                if file_name.endswith(".pickle"):
+                    try:
+                        entry_stat = os.stat(os.path.join(dir_path, file_name))
+                    except FileNotFoundError:
+                        continue
+                    entries.append((entry_stat.st_mtime, entry_stat.st_size, os.path.join(dir_path, file_name)))
+        return entries
+
+    @staticmethod
+    def _evict(cache_dir: str, max_size: int):
+        """Remove the least recently accessed entries until their size is below the eviction target, return it."""
+        entries = PersistentCache._list_entries(cache_dir)
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry_path in sorted(entries):
+            if total_size <= max_size * PersistentCache._EVICTION_TARGET:
+                break
+            try:
+                os.remove(entry_path)
+                total_size -= size
+            except FileNotFoundError:
+                total_size -= size
+        return total_size
+
+
+class LRUCache:
+    """
+    Thread-safe in-memory cache with a least recently used eviction policy and optional entries expiration.
+
+    Hits, misses and evictions are counted, so that the effectiveness of the cache can be measured.
+    """
+
+    def __init__(self, name: str, max_size: int = CACHE_MAX_SIZE, ttl: int = None):
+        """
+        Initialize the cache.
+
+        :param name: name of the cache, used to report its statistics
+        :param max_size: maximum number of entries, least recently used ones are evicted when the limit is reached
+        :param ttl: time to live of the entries in seconds, entries never expire if not set
+        """
+        self.name = name
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return a tuple (found, value) with the not expired value stored for the given key."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expiration_time = entry
+                if expiration_time is None or expiration_time > time.time():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+                del self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def put(self, key, value):
+        """Store the value for the given key, evicting the least recently used entries if needed."""
+        with self._lock:
+            self._entries[key] = (value, time.time() + self.ttl if self.ttl else None)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Remove all the entries, statistics are preserved."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        """Return a dict with the usage statistics of the cache."""
+        return {"size": len(self), "hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+
+class _KeyLocks:
+    """Locks serializing the operations on the same key, each lock is released when no thread is using it."""
+
+    def __init__(self):
+        self._locks = {}  # Key -> (lock, number of threads using it)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def acquire(self, key):
+        """Acquire the lock for the given key."""
+        with self._lock:
+            key_lock, users = self._locks.get(key, (None, 0))
+            key_lock = key_lock or threading.Lock()
+            self._locks[key] = (key_lock, users + 1)
+        try:
+            with key_lock:
+                yield
+        finally:
+            with self._lock:
+                _, users = self._locks[key]
+                if users == 1:
+                    del self._locks[key]
+                else:
+                    self._locks[key] = (key_lock, users - 1)
+
+    def __len__(self):
+        return len(self._locks)
+
+
 class Cache:
     """Simple utility class providing a cache mechanism for expensive functions."""
 
-    _caches = []
+    _caches: List[LRUCache] = []
 
     @staticmethod
     def is_enabled():
@@ -183,47 +752,120 @@ class Cache:
         for cache in Cache._caches:
             cache.clear()
 
+    @staticmethod
+    def get_stats():
+        """Return a dict with the usage statistics of every cache, keyed by name of the cached function."""
+        return {cache.name: cache.stats() for cache in Cache._caches}
+
     @staticmethod
     def _make_key(val):
+        """
+        Return a hashable key representing the given value.
+
+        Containers are converted to tuples tagged with their type, so that different arguments never share a key.
+        """
         if isinstance(val, list):
-            key = hash(tuple(Cache._make_key(x) for x in val))
+            key = ("list", tuple(Cache._make_key(x) for x in val))
         elif isinstance(val, tuple):
-            key = hash(val)
+            key = ("tuple", tuple(Cache._make_key(x) for x in val))
         elif isinstance(val, dict):
-            key = hash(tuple((key, Cache._make_key(val[key])) for key in sorted(val.keys())))
+            key = ("dict", tuple((key, Cache._make_key(val[key])) for key in sorted(val.keys())))
+        elif isinstance(val, (set, frozenset)):
+            key = ("set", frozenset(Cache._make_key(x) for x in val))
         else:
-            key = hash(val)
+            hash(val)  # Fail early for unhashable values
+            key = val
         return key
 
     @staticmethod
-    def cached(function):
+    def cached(  # noqa: C901
+        function=None,
+        persistent_ttl: int = None,
+        ttl: int = None,
+        max_size: int = CACHE_MAX_SIZE,
+        persistent_partition: str = None,
+        persistent_max_size: int = None,
+    ):
         """
         Decorate a function to make it use a results cache based on passed arguments.
 
         Note: for threaded invocations, only a single instance for a given set of arguments
         will execute at a given time.
+        The decorated function exposes a store(return_value, *args, **kwargs) attribute that can be used
+        to populate the cache with results retrieved in bulk, and an is_cached(*args, **kwargs) attribute
+        telling if a result is available in the cache.
+
+        :param persistent_ttl: when set, the function results are safe to be stored in the PersistentCache
+        and are valid for the given number of seconds.
+        :param ttl: time to live in seconds of the results stored in memory, results never expire if not set.
+        :param max_size: maximum number of results stored in memory.
+        :param persistent_partition: name of the PersistentCache partition storing the results, with its own size limit
+        of persistent_max_size bytes.
         """
-        cache = {}
-        mutexes = {}
-        lock = threading.Lock()
+        if function is None:
+            return functools.partial(
+                Cache.cached,
+                persistent_ttl=persistent_ttl,
+                ttl=ttl,
+                max_size=max_size,
+                persistent_partition=persistent_partition,
+                persistent_max_size=persistent_max_size,
+            )
+
+        cache = LRUCache(function.__qualname__, max_size=max_size, ttl=ttl)
+        call_locks = _KeyLocks()
         Cache._caches.append(cache)
 
+        def load(cache_key, args, kwargs):
+            """Return a tuple (found, value) looking for the result first in memory and then in the file system."""
+            found, return_value = cache.get(cache_key)
+            if not found and persistent_ttl and PersistentCache.is_enabled():
+                found, return_value = PersistentCache.get(function, args, kwargs, persistent_partition)
+                if found:
+                    cache.put(cache_key, return_value)
+            return found, return_value
+
+        def save(cache_key, args, kwargs, return_value):
+            """Store the result in memory and, if enabled, in the file system."""
+            cache.put(cache_key, return_value)
+            if persistent_ttl and PersistentCache.is_enabled():
+                PersistentCache.put(
+                    function,
+                    args,
+                    kwargs,
+                    return_value,
+                    persistent_ttl,
+                    partition=persistent_partition,
+                    max_size=persistent_max_size,
+                )
+
         @functools.wraps(function)
         def wrapper(*args, **kwargs):
-            cache_key = Cache._make_key(args) + Cache._make_key(kwargs)
-            with lock:
-                if cache_key not in mutexes:
-                    mutexes[cache_key] = threading.Lock()
-
-            with mutexes[cache_key]:
-                if Cache.is_enabled() and cache_key in cache:
-                    return_value = cache[cache_key]
-                else:
+            if not Cache.is_enabled():
+                return function(*args, **kwargs)
+
+            cache_key = (Cache._make_key(args), Cache._make_key(kwargs))
+            with call_locks.acquire(cache_key):
+                found, return_value = load(cache_key, args, kwargs)
+                AWSCallsRecorder.record_cache_lookup(found, function.__qualname__)
+                if not found:
                     return_value = function(*args, **kwargs)
-                if Cache.is_enabled():
-                    cache[cache_key] = return_value
+                    save(cache_key, args, kwargs, return_value)
                 return return_value
 
+        def store(return_value, *args, **kwargs):
+            """Store a result computed elsewhere, so that a later call with the same arguments hits the cache."""
+            if Cache.is_enabled():
+                save((Cache._make_key(args), Cache._make_key(kwargs)), args, kwargs, return_value)
+
+        def is_cached(*args, **kwargs):
+            """Tell if a result for the given arguments is available, loading it in memory if persisted."""
+            return Cache.is_enabled() and load((Cache._make_key(args), Cache._make_key(kwargs)), args, kwargs)[0]
+
+        wrapper.store = store
+        wrapper.is_cached = is_cached
+        wrapper.cache = cache
+        wrapper.call_locks = call_locks
         return wrapper
 
 
@@ -8,20 +8,92 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+import logging
+import random
+import time
+from typing import Dict, List
+
+from botocore.exceptions import ClientError
+
 from pcluster.aws.common import AWSExceptionHandler, Boto3Resource
+from pcluster.constants import (
+    DYNAMODB_BATCH_GET_ITEM_BASE_BACKOFF,
+    DYNAMODB_BATCH_GET_ITEM_MAX_ATTEMPTS,
+    DYNAMODB_BATCH_GET_ITEM_MAX_BACKOFF,
+    DYNAMODB_BATCH_GET_ITEM_MAX_KEYS,
+)
+
+LOGGER = logging.getLogger(__name__)
 
 
 class DynamoResource(Boto3Resource):
     """DynamoDB Boto3 resource."""
 
-    def __init__(self):
-        super().__init__("dynamodb")
+    def __init__(self, region: str = None):
+        super().__init__("dynamodb", region=region)
 
     @AWSExceptionHandler.handle_client_exception
     def get_item(self, table_name, key):
         """Get item from a DynamoDB table."""
         return self._resource.Table(table_name).get_item(ConsistentRead=True, Key=key)
 
+    @AWSExceptionHandler.handle_client_exception
+    def batch_get_items(self, keys_by_table: Dict[str, List[dict]]) -> Dict[str, List[dict]]:
+        """
+        Get items from multiple DynamoDB tables with BatchGetItem calls.
+
+        Keys left unprocessed because of throughput limits are requested again with jittered exponential backoff,
+        and read one by one when the attempts are exhausted. When a table is missing or not accessible, the whole
+        BatchGetItem call fails, hence its items are read one by one, table by table, and the tables that cannot be
+        read are left out of the result.
+
+        :param keys_by_table: keys of the items to retrieve, indexed by table name
+        :return: the retrieved items, indexed by table name
+        """
+        requests = [(table_name, key) for table_name, keys in keys_by_table.items() for key in keys]
+        items = {}
+        for i in range(0, len(requests), DYNAMODB_BATCH_GET_ITEM_MAX_KEYS):
+            request_items = {}
+            for table_name, key in requests[i : i + DYNAMODB_BATCH_GET_ITEM_MAX_KEYS]:  # noqa: E203
+                request_items.setdefault(table_name, {"Keys": [], "ConsistentRead": True})["Keys"].append(key)
+            attempt = 0
+            while request_items:
+                if attempt >= DYNAMODB_BATCH_GET_ITEM_MAX_ATTEMPTS:
+                    LOGGER.debug("Unable to retrieve all the items with BatchGetItem, reading them one by one")
+                    self._get_items_by_table(request_items, items)
+                    break
+                try:
+                    response = self._resource.batch_get_item(RequestItems=request_items)
+                except ClientError as e:
+                    if e.response["Error"]["Code"] not in ("ResourceNotFoundException", "AccessDeniedException"):
+                        raise
+                    LOGGER.debug("Unable to retrieve the items with BatchGetItem, reading them one by one: %s", e)
+                    self._get_items_by_table(request_items, items)
+                    break
+                for table_name, table_items in response.get("Responses", {}).items():
+                    items.setdefault(table_name, []).extend(table_items)
+                # Keys not processed because of throughput limits must be requested again
+                request_items = response.get("UnprocessedKeys")
+                attempt += 1
+                if request_items and attempt < DYNAMODB_BATCH_GET_ITEM_MAX_ATTEMPTS:
+                    delay = random.uniform(  # nosec
+                        0, min(DYNAMODB_BATCH_GET_ITEM_MAX_BACKOFF, DYNAMODB_BATCH_GET_ITEM_BASE_BACKOFF * 2**attempt)
+                    )
+                    LOGGER.debug("Unprocessed keys from BatchGetItem call. Will retry in %.2f seconds.", delay)
+                    time.sleep(delay)
+        return items
+
+    def _get_items_by_table(self, request_items: Dict[str, dict], items: Dict[str, List[dict]]):
+        """Get the given BatchGetItem request items one by one, skipping the tables that cannot be read."""
+        for table_name, table_request in request_items.items():
+            try:
+                for key in table_request["Keys"]:
+                    item = self._resource.Table(table_name).get_item(ConsistentRead=True, Key=key).get("Item")
+                    if item:
+                        items.setdefault(table_name, []).append(item)
+            except ClientError as e:
+                LOGGER.warning("Unable to retrieve the items of DynamoDB table %s: %s", table_name, e)
+
     @AWSExceptionHandler.handle_client_exception
     def put_item(self, table_name, item, condition_expression=None):
         """Put item into a DynamoDB table."""
@@ -17,14 +17,26 @@ from botocore.exceptions import ClientError
 
 from pcluster import utils
 from pcluster.aws.aws_resources import ImageInfo, InstanceTypeInfo
-from pcluster.aws.common import AWSClientError, AWSExceptionHandler, Boto3Client, Cache, ImageNotFoundError, get_region
+from pcluster.aws.common import (
+    AWSCallsRecorder,
+    AWSClientError,
+    AWSExceptionHandler,
+    Boto3Client,
+    Cache,
+    ImageNotFoundError,
+    get_region,
+)
 from pcluster.constants import (
+    DESCRIBE_INSTANCE_TYPES_MAX_ITEMS,
     IMAGE_NAME_PART_TO_OS_MAP,
     IMAGEBUILDER_ARN_TAG,
     IMAGEBUILDER_RESOURCE_NAME_PREFIX,
     OS_TO_IMAGE_NAME_PART_MAP,
     PCLUSTER_IMAGE_BUILD_STATUS_TAG,
     PCLUSTER_IMAGE_ID_TAG,
+    PERSISTENT_CACHE_AZ_OFFERINGS_TTL,
+    PERSISTENT_CACHE_INSTANCE_TYPES_TTL,
+    PERSISTENT_CACHE_OFFICIAL_IMAGES_TTL,
 )
 from pcluster.utils import get_partition
 
@@ -32,8 +44,8 @@ from pcluster.utils import get_partition
 class Ec2Client(Boto3Client):
     """Implement EC2 Boto3 client."""
 
-    def __init__(self):
-        super().__init__("ec2")
+    def __init__(self, region: str = None):
+        super().__init__("ec2", region=region)
         self.additional_instance_types_data = {}
         self.security_groups_cache = {}
         self.subnets_cache = {}
@@ -56,7 +68,7 @@ class Ec2Client(Boto3Client):
         return list(self._paginate_results(self._client.describe_instance_type_offerings, **kwargs))
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(persistent_ttl=PERSISTENT_CACHE_INSTANCE_TYPES_TTL)
     def get_default_instance_type(self):
         """If current region support free tier, return the free tier instance type. Otherwise, return t3.micro."""
         kwargs = {
@@ -75,6 +87,7 @@ class Ec2Client(Boto3Client):
         missed_subnets = []
         for subnet_id in subnet_ids:
             cached_data = self.subnets_cache.get(subnet_id)
+            AWSCallsRecorder.record_cache_lookup(bool(cached_data), self.describe_subnets.__qualname__)
             if cached_data:
                 result.append(cached_data)
             else:
@@ -93,6 +106,7 @@ class Ec2Client(Boto3Client):
         missed_capacity_reservations = []
         for capacity_reservation_id in capacity_reservation_ids:
             cached_data = self.capacity_reservations_cache.get(capacity_reservation_id)
+            AWSCallsRecorder.record_cache_lookup(bool(cached_data), self.describe_capacity_reservations.__qualname__)
             if cached_data:
                 result.append(cached_data)
             else:
@@ -136,7 +150,7 @@ class Ec2Client(Boto3Client):
     @Cache.cached
     def get_subnet_cidr(self, subnet_id):
         """Return cidr block  of the given subnet."""
-        subnets = self._client.describe_subnets(SubnetIds=[subnet_id]).get("Subnets")
+        subnets = self.describe_subnets([subnet_id])
         if subnets:
             return subnets[0].get("CidrBlock")
         raise AWSClientError(function_name="describe_subnets", message=f"Subnet {subnet_id} not found")
@@ -150,6 +164,21 @@ class Ec2Client(Boto3Client):
             return ImageInfo(result.get("Images")[0])
         raise AWSClientError(function_name="describe_images", message=f"Image {ami_id} not found")
 
+    @AWSExceptionHandler.handle_client_exception
+    def prefetch_images_info(self, ami_ids: List[str]):
+        """
+        Cache the results of EC2's DescribeImages API for all the given images.
+
+        Images are described with a single request and the results are stored in the describe_image cache,
+        so that following lookups do not perform any boto3 call.
+        """
+        ami_ids_to_describe = [
+            ami_id for ami_id in dict.fromkeys(ami_ids) if not self.describe_image.is_cached(self, ami_id)
+        ]
+        if ami_ids_to_describe:
+            for image in self._client.describe_images(ImageIds=ami_ids_to_describe).get("Images", []):
+                self.describe_image.store(ImageInfo(image), self, image.get("ImageId"))
+
     @AWSExceptionHandler.handle_client_exception
     @Cache.cached
     def describe_images(self, ami_ids, filters, owners):
@@ -238,6 +267,12 @@ class Ec2Client(Boto3Client):
         except ImageNotFoundError:
             return []
 
+    @AWSExceptionHandler.handle_client_exception
+    @Cache.cached
+    def get_enabled_regions(self):
+        """Return the names of the regions enabled for the account, in the partition of the client region."""
+        return [region.get("RegionName") for region in self._client.describe_regions().get("Regions", [])]
+
     @AWSExceptionHandler.handle_client_exception
     def describe_key_pair(self, key_name):
         """Return the given key, if exists."""
@@ -269,15 +304,43 @@ class Ec2Client(Boto3Client):
             .get("Value")
         )
 
-    @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
     def get_instance_type_info(self, instance_type):
         """Return the results of calling EC2's DescribeInstanceTypes API for the given instance type."""
+        additional_instance_type_data = self.additional_instance_types_data.get(instance_type)
+        if additional_instance_type_data:
+            return InstanceTypeInfo(additional_instance_type_data)
+        return self._describe_instance_type(instance_type)
+
+    @AWSExceptionHandler.handle_client_exception
+    @Cache.cached(persistent_ttl=PERSISTENT_CACHE_INSTANCE_TYPES_TTL)
+    def _describe_instance_type(self, instance_type):
         return InstanceTypeInfo(
-            self.additional_instance_types_data.get(instance_type)
-            or self._client.describe_instance_types(InstanceTypes=[instance_type]).get("InstanceTypes")[0]
+            self._client.describe_instance_types(InstanceTypes=[instance_type]).get("InstanceTypes")[0]
         )
 
+    @AWSExceptionHandler.handle_client_exception
+    def prefetch_instance_types_info(self, instance_types: List[str]):
+        """
+        Cache the results of EC2's DescribeInstanceTypes API for all the given instance types.
+
+        Instance types are described in chunks of DESCRIBE_INSTANCE_TYPES_MAX_ITEMS per request and the results are
+        stored in the get_instance_type_info cache, so that following lookups do not perform any boto3 call.
+        """
+        instance_types_to_describe = [
+            instance_type
+            for instance_type in dict.fromkeys(instance_types)
+            if instance_type not in self.additional_instance_types_data
+            and not self._describe_instance_type.is_cached(self, instance_type)
+        ]
+        for i in range(0, len(instance_types_to_describe), DESCRIBE_INSTANCE_TYPES_MAX_ITEMS):
+            for instance_type_data in self._paginate_results(
+                self._client.describe_instance_types,
+                InstanceTypes=instance_types_to_describe[i : i + DESCRIBE_INSTANCE_TYPES_MAX_ITEMS],  # noqa: E203
+            ):
+                self._describe_instance_type.store(
+                    InstanceTypeInfo(instance_type_data), self, instance_type_data.get("InstanceType")
+                )
+
     @AWSExceptionHandler.handle_client_exception
     @Cache.cached
     def get_supported_architectures(self, instance_type):
@@ -307,7 +370,7 @@ class Ec2Client(Boto3Client):
         return self._find_valid_official_image(images).get("ImageId")
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(persistent_ttl=PERSISTENT_CACHE_OFFICIAL_IMAGES_TTL)
     def get_official_images(self, os=None, architecture=None):
         """Get the list of official images, optionally filtered by os and architecture."""
         owners = ["amazon"]
@@ -370,7 +433,7 @@ class Ec2Client(Boto3Client):
         return instances, response.get("NextToken")
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(persistent_ttl=PERSISTENT_CACHE_AZ_OFFERINGS_TTL)
     def get_supported_az_for_instance_type(self, instance_type: str):
         """
         Return a tuple of availability zones that have the instance_type.
@@ -453,6 +516,7 @@ class Ec2Client(Boto3Client):
         missed_security_group_ids = []
         for security_group_id in security_group_ids:
             cached_data = self.security_groups_cache.get(security_group_id)
+            AWSCallsRecorder.record_cache_lookup(bool(cached_data), self.describe_security_groups.__qualname__)
             if cached_data:
                 result.append(cached_data)
             else:
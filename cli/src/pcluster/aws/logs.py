@@ -11,7 +11,12 @@
 import datetime
 import json
 
-from pcluster.aws.common import AWSClientError, AWSExceptionHandler, Boto3Client
+from pcluster.aws.common import AWSClientError, AWSExceptionHandler, Boto3Client, Cache
+from pcluster.constants import (
+    PERSISTENT_CACHE_LOG_EVENTS_TTL,
+    PERSISTENT_CACHE_LOG_INDEX_MAX_SIZE,
+    PERSISTENT_CACHE_LOG_INDEX_PARTITION,
+)
 from pcluster.utils import datetime_to_epoch
 
 
@@ -59,6 +64,58 @@ class LogsClient(Boto3Client):
             kwargs["logStreamNamePrefix"] = log_stream_name_prefix
         return self._client.filter_log_events(**kwargs).get("events")
 
+    @AWSExceptionHandler.handle_client_exception
+    def get_filtered_log_events(
+        self,
+        log_group_name,
+        log_stream_names=None,
+        log_stream_name_prefix=None,
+        start_time=None,
+        end_time=None,
+        filter_pattern=None,
+    ):
+        """Return all the events of the given log streams included in a specific time window."""
+        kwargs = {"logGroupName": log_group_name}
+        if log_stream_names:
+            kwargs["logStreamNames"] = log_stream_names
+        if log_stream_name_prefix:
+            kwargs["logStreamNamePrefix"] = log_stream_name_prefix
+        if start_time:
+            kwargs["startTime"] = start_time
+        if end_time:
+            kwargs["endTime"] = end_time
+        if filter_pattern:
+            kwargs["filterPattern"] = filter_pattern
+        events = []
+        while True:
+            # The paginator is not used since it would mix the searched log streams with the events
+            response = self._client.filter_log_events(**kwargs)
+            events.extend(response.get("events", []))
+            if not response.get("nextToken"):
+                return events
+            kwargs["nextToken"] = response["nextToken"]
+
+    @AWSExceptionHandler.handle_client_exception
+    @Cache.cached(
+        persistent_ttl=PERSISTENT_CACHE_LOG_EVENTS_TTL,
+        persistent_partition=PERSISTENT_CACHE_LOG_INDEX_PARTITION,
+        persistent_max_size=PERSISTENT_CACHE_LOG_INDEX_MAX_SIZE,
+    )
+    def get_indexed_log_events(self, log_group_name, filter_pattern, log_stream_name_prefix, start_time, end_time):
+        """
+        Return all the events matching the filter pattern in a specific time window, indexing the results.
+
+        Only time windows whose events are all ingested must be requested, since the results are stored in the
+        log index partition of the PersistentCache, when enabled, and never requested again until they expire.
+        """
+        return self.get_filtered_log_events(
+            log_group_name,
+            log_stream_name_prefix=log_stream_name_prefix,
+            start_time=start_time,
+            end_time=end_time,
+            filter_pattern=filter_pattern,
+        )
+
     @AWSExceptionHandler.handle_client_exception
     def get_log_events(
         self,
@@ -121,6 +178,14 @@ class LogsClient(Boto3Client):
             )
         return tasks[0].get("status").get("code")
 
+    @AWSExceptionHandler.handle_client_exception
+    def get_log_streams(self, log_group_name, log_stream_name_prefix=None):
+        """Return all the log streams in the given log group, filtered by the given prefix."""
+        kwargs = {"logGroupName": log_group_name}
+        if log_stream_name_prefix:
+            kwargs["logStreamNamePrefix"] = log_stream_name_prefix
+        return list(self._paginate_results(self._client.describe_log_streams, **kwargs))
+
     @AWSExceptionHandler.handle_client_exception
     def describe_log_streams(self, log_group_name, log_stream_name_prefix=None, next_token=None):
         """Return a list of log streams in the given log group, filtered by the given prefix."""
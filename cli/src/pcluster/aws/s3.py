@@ -16,8 +16,8 @@ from pcluster.aws.common import AWSClientError, AWSExceptionHandler, Boto3Client
 class S3Client(Boto3Client):
     """S3 Boto3 client."""
 
-    def __init__(self):
-        super().__init__("s3", botocore_config_kwargs={"s3": {"addressing_style": "virtual"}})
+    def __init__(self, region: str = None):
+        super().__init__("s3", botocore_config_kwargs={"s3": {"addressing_style": "virtual"}}, region=region)
 
     @AWSExceptionHandler.handle_client_exception
     def download_file(self, bucket_name, object_name, file_name):
@@ -55,6 +55,30 @@ class S3Client(Boto3Client):
         """Upload object content to s3."""
         return self._client.put_object(Bucket=bucket_name, Body=body, Key=key)
 
+    @AWSExceptionHandler.handle_client_exception
+    def create_multipart_upload(self, bucket_name, key):
+        """Start a multipart upload of an object to s3 and return the upload ID."""
+        return self._client.create_multipart_upload(Bucket=bucket_name, Key=key).get("UploadId")
+
+    @AWSExceptionHandler.handle_client_exception
+    def upload_part(self, bucket_name, key, upload_id, part_number, body):
+        """Upload a part of a multipart upload and return its ETag."""
+        return self._client.upload_part(
+            Bucket=bucket_name, Key=key, UploadId=upload_id, PartNumber=part_number, Body=body
+        ).get("ETag")
+
+    @AWSExceptionHandler.handle_client_exception
+    def complete_multipart_upload(self, bucket_name, key, upload_id, parts):
+        """Complete a multipart upload by assembling the given parts, a list of {"ETag": ..., "PartNumber": ...}."""
+        return self._client.complete_multipart_upload(
+            Bucket=bucket_name, Key=key, UploadId=upload_id, MultipartUpload={"Parts": parts}
+        )
+
+    @AWSExceptionHandler.handle_client_exception
+    def abort_multipart_upload(self, bucket_name, key, upload_id):
+        """Abort a multipart upload, deleting the parts already uploaded."""
+        return self._client.abort_multipart_upload(Bucket=bucket_name, Key=key, UploadId=upload_id)
+
     @AWSExceptionHandler.handle_client_exception
     def get_object(self, bucket_name, key, version_id=None, expected_bucket_owner=None):
         """Get object content from s3."""
@@ -8,15 +8,17 @@
 # pylint: disable=import-outside-toplevel
 
 import logging
+import os
 import re
+from functools import partial
 from typing import List
 
 import argparse
 from argparse import ArgumentParser, Namespace
 
 from pcluster import utils
-from pcluster.cli.commands.common import CliCommand, ExportLogsCommand
-from pcluster.models.cluster import Cluster
+from pcluster.cli.commands.common import CliCommand, ExportLogsCommand, Iso8601Arg, to_positive_int
+from pcluster.utils import to_iso_timestr, to_utc_datetime
 
 LOGGER = logging.getLogger(__name__)
 
@@ -49,6 +51,16 @@ class ExportClusterLogsCommand(ExportLogsCommand, CliCommand):
             "<cluster_name>-logs-<current time in the format of yyyyMMddHHmm>",
         )
         super()._register_common_command_args(parser)
+        parser.add_argument(
+            "--checkpoint-file",
+            type=os.path.realpath,
+            help=(
+                "Checkpoint file of incremental exports. When provided, only the log events after the last complete "
+                "export are exported, and an interrupted export is resumed without starting a new export task. "
+                "The log events of the last 10 minutes, which could still be ingested, are left to the next export. "
+                "The filters must be the same as in the previous exports. The file is created if it does not exist."
+            ),
+        )
         # Filters
         filters_arg = _FiltersArg(accepted_filters=["private-dns-name", "node-type"])
         parser.add_argument(
@@ -74,6 +86,8 @@ class ExportClusterLogsCommand(ExportLogsCommand, CliCommand):
     @staticmethod
     def _export_cluster_logs(args: Namespace, output_file: str = None):
         """Export the logs associated to the cluster."""
+        from pcluster.models.cluster import Cluster
+
         LOGGER.debug("Beginning export of logs for the cluster: %s", args.cluster_name)
         cluster = Cluster(args.cluster_name)
         url = cluster.export_logs(
@@ -84,11 +98,148 @@ class ExportClusterLogsCommand(ExportLogsCommand, CliCommand):
             end_time=args.end_time,
             filters=args.filters,
             output_file=output_file,
+            checkpoint_file=args.checkpoint_file,
         )
         LOGGER.debug("Cluster's logs exported correctly to %s", url)
         return {"path": output_file} if output_file is not None else {"url": url}
 
 
+class SearchClusterLogsCommand(CliCommand):
+    """Implement pcluster search-cluster-logs command."""
+
+    # CLI
+    name = "search-cluster-logs"
+    help = "Search the log events of the cluster matching a CloudWatch Logs filter pattern."
+    description = (
+        f"{help} When the PCLUSTER_PERSISTENT_CACHE_ENABLED environment variable is set to true, the results of the "
+        "time windows whose log events are all ingested are indexed locally, and repeated searches over the same "
+        "time window do not query CloudWatch Logs again."
+    )
+
+    def __init__(self, subparsers):
+        super().__init__(subparsers, name=self.name, help=self.help, description=self.description)
+
+    def register_command_args(self, parser: ArgumentParser) -> None:  # noqa: D102
+        parser.add_argument(
+            "-n", "--cluster-name", help="Search the logs of the cluster name provided here.", required=True
+        )
+        parser.add_argument(
+            "--filter-pattern",
+            required=True,
+            help="CloudWatch Logs filter pattern the log events must match (e.g. ERROR or '\"Node failure\"').",
+        )
+        parser.add_argument(
+            "--start-time",
+            type=Iso8601Arg(),
+            help=(
+                "Start time of interval of interest for log events. ISO 8601 format: YYYY-MM-DDThh:mm:ssZ "
+                "(e.g. 1984-09-15T19:20:30Z), time elements might be omitted. Defaults to creation time"
+            ),
+        )
+        parser.add_argument(
+            "--end-time",
+            type=Iso8601Arg(),
+            help=(
+                "End time of interval of interest for log events. ISO 8601 format: YYYY-MM-DDThh:mm:ssZ "
+                "(e.g. 1984-09-15T19:20:30Z), time elements might be omitted. Defaults to current time"
+            ),
+        )
+        parser.add_argument(
+            "--limit",
+            type=partial(to_positive_int, "limit"),
+            help="The maximum number of log events returned, starting from the earliest ones.",
+        )
+        # Filters
+        filters_arg = _FiltersArg(accepted_filters=["private-dns-name", "node-type"])
+        parser.add_argument(
+            "--filters",
+            nargs="+",
+            type=filters_arg,
+            help=(
+                "Filter the logs. Format: 'Name=a,Values=1 Name=b,Values=2,3'.\nAccepted filters are:\n"
+                "private-dns-name - The short form of the private DNS name of the instance (e.g. ip-10-0-0-101).\n"
+                "node-type - The node type, the only accepted value for this filter is HeadNode."
+            ),
+        )
+
+    def execute(self, args: Namespace, extra_args: List[str]) -> None:  # noqa: D102 #pylint: disable=unused-argument
+        from pcluster.models.cluster import Cluster
+
+        try:
+            cluster = Cluster(args.cluster_name)
+            events = cluster.search_log_events(
+                filter_pattern=args.filter_pattern,
+                start_time=args.start_time,
+                end_time=args.end_time,
+                filters=args.filters,
+                limit=args.limit,
+            )
+            return {
+                "events": [
+                    {
+                        "timestamp": to_iso_timestr(to_utc_datetime(event["timestamp"])),
+                        "logStreamName": event["logStreamName"],
+                        "message": event["message"],
+                    }
+                    for event in events
+                ]
+            }
+        except Exception as e:
+            utils.error(f"Unable to search cluster's logs.\n{e}")
+            return None
+
+
+class TailClusterLogsCommand(CliCommand):
+    """Implement pcluster tail-cluster-logs command."""
+
+    # CLI
+    name = "tail-cluster-logs"
+    help = "Follow the log events of the cluster, merging the events of the selected log streams by timestamp."
+    description = help
+
+    def __init__(self, subparsers):
+        super().__init__(subparsers, name=self.name, help=self.help, description=self.description)
+
+    def register_command_args(self, parser: ArgumentParser) -> None:  # noqa: D102
+        parser.add_argument(
+            "-n", "--cluster-name", help="Follow the logs of the cluster name provided here.", required=True
+        )
+        parser.add_argument(
+            "--start-time",
+            type=Iso8601Arg(),
+            help=(
+                "Start time of interval of interest for log events. ISO 8601 format: YYYY-MM-DDThh:mm:ssZ "
+                "(e.g. 1984-09-15T19:20:30Z), time elements might be omitted. Defaults to current time"
+            ),
+        )
+        # Filters
+        filters_arg = _FiltersArg(accepted_filters=["private-dns-name", "node-type", "queue-name"])
+        parser.add_argument(
+            "--filters",
+            nargs="+",
+            type=filters_arg,
+            help=(
+                "Filter the logs. Format: 'Name=a,Values=1 Name=b,Values=2,3'.\nAccepted filters are:\n"
+                "private-dns-name - The short form of the private DNS name of the instance (e.g. ip-10-0-0-101).\n"
+                "node-type - The node type, the only accepted value for this filter is HeadNode.\n"
+                "queue-name - The name of the queue of the compute nodes."
+            ),
+        )
+
+    def execute(self, args: Namespace, extra_args: List[str]) -> None:  # noqa: D102 #pylint: disable=unused-argument
+        from pcluster.models.cluster import Cluster
+
+        try:
+            cluster = Cluster(args.cluster_name)
+            for event in cluster.follow_log_events(filters=args.filters, start_time=args.start_time):
+                event_time = to_iso_timestr(to_utc_datetime(event["timestamp"]))
+                print(f"{event_time} {event['logStreamName']} {event['message'].rstrip()}", flush=True)
+        except KeyboardInterrupt:
+            LOGGER.debug("Stopped following the logs of the cluster: %s", args.cluster_name)
+        except Exception as e:
+            utils.error(f"Unable to follow cluster's logs.\n{e}")
+
+
 class _FiltersArg:
     """Class to implement regex parsing for filters parameter."""
 
@@ -13,7 +13,11 @@
 
 # flake8: noqa
 
-from pcluster.cli.commands.cluster_logs import ExportClusterLogsCommand
+from pcluster.cli.commands.cluster_logs import (
+    ExportClusterLogsCommand,
+    SearchClusterLogsCommand,
+    TailClusterLogsCommand,
+)
 from pcluster.cli.commands.configure.command import ConfigureCommand
 from pcluster.cli.commands.dcv_connect import DcvConnectCommand
 from pcluster.cli.commands.image_logs import ExportImageLogsCommand
@@ -50,6 +50,14 @@ def to_int(param, in_str):
         return exit_msg(f"Bad Request: Wrong type, expected 'int' for parameter '{param}'")
 
 
+def to_positive_int(param, in_str):
+    """Take a string and convert it into a positive int."""
+    value = to_int(param, in_str)
+    if value < 1:
+        return exit_msg(f"Bad Request: '{param}' must be a positive integer.")
+    return value
+
+
 class CliCommand(ABC):
     """Abstract class for a CLI command."""
 
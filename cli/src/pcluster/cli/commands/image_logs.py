@@ -14,7 +14,6 @@ from argparse import ArgumentParser, Namespace
 
 from pcluster import utils
 from pcluster.cli.commands.common import CliCommand, ExportLogsCommand
-from pcluster.models.imagebuilder import ImageBuilder
 
 LOGGER = logging.getLogger(__name__)
 
@@ -62,6 +61,8 @@ class ExportImageLogsCommand(ExportLogsCommand, CliCommand):
     @staticmethod
     def _export_image_logs(args: Namespace, output_file: str = None):
         """Export the logs associated to the image."""
+        from pcluster.models.imagebuilder import ImageBuilder
+
         LOGGER.debug("Beginning export of logs for the image: %s", args.image_id)
 
         # retrieve imagebuilder config and generate model
@@ -26,7 +26,6 @@ from argparse import ArgumentParser, Namespace
 
 from pcluster import utils
 from pcluster.cli.commands.common import CliCommand, to_bool
-from pcluster.models.cluster import Cluster
 
 LOGGER = logging.getLogger(__name__)
 
@@ -44,6 +43,8 @@ def _ssh(args, extra_args):
     except ImportError:
         from pipes import quote as cmd_quote
 
+    from pcluster.models.cluster import Cluster
+
     try:
         head_node = Cluster(args.cluster_name).head_node_instance
     except Exception as e:
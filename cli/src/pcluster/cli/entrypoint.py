@@ -23,16 +23,11 @@ from functools import partial
 import argparse
 from botocore.exceptions import NoCredentialsError  # TODO: remove
 
-# Controllers
-import pcluster.api.controllers.cluster_compute_fleet_controller
-import pcluster.api.controllers.cluster_instances_controller
-import pcluster.api.controllers.cluster_operations_controller
-import pcluster.api.controllers.image_operations_controller
-import pcluster.api.errors
+# Controllers are not imported here, since they pull in most of the dependencies and slow down the CLI startup.
+# They are imported only when an API operation is invoked, through pcluster.cli.model.get_function_from_name.
 import pcluster.cli.commands.commands as cli_commands
 import pcluster.cli.logger as pcluster_logging
 import pcluster.cli.model
-from pcluster.api import encoder
 from pcluster.cli.commands.common import CliCommand, exit_msg, to_bool, to_int, to_number
 from pcluster.cli.exceptions import APIOperationException, ParameterException
 from pcluster.cli.logger import redirect_stdouterr_to_logger
@@ -177,29 +172,42 @@ def add_cli_commands(parser_map):
     add_additional_args(parser_map)
 
 
+def _add_validation_profile(output):
+    """Add the profiling report of the config validation, produced when debug logging is enabled, to the output."""
+    from pcluster.validators.common import ValidationProfiler  # pylint: disable=import-outside-toplevel
+
+    report = ValidationProfiler.pop_last_report()
+    if report and isinstance(output, dict):
+        output["validationProfile"] = report
+    return output
+
+
 def _run_operation(model, args, extra_args):
     if args.operation in model:
         try:
             with redirect_stdouterr_to_logger():
-                return args.func(args)
+                return _add_validation_profile(args.func(args))
         except KeyboardInterrupt as e:
             raise e
         except APIOperationException as e:
+            _add_validation_profile(e.data)
             raise e
         except ParameterException as e:
             raise e
         except Exception as e:
+            import pcluster.api.errors  # pylint: disable=import-outside-toplevel
+            from pcluster.api import encoder  # pylint: disable=import-outside-toplevel
+
             # format exception messages in the same manner as the api
             message = pcluster.api.errors.exception_message(e)
             error_encoded = encoder.JSONEncoder().encode(message)
-            raise APIOperationException(json.loads(error_encoded))
+            raise APIOperationException(_add_validation_profile(json.loads(error_encoded)))
     else:
         return args.func(args, extra_args)
 
 
 def run(sys_args, model=None):
-    spec = pcluster.cli.model.package_spec()
-    model = model or pcluster.cli.model.load_model(spec)
+    model = model or pcluster.cli.model.get_model()
     parser, parser_map = gen_parser(model)
     add_cli_commands(parser_map)
     args, extra_args = parser.parse_known_args(sys_args)
@@ -220,8 +228,12 @@ def run(sys_args, model=None):
 
     # TODO: remove this logic from here
     # set region in the environment to make it available to all the boto3 calls
+    # multi-region operations create clients bound to each of the regions instead
     if "region" in args and args.region:
-        os.environ["AWS_DEFAULT_REGION"] = args.region
+        from pcluster.api.controllers.common import is_multi_region  # pylint: disable=import-outside-toplevel
+
+        if not is_multi_region(args.region):
+            os.environ["AWS_DEFAULT_REGION"] = args.region
 
     LOGGER.info("Handling CLI command %s", args.operation)
     LOGGER.info("Parsed CLI arguments: args(%s), extra_args(%s)", args, extra_args)
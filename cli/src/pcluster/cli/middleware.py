@@ -22,15 +22,50 @@ provided.
 import logging
 
 import argparse
-import boto3
 import jmespath
-from botocore.exceptions import WaiterError
 
 import pcluster.cli.model
 from pcluster.cli.exceptions import APIOperationException, ParameterException
+from pcluster.utils import poll
 
 LOGGER = logging.getLogger(__name__)
 
+# Maximum time to wait for a cluster operation, same as the CloudFormation waiters
+STACK_WAIT_TIMEOUT = 3600
+
+
+def _wait_for_stack(stack_name, expected_status):
+    """
+    Wait for the stack to exit the in progress statuses and return whether it reached the expected status.
+
+    The stack is polled with an exponential backoff, rather than with the fixed 30 seconds interval of the waiters.
+    """
+    from pcluster.aws.aws_api import AWSApi  # pylint: disable=import-outside-toplevel
+    from pcluster.aws.common import AWSClientError, StackNotFoundError  # pylint: disable=import-outside-toplevel
+
+    def _get_stack_status():
+        try:
+            return AWSApi.instance().cfn.describe_stack(stack_name).get("StackStatus")
+        except StackNotFoundError:
+            return "DELETE_COMPLETE"
+
+    try:
+        status = poll(
+            _get_stack_status,
+            until=lambda stack_status: not stack_status.endswith("_IN_PROGRESS"),
+            timeout=STACK_WAIT_TIMEOUT,
+            initial_interval=5,
+            max_interval=30,
+        )
+    except (AWSClientError, TimeoutError) as e:
+        LOGGER.error("Failed when waiting for stack %s with error: %s", stack_name, e)
+        return False
+
+    if status != expected_status:
+        LOGGER.error("Stack %s reached status %s instead of %s", stack_name, status, expected_status)
+        return False
+    return True
+
 
 def _cluster_status(cluster_name):
     controller = "cluster_operations_controller"
@@ -76,12 +111,7 @@ def update_cluster(func, _body, kwargs):
     wait = kwargs.pop("wait", False)
     ret = func(**kwargs)
     if wait and not kwargs.get("dryrun"):
-        cloud_formation = boto3.client("cloudformation")
-        waiter = cloud_formation.get_waiter("stack_update_complete")
-        try:
-            waiter.wait(StackName=kwargs["cluster_name"])
-        except WaiterError as e:
-            LOGGER.error("Failed when waiting for cluster update with error: %s", e)
+        if not _wait_for_stack(kwargs["cluster_name"], "UPDATE_COMPLETE"):
             raise APIOperationException(_cluster_status(kwargs["cluster_name"]))
         ret = _cluster_status(kwargs["cluster_name"])
     return ret
@@ -92,12 +122,7 @@ def create_cluster(func, body, kwargs):
     wait = kwargs.pop("wait", False)
     ret = func(**kwargs)
     if wait and not kwargs.get("dryrun"):
-        cloud_formation = boto3.client("cloudformation")
-        waiter = cloud_formation.get_waiter("stack_create_complete")
-        try:
-            waiter.wait(StackName=body["clusterName"])
-        except WaiterError as e:
-            LOGGER.error("Failed when waiting for cluster creation with error: %s", e)
+        if not _wait_for_stack(body["clusterName"], "CREATE_COMPLETE"):
             raise APIOperationException(_cluster_status(body["clusterName"]))
         ret = _cluster_status(body["clusterName"])
     return ret
@@ -108,12 +133,7 @@ def delete_cluster(func, _body, kwargs):
     wait = kwargs.pop("wait", False)
     ret = func(**kwargs)
     if wait:
-        cloud_formation = boto3.client("cloudformation")
-        waiter = cloud_formation.get_waiter("stack_delete_complete")
-        try:
-            waiter.wait(StackName=kwargs["cluster_name"])
-        except WaiterError as e:
-            LOGGER.error("Failed when waiting for cluster deletion with error: %s", e)
+        if not _wait_for_stack(kwargs["cluster_name"], "DELETE_COMPLETE"):
             raise APIOperationException({"message": f"Failed when deleting cluster '{kwargs['cluster_name']}'."})
         return {"message": f"Successfully deleted cluster '{kwargs['cluster_name']}'."}
     else:
@@ -11,14 +11,19 @@
 # implied. See the License for the specific language governing permissions and
 # limitations under the License.
 import functools
+import glob
+import hashlib
 import importlib
 import json
+import logging
+import os
+import tempfile
 
 import jmespath
 
-from pcluster.api import encoder, openapi
+from pcluster.api import openapi
 from pcluster.cli.exceptions import APIOperationException
-from pcluster.utils import to_kebab_case, to_snake_case, yaml_load
+from pcluster.utils import get_cache_dir, to_kebab_case, to_snake_case, yaml_load
 
 # For importing package resources
 try:
@@ -26,6 +31,10 @@ try:
 except ImportError:
     import importlib_resources as pkg_resources
 
+LOGGER = logging.getLogger(__name__)
+
+CLI_MODEL_CACHE_FILE_PREFIX = "cli-model-"
+
 
 def _param_overrides(operation, param):
     """Provide updates to the model that are specific to the CLI."""
@@ -92,6 +101,47 @@ def package_spec():
         return yaml_load(spec_file.read())
 
 
+def get_model():
+    """
+    Return the model of the OpenAPI specification packaged with the CLI.
+
+    Parsing the specification is the slowest step of the CLI startup, hence the model is compiled on first run and
+    stored as JSON in the cache directory. The compiled model is keyed by the hash of both the specification and of
+    this module, so that it is compiled again whenever any of them changes.
+    """
+    with pkg_resources.open_binary(openapi, "openapi.yaml") as spec_file:
+        spec_content = spec_file.read()
+    with open(__file__, "rb") as module_file:
+        model_hash = hashlib.sha256(spec_content + module_file.read()).hexdigest()
+    model_path = os.path.join(get_cache_dir(), f"{CLI_MODEL_CACHE_FILE_PREFIX}{model_hash}.json")
+
+    try:
+        with open(model_path, encoding="utf-8") as model_file:
+            return json.load(model_file)
+    except (OSError, ValueError):
+        LOGGER.debug("Compiled CLI model not found in %s", model_path)
+
+    model = load_model(yaml_load(spec_content.decode("utf-8")))
+    _store_model(model, model_path)
+    return model
+
+
+def _store_model(model, model_path):
+    """Store the compiled model, replacing the ones compiled from previous specifications."""
+    try:
+        # The cache directory is shared with the persistent cache, which requires it to be accessible only by the user
+        cache_dir = get_cache_dir(create=True)
+        for stale_model_path in glob.glob(os.path.join(cache_dir, f"{CLI_MODEL_CACHE_FILE_PREFIX}*.json")):
+            os.remove(stale_model_path)
+        # Write to a temporary file first, not to expose a partially written model to concurrent invocations
+        with tempfile.NamedTemporaryFile("w", dir=cache_dir, delete=False, encoding="utf-8") as model_file:
+            json.dump(model, model_file)
+        os.replace(model_file.name, model_path)
+    except OSError as e:
+        # The compiled model is an optimization, the CLI works even if it cannot be stored
+        LOGGER.debug("Unable to store compiled CLI model in %s: %s", model_path, e)
+
+
 def load_model(spec):
     """Read the openapi specification and convert it into a model.
 
@@ -205,6 +255,8 @@ def call(func_str, *args, **kwargs):
     tuple (instead of an object). Also uses the flask json-ifier to ensure data
     is converted the same as the API.
     """
+    from pcluster.api import encoder  # pylint: disable=import-outside-toplevel
+
     query = kwargs.pop("query", None)
     func = get_function_from_name(func_str)
     ret = func(*args, **kwargs)
@@ -19,6 +19,7 @@ from enum import Enum
 from typing import Dict, List, Union
 
 import pkg_resources
+from pkg_resources import packaging
 
 from pcluster.aws.aws_api import AWSApi
 from pcluster.aws.aws_resources import InstanceTypeInfo
@@ -2564,8 +2565,8 @@ class SchedulerPluginDefinition(Resource):
         self._register_validator(
             PluginInterfaceVersionValidator,
             plugin_version=self.plugin_interface_version,
-            support_version_low_range=SCHEDULER_PLUGIN_INTERFACE_VERSION_LOW_RANGE,
-            support_version_high_range=SCHEDULER_PLUGIN_INTERFACE_VERSION,
+            support_version_low_range=packaging.version.Version(SCHEDULER_PLUGIN_INTERFACE_VERSION_LOW_RANGE),
+            support_version_high_range=packaging.version.Version(SCHEDULER_PLUGIN_INTERFACE_VERSION),
         )
 
 
@@ -2725,6 +2726,19 @@ class CommonSchedulerClusterConfig(BaseClusterConfig):
                         subnet_id_az_mapping=queue.networking.subnet_id_az_mapping,
                     )
 
+    def _cache_instance_types_info(self):
+        """Describe all the instance types used in the configuration together to reduce number of boto3 calls."""
+        instance_types = [self.head_node.instance_type]
+        for queue in self.scheduling.queues:
+            for compute_resource in queue.compute_resources:
+                instance_types.extend(compute_resource.instance_types)
+        # Since this cache is only used to speed up the following lookups, if AWSClientError happens
+        # (e.g. an invalid instance type in the config), we catch the exception and let the validators report it.
+        try:
+            AWSApi.instance().ec2.prefetch_instance_types_info(instance_types)
+        except AWSClientError:
+            logging.warning("Unable to cache describe_instance_types results for all instance types.")
+
     @property
     def _capacity_reservation_targets(self):
         """Return a list of capacity reservation targets from all queues and compute resources with the section."""
@@ -2783,6 +2797,7 @@ class SchedulerPluginClusterConfig(CommonSchedulerClusterConfig):
             AWSApi.instance().ec2.describe_capacity_reservations(self.all_relevant_capacity_reservation_ids)
         except AWSClientError:
             logging.warning("Unable to cache describe_capacity_reservations results for all capacity reservation ids.")
+        self._cache_instance_types_info()
 
     def get_instance_types_data(self):
         """Get instance type infos for all instance types used in the configuration file."""
@@ -2847,6 +2862,7 @@ class SlurmClusterConfig(CommonSchedulerClusterConfig):
             AWSApi.instance().ec2.describe_capacity_reservations(self.all_relevant_capacity_reservation_ids)
         except AWSClientError:
             logging.warning("Unable to cache describe_capacity_reservations results for all capacity reservation ids.")
+        self._cache_instance_types_info()
 
     def get_instance_types_data(self):
         """Get instance type infos for all instance types used in the configuration file."""
@@ -15,9 +15,21 @@
 import json
 import logging
 from abc import ABC, abstractmethod
-from typing import List, Set
-
-from pcluster.validators.common import FailureLevel, ValidationResult, Validator, ValidatorContext
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable, List, Set
+
+from pcluster.aws.aws_api import AWSApi
+from pcluster.aws.common import AWSCallsRecorder
+from pcluster.constants import VALIDATORS_MAX_WORKERS
+from pcluster.validators.common import (
+    AWSResourceType,
+    FailureLevel,
+    ValidationProfiler,
+    ValidationResult,
+    ValidationResultsCache,
+    Validator,
+    ValidatorContext,
+)
 from pcluster.validators.iam_validators import AdditionalIamPolicyValidator
 from pcluster.validators.networking_validators import LambdaFunctionsVpcConfigValidator
 from pcluster.validators.s3_validators import UrlValidator
@@ -25,6 +37,25 @@ from pcluster.validators.s3_validators import UrlValidator
 LOGGER = logging.getLogger(__name__)
 
 
+def _prefetch_aws_resources(resource_type: AWSResourceType, resource_ids: List[str]):
+    """Describe all the given AWS resources with batched calls, storing the results in the AWS clients caches."""
+    ec2 = AWSApi.instance().ec2
+    prefetch_function = {
+        AWSResourceType.SUBNET: ec2.describe_subnets,
+        AWSResourceType.SECURITY_GROUP: ec2.describe_security_groups,
+        AWSResourceType.INSTANCE_TYPE: ec2.prefetch_instance_types_info,
+        AWSResourceType.IMAGE: ec2.prefetch_images_info,
+        AWSResourceType.CAPACITY_RESERVATION: ec2.describe_capacity_reservations,
+    }[resource_type]
+    LOGGER.debug("Prefetching %s resources: %s", resource_type, resource_ids)
+    try:
+        prefetch_function(resource_ids)
+    except Exception as e:
+        # The prefetch is only used to speed up validation, if it fails (e.g. because of an invalid id in the config)
+        # validators describe the resources on their own and report the errors
+        LOGGER.debug("Unable to prefetch %s resources: %s", resource_type, e)
+
+
 class ValidatorSuppressor(ABC):
     """Interface for a class that encapsulates the logic to suppress config validators."""
 
@@ -168,16 +199,28 @@ class Resource:
         """Create a resource attribute backed by a Configuration Parameter."""
         return Resource.Param(value, default=default, update_policy=update_policy)
 
-    def _validator_execute(self, validator_class, validator_args, suppressors):
+    def _validator_execute(
+        self, validator_class, validator_args, cache_key, suppressors, results_cache: ValidationResultsCache = None
+    ):
         validator = validator_class()
         if any(suppressor.suppress_validator(validator) for suppressor in (suppressors or [])):
             LOGGER.debug("Suppressing validator %s", validator_class.__name__)
             return []
+        if results_cache:
+            cache_key = results_cache.add_aws_facts(cache_key, validator, validator_args)
+            found, failures = results_cache.get(cache_key)
+            if found:
+                LOGGER.debug("Using cached results of validator %s", validator_class.__name__)
+                return failures
         LOGGER.debug("Executing validator %s", validator_class.__name__)
         try:
-            return validator.execute(**validator_args)
+            with AWSCallsRecorder.record(cache_lookups=True) as stats:
+                failures = validator.execute(**validator_args)
         except Exception as e:
             return [ValidationResult(str(e), FailureLevel.ERROR, validator.type)]
+        if results_cache:
+            results_cache.put(cache_key, validator_class, failures, stats)
+        return failures
 
     def _nested_resources(self):
         nested_resources = []
@@ -189,23 +232,87 @@ class Resource:
         return nested_resources
 
     def validate(
-        self, suppressors: List[ValidatorSuppressor] = None, context: ValidatorContext = None
+        self,
+        suppressors: List[ValidatorSuppressor] = None,
+        context: ValidatorContext = None,
+        validators_filter: Callable[["Resource", type, dict], bool] = None,
     ) -> List[ValidationResult]:
-        """Execute registered validators."""
-        # Cleanup failures and validators
-        self._validation_failures.clear()
+        """
+        Execute registered validators of the resource and of its nested resources.
+
+        Validators are collected from the whole resource tree first and then executed concurrently, since most of them
+        are bound by AWS calls. Before executing the validators, the AWS resources they require are described in bulk,
+        so that validators find them in the AWS clients caches.
+        Failures are returned in the order validators are registered, nested resources first.
+        When debug logging is enabled, the execution is profiled and a report is written to the log.
+        When the persistent cache is enabled, the results of validators executed with the same arguments and the same
+        AWS resources descriptions in a recent validation are reused, see ValidationResultsCache.
+
+        :param validators_filter: optional function receiving the registering resource, the validator class and its
+        arguments, returning False for the validators that must not be executed (f.i. see ConfigPatch)
+        """
+        profiler = ValidationProfiler()
+        results_cache = ValidationResultsCache()
+        # Cache keys are computed before executing validators, which could change the resources lazy attributes
+        validators = [
+            (validator_class, validator_args, results_cache.get_key(validator_class, validator_args))
+            for validator_class, validator_args in self._collect_validators(context, validators_filter)
+        ]
+        with ThreadPoolExecutor(max_workers=VALIDATORS_MAX_WORKERS) as executor:
+            # Descriptions of the AWS resources are part of the results cache keys too, hence they are always needed
+            required_resources = self._get_required_aws_resources(
+                [(validator_class, validator_args) for validator_class, validator_args, _ in validators], suppressors
+            )
+            prefetch_futures = [
+                executor.submit(
+                    profiler.run, str(resource_type), _prefetch_aws_resources, resource_type, sorted(resource_ids)
+                )
+                for resource_type, resource_ids in required_resources.items()
+                if resource_ids
+            ]
+            wait(prefetch_futures)
+            # map returns results in the order of the validators, regardless of their completion order
+            results = list(
+                executor.map(
+                    lambda validator: profiler.run(
+                        validator[0].__name__, self._validator_execute, *validator, suppressors, results_cache
+                    ),
+                    validators,
+                )
+            )
+        self._validation_failures = [failure for failures, _ in results for failure in failures]
+
+        if profiler.enabled:
+            profiler.report([future.result()[1] for future in prefetch_futures], [record for _, record in results])
+        return self._validation_failures
 
-        # Call validators for nested resources
+    @staticmethod
+    def _get_required_aws_resources(validators, suppressors):
+        """Return the ids of the AWS resources required by the validators that are not suppressed, grouped by type."""
+        required_resources = {}
+        for validator_class, validator_args in validators:
+            validator = validator_class()
+            if any(suppressor.suppress_validator(validator) for suppressor in (suppressors or [])):
+                continue
+            for resource_type, resource_ids in validator.get_required_aws_resources(**validator_args).items():
+                required_resources.setdefault(resource_type, set()).update(resource_ids)
+        return required_resources
+
+    def _collect_validators(self, context: ValidatorContext = None, validators_filter=None):
+        """Return the validators registered by the resource and by its nested resources, nested resources first."""
+        validators = []
         for nested_resource in self._nested_resources():
-            self._validation_failures.extend(nested_resource.validate(suppressors, context))
+            validators.extend(nested_resource._collect_validators(context, validators_filter))
 
         # Update validators to be executed according to current status of the model and order by priority
         self._validators.clear()
         self._register_validators(context)
-        for validator in self._validators:
-            self._validation_failures.extend(self._validator_execute(*validator, suppressors))
-
-        return self._validation_failures
+        validators.extend(
+            (validator_class, validator_args)
+            for validator_class, validator_args in self._validators
+            if not validators_filter or validators_filter(self, validator_class, validator_args)
+        )
+        return validators
 
     def _register_validators(self, context: ValidatorContext = None):
         """
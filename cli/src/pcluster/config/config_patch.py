@@ -15,6 +15,7 @@ import sys
 from collections import namedtuple
 from typing import List
 
+from pcluster.config.common import Resource
 from pcluster.config.update_policy import UpdatePolicy
 from pcluster.schemas.cluster_schema import ClusterSchema
 from pcluster.schemas.common_schema import BaseSchema
@@ -69,6 +70,9 @@ class ConfigPatch:
 
         self.cluster_schema = ClusterSchema(cluster_name=cluster.name)
         self.changes = []
+        # Paths of the changed params and sections, each path being a tuple of config keys (f.i. list items are
+        # identified as "SlurmQueues[queue1]")
+        self.changed_paths = []
         self._compare()
 
     @property
@@ -135,6 +139,7 @@ class ConfigPatch:
                                     is_list=False,
                                 )
                             )
+                            self.changed_paths.append(tuple(param_path) + (data_key,))
             else:
                 # Simple param
                 target_value = target_section.get(data_key, None) if target_section else None
@@ -145,6 +150,7 @@ class ConfigPatch:
                     self.changes.append(
                         Change(param_path, data_key, base_value, target_value, change_update_policy, is_list=False)
                     )
+                    self.changed_paths.append(tuple(param_path) + (data_key,))
 
     def _compare_nested_section(self, param_path, data_key, base_value, target_value, field_obj):
         # Compare nested sections and params
@@ -188,6 +194,7 @@ class ConfigPatch:
                         is_list=True,
                     )
                 )
+                self.changed_paths.append(tuple(param_path) + (f"{data_key}[{update_key_value}]",))
         # Then, compare all non visited base sections vs target config.
         for base_nested_section in base_section.get(data_key, []):
             if not base_nested_section.get("visited", False):
@@ -201,6 +208,62 @@ class ConfigPatch:
                         is_list=True,
                     )
                 )
+                self.changed_paths.append(tuple(param_path) + (f"{data_key}[{base_nested_section.get(update_key)}]",))
+
+    def get_validators_filter(self, base_config, target_config, context=None):
+        """
+        Return a filter selecting the validators of the target configuration that must be executed.
+
+        A validator of the target configuration is executed if it is registered by a Resource affected by the patch or
+        if it was not registered with the same arguments in the base configuration; validators with the same
+        arguments of the base configuration are skipped since the base configuration has been already validated.
+        Validators checking AWS resources (f.i. subnets or images) are always executed, since the resources may have
+        changed or been deleted after the base configuration was validated.
+
+        :param base_config: The base ClusterConfig, f.i. the one of the running cluster
+        :param target_config: The target ClusterConfig, the one to be validated
+        :param context: The ValidatorContext used to register the validators
+        """
+        base_paths = _get_resource_paths(base_config, base_config.source_config, self.cluster_schema)
+        target_paths = _get_resource_paths(target_config, target_config.source_config, self.cluster_schema)
+
+        # A changed param belongs to the deepest Resource containing it; sections not mapped to a Resource
+        # (f.i. flattened into the parent Resource) belong to the parent one
+        known_paths = set(target_paths.values())
+        affected_paths = set()
+        for changed_path in self.changed_paths:
+            affected_paths.add(
+                next(
+                    changed_path[:length]
+                    for length in range(len(changed_path), -1, -1)
+                    if changed_path[:length] in known_paths
+                )
+            )
+
+        base_validators = base_config._collect_validators(context)  # pylint: disable=protected-access
+        base_fingerprints = {
+            _validator_fingerprint(validator_class, validator_args, base_paths, self.changed_paths)
+            for validator_class, validator_args in base_validators
+        }
+
+        def _validators_filter(resource, validator_class, validator_args):
+            path = target_paths.get(id(resource))
+            if (
+                validator_class.required_aws_resources
+                or path is None
+                or path in affected_paths
+                or any(path[: len(changed)] == changed for changed in self.changed_paths)
+            ):
+                return True
+            if (
+                _validator_fingerprint(validator_class, validator_args, target_paths, self.changed_paths)
+                in base_fingerprints
+            ):
+                LOGGER.debug("Skipping validator %s, not affected by the update", validator_class.__name__)
+                return False
+            return True
+
+        return _validators_filter
 
     @property
     def update_policy_level(self):
@@ -293,3 +356,85 @@ class ConfigPatch:
             )
 
         return {"changeSet": changes_list}
+
+
+# Resource attributes with a name different from the one of the schema field they are loaded from,
+# see SchedulingSchema post_load action
+_RESOURCE_ATTRIBUTE_NAMES = {
+    "slurm_queues": "queues",
+    "slurm_settings": "settings",
+    "aws_batch_queues": "queues",
+    "aws_batch_settings": "settings",
+    "scheduler_queues": "queues",
+    "scheduler_settings": "settings",
+}
+
+
+def _get_resource_paths(resource, section: dict, section_schema: BaseSchema, path=(), paths=None):
+    """
+    Return the paths in the configuration of the given Resource and of its nested Resources, indexed by object id.
+
+    Paths are built as in ConfigPatch changes, f.i. ("Scheduling", "SlurmQueues[queue1]", "Networking").
+    Resources that cannot be matched with a section of the configuration are not part of the result.
+    """
+    paths = {} if paths is None else paths
+    paths[id(resource)] = path
+    for field_name, field_obj in section_schema.declared_fields.items():
+        if not hasattr(field_obj, "nested"):
+            continue
+        # Sections missing in the configuration are still mapped, since they are implied by the code in the same way
+        nested_section = (section or {}).get(field_obj.data_key)
+        if not hasattr(resource, field_name) and nested_section:
+            field_name = _RESOURCE_ATTRIBUTE_NAMES.get(field_name, field_name)
+        value = getattr(resource, field_name, None)
+        if getattr(field_obj, "many", False):
+            update_key = field_obj.metadata.get("update_key")
+            update_key_field = next(
+                (name for name, field in field_obj.schema.declared_fields.items() if field.data_key == update_key),
+                None,
+            )
+            nested_sections = {item.get(update_key): item for item in nested_section or []}
+            for item in value if isinstance(value, list) else []:
+                update_key_value = getattr(item, update_key_field, None) if update_key_field else None
+                if isinstance(item, Resource) and update_key_value in nested_sections:
+                    _get_resource_paths(
+                        item,
+                        nested_sections[update_key_value],
+                        field_obj.schema,
+                        path + (f"{field_obj.data_key}[{update_key_value}]",),
+                        paths,
+                    )
+        elif isinstance(value, Resource):
+            _get_resource_paths(value, nested_section, field_obj.schema, path + (field_obj.data_key,), paths)
+    return paths
+
+
+def _validator_fingerprint(validator_class, validator_args: dict, resource_paths: dict, changed_paths: List):
+    """
+    Return a hashable representation of the validator and of its arguments.
+
+    Resources are represented by their path in the configuration when nothing changed in or above them; changed or
+    unknown Resources and values that cannot be compared get a unique value, so that the validator is always executed.
+    """
+
+    def _fingerprint(value):
+        if isinstance(value, Resource):
+            path = resource_paths.get(id(value))
+            if path is None or any(
+                changed[: len(path)] == path or path[: len(changed)] == changed for changed in changed_paths
+            ):
+                return object()
+            return Resource, path
+        if isinstance(value, (list, tuple)):
+            return tuple(_fingerprint(item) for item in value)
+        if isinstance(value, (set, frozenset)):
+            return frozenset(_fingerprint(item) for item in value)
+        if isinstance(value, dict):
+            return frozenset((key, _fingerprint(item)) for key, item in value.items())
+        try:
+            hash(value)
+        except TypeError:
+            return object()
+        return value
+
+    return validator_class, _fingerprint(validator_args)
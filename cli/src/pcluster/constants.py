@@ -9,8 +9,6 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
 
-from pkg_resources import packaging
-
 PCLUSTER_NAME_MAX_LENGTH = 60
 PCLUSTER_NAME_REGEX = r"^([a-zA-Z][a-zA-Z0-9-]{0,%d})$"
 PCLUSTER_ISSUES_LINK = "https://github.com/aws/aws-parallelcluster/issues"
@@ -190,8 +188,8 @@ NODEJS_INCOMPATIBLE_VERSION_RANGE = ["13.0.0", "13.6.0"]
 
 NODE_BOOTSTRAP_TIMEOUT = 1800
 
-SCHEDULER_PLUGIN_INTERFACE_VERSION = packaging.version.Version("1.0")
-SCHEDULER_PLUGIN_INTERFACE_VERSION_LOW_RANGE = packaging.version.Version("1.0")
+SCHEDULER_PLUGIN_INTERFACE_VERSION = "1.0"
+SCHEDULER_PLUGIN_INTERFACE_VERSION_LOW_RANGE = "1.0"
 
 # DirectoryService
 DIRECTORY_SERVICE_RESERVED_SETTINGS = {"id_provider": "ldap"}
@@ -202,3 +200,81 @@ LAMBDA_VPC_ACCESS_MANAGED_POLICY = "arn:${AWS::Partition}:iam::aws:policy/servic
 
 IAM_NAME_PREFIX_LENGTH_LIMIT = 30
 IAM_PATH_LENGTH_LIMIT = 512
+
+# Maximum number of instance types that can be passed to a single EC2 DescribeInstanceTypes call
+DESCRIBE_INSTANCE_TYPES_MAX_ITEMS = 100
+
+# Maximum number of connections kept open by each pooled boto3 client
+BOTO3_MAX_POOL_CONNECTIONS = 20
+
+# Maximum number of attempts of throttled boto3 calls and maximum backoff in seconds between attempts
+BOTO3_RETRY_MAX_ATTEMPTS = 10
+BOTO3_RETRY_MAX_BACKOFF = 20
+
+# Maximum number of results stored in memory for each function decorated with Cache.cached
+CACHE_MAX_SIZE = 1024
+
+# Persistent cache for the results of slow-changing AWS calls, sizes in bytes and times to live in seconds
+PERSISTENT_CACHE_MAX_SIZE = 50 * 1024 * 1024
+PERSISTENT_CACHE_INSTANCE_TYPES_TTL = 7 * 24 * 60 * 60
+PERSISTENT_CACHE_OFFICIAL_IMAGES_TTL = 24 * 60 * 60
+PERSISTENT_CACHE_AZ_OFFERINGS_TTL = 24 * 60 * 60
+PERSISTENT_CACHE_LOG_EVENTS_TTL = 7 * 24 * 60 * 60
+# The indexed log events are stored in their own partition of the persistent cache, with its own size limit
+PERSISTENT_CACHE_LOG_INDEX_PARTITION = "log-index"
+PERSISTENT_CACHE_LOG_INDEX_MAX_SIZE = 200 * 1024 * 1024
+VALIDATION_RESULTS_CACHE_TTL = 15 * 60
+
+# Maximum number of regions queried concurrently by the multi-region list operations
+MULTI_REGION_MAX_WORKERS = 10
+
+# Maximum number of keys that can be requested with a single DynamoDB BatchGetItem call
+DYNAMODB_BATCH_GET_ITEM_MAX_KEYS = 100
+# Maximum number of BatchGetItem attempts for the keys left unprocessed, and base and maximum backoff in seconds
+# between attempts
+DYNAMODB_BATCH_GET_ITEM_MAX_ATTEMPTS = 5
+DYNAMODB_BATCH_GET_ITEM_BASE_BACKOFF = 0.1
+DYNAMODB_BATCH_GET_ITEM_MAX_BACKOFF = 5
+# Maximum number of compute environments that can be described with a single Batch DescribeComputeEnvironments call
+BATCH_DESCRIBE_COMPUTE_ENVIRONMENTS_MAX_ITEMS = 100
+
+# Maximum number of lookups run in background to describe a cluster, the head node and the compute fleet status
+DESCRIBE_CLUSTER_MAX_WORKERS = 2
+
+# Maximum number of log streams downloaded concurrently when exporting logs
+LOGS_EXPORT_DOWNLOAD_MAX_WORKERS = 10
+# Size of the chunks in which exported logs are decompressed to disk
+LOGS_EXPORT_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# Logs are streamed directly from CloudWatch Logs, rather than exported to S3, when the number of the log streams and
+# the length in seconds of the time window are within these limits
+LOGS_EXPORT_STREAMING_MAX_LOG_STREAMS = 100
+LOGS_EXPORT_STREAMING_MAX_WINDOW = 24 * 60 * 60
+# Size of the parts in which the archive of the exported logs is uploaded to S3, at least 5 MiB as required by S3
+LOGS_EXPORT_UPLOAD_PART_SIZE = 8 * 1024 * 1024
+# Seconds by which the end of the incremental exports trails the current time, so that the events of the exported
+# window are all ingested when the export starts and are not missed by the next export
+LOGS_EXPORT_CHECKPOINT_INGESTION_DELAY = 10 * 60
+# Log events of many log streams are followed with FilterLogEvents, which reads up to 100 log streams per request.
+# The requests for the different groups of log streams are run concurrently
+LOGS_TAIL_MAX_LOG_STREAMS_PER_REQUEST = 100
+LOGS_TAIL_MAX_WORKERS = 10
+# Interval in seconds between the polls of the followed log events, doubled at each poll without new events
+LOGS_TAIL_MIN_INTERVAL = 2
+LOGS_TAIL_MAX_INTERVAL = 30
+# Log events are ingested with some delay, so each poll reads again the last seconds before the latest event
+LOGS_TAIL_LOOKBACK = 30
+# Interval in seconds after which the followed log streams are listed again, to follow those of new instances
+LOGS_TAIL_REFRESH_INTERVAL = 60
+# The log streams of the compute nodes of a queue are described by node, since DescribeLogStreams has a low rate limit.
+# At each refresh the new nodes and up to this number of known nodes are described, to find their newer log streams
+LOGS_TAIL_MAX_KNOWN_NODES_REFRESHED = 5
+# Log searches are split into sub-windows aligned to multiples of their size, which is the smallest power of two
+# multiple of LOGS_SEARCH_SUB_WINDOW seconds keeping them within LOGS_SEARCH_MAX_SUB_WINDOWS, queried concurrently
+LOGS_SEARCH_SUB_WINDOW = 60 * 60
+LOGS_SEARCH_MAX_SUB_WINDOWS = 100
+LOGS_SEARCH_MAX_WORKERS = 10
+# Seconds after which the log events of a sub-window are considered all ingested, and its results can be indexed
+LOGS_SEARCH_INGESTION_DELAY = 10 * 60
+
+# Maximum number of config validators executed concurrently
+VALIDATORS_MAX_WORKERS = 10
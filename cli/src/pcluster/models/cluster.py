@@ -21,6 +21,7 @@ import time
 from copy import deepcopy
 from datetime import datetime
 from enum import Enum
+from functools import partial
 from typing import List, Optional, Set, Tuple
 from urllib.request import urlopen
 
@@ -36,6 +37,7 @@ from pcluster.config.cluster_config import BaseClusterConfig, SchedulerPluginSch
 from pcluster.config.common import ValidatorSuppressor
 from pcluster.config.config_patch import ConfigPatch
 from pcluster.constants import (
+    LOGS_TAIL_MAX_KNOWN_NODES_REFRESHED,
     PCLUSTER_CLUSTER_NAME_TAG,
     PCLUSTER_NODE_TYPE_TAG,
     PCLUSTER_QUEUE_NAME_TAG,
@@ -47,20 +49,25 @@ from pcluster.models.cluster_resources import (
     ClusterInstance,
     ClusterStack,
     ExportClusterLogsFiltersParser,
+    FollowClusterLogsFiltersParser,
     ListClusterLogsFiltersParser,
+    SearchClusterLogsFiltersParser,
 )
 from pcluster.models.common import (
     BadRequest,
-    CloudWatchLogsExporter,
     Conflict,
+    FiltersParserError,
     LimitExceeded,
+    LogEventsFollower,
+    LogsArchive,
+    LogsExportCheckpoint,
     LogStream,
     LogStreams,
     NotFound,
-    create_logs_archive,
+    create_logs_exporter,
     export_stack_events,
     parse_config,
-    upload_archive,
+    search_log_events,
 )
 from pcluster.models.compute_fleet_status_manager import ComputeFleetStatus, ComputeFleetStatusManager
 from pcluster.models.s3_bucket import S3Bucket, S3BucketFactory, S3FileFormat, create_s3_presigned_url, parse_bucket_url
@@ -175,6 +182,7 @@ class Cluster:
         self.__official_ami = None
         self.__has_running_capacity = None
         self.__running_capacity = None
+        self.__update_patch = None
 
     @property
     def stack(self):
@@ -422,12 +430,19 @@ class Cluster:
             raise BadRequestClusterActionError(f"Cluster {self.name} already exists.")
 
     def _validate_and_parse_config(
-        self, validator_suppressors, validation_failure_level, config_text=None, context: ValidatorContext = None
+        self,
+        validator_suppressors,
+        validation_failure_level,
+        config_text=None,
+        context: ValidatorContext = None,
+        incremental: bool = False,
     ):
         """
         Perform syntactic and semantic validation and return parsed config.
 
         :param config_text: config to parse, self.source_config_text will be used if not specified.
+        :param incremental: True to execute only the validators affected by the changes with respect to the current
+        config of the cluster, when enabled with the PCLUSTER_INCREMENTAL_VALIDATION_ENABLED environment variable.
         """
         cluster_config_dict = parse_config(config_text or self.source_config_text)
 
@@ -437,7 +452,8 @@ class Cluster:
             config = self._load_config(cluster_config_dict)
             config.official_ami = self.__official_ami
 
-            validation_failures = config.validate(validator_suppressors, context)
+            validators_filter = self._get_validators_filter(config, context) if incremental else None
+            validation_failures = config.validate(validator_suppressors, context, validators_filter)
             if any(f.level.value >= FailureLevel(validation_failure_level).value for f in validation_failures):
                 raise ConfigValidationError("Invalid cluster configuration.", validation_failures=validation_failures)
             LOGGER.info("Validation succeeded.")
@@ -448,6 +464,31 @@ class Cluster:
 
         return config, validation_failures
 
+    def _get_validators_filter(self, target_config, context):
+        """
+        Return the filter selecting the validators affected by the changes between current and target config.
+
+        Incremental validation is opt-in, since it relies on the current config having been fully validated, which is
+        not the case for clusters created with suppressed validators, and it does not report again the warnings of
+        the unchanged sections.
+        """
+        if os.environ.get("PCLUSTER_INCREMENTAL_VALIDATION_ENABLED", "false").lower() != "true":
+            return None
+        try:
+            return self._get_update_patch(target_config).get_validators_filter(self.config, target_config, context)
+        except Exception as e:
+            LOGGER.warning("Unable to compare configurations, validating the whole configuration: %s", e)
+            return None
+
+    def _get_update_patch(self, target_config):
+        """Return the patch from the current to the target config, built once for each target config."""
+        if self.__update_patch is None or self.__update_patch[0] is not target_config:
+            patch = ConfigPatch(
+                cluster=self, base_config=self.config.source_config, target_config=target_config.source_config
+            )
+            self.__update_patch = (target_config, patch)
+        return self.__update_patch[1]
+
     @staticmethod
     def _load_additional_instance_type_data(cluster_config_dict):
         if "DevSettings" in cluster_config_dict:
@@ -841,6 +882,7 @@ class Cluster:
             validation_failure_level=validation_failure_level,
             config_text=target_source_config,
             context=ValidatorContext(head_node_instance_id=self.head_node_instance.id),
+            incremental=True,
         )
         changes = self._validate_patch(force, target_config)
 
@@ -852,9 +894,7 @@ class Cluster:
         return target_config, changes, ignored_validation_failures
 
     def _validate_patch(self, force, target_config):
-        patch = ConfigPatch(
-            cluster=self, base_config=self.config.source_config, target_config=target_config.source_config
-        )
+        patch = self._get_update_patch(target_config)
         patch_allowed, update_changes = patch.check()
         if not (patch_allowed or force):
             raise ClusterUpdateError("Update failure", update_changes=update_changes)
@@ -964,6 +1004,7 @@ class Cluster:
         end_time: datetime = None,
         filters: List[str] = None,
         output_file: str = None,
+        checkpoint_file: str = None,
     ):
         """
         Export cluster's logs in the given output path, by using given bucket as a temporary folder.
@@ -977,6 +1018,9 @@ class Cluster:
         :param end_time: End time of interval of interest for log events. ISO 8601 format: YYYY-MM-DDThh:mm:ssTZD
         :param filters: Filters in the format ["Name=name,Values=value1,value2"]
                Accepted filters are: private_dns_name, node_type==HeadNode
+        :param checkpoint_file: Checkpoint manifest of the incremental exports, with the same filters. When given, only
+               the log events after the last complete export and already ingested are exported, and an interrupted
+               export is resumed from its export task
         """
         # check stack
         if not AWSApi.instance().cfn.stack_exists(self.stack_name):
@@ -989,38 +1033,48 @@ class Cluster:
                 root_archive_dir = os.path.join(output_tempdir, archive_name)
                 os.makedirs(root_archive_dir, exist_ok=True)
 
-                if self.stack.log_group_name:
-                    # Export logs from CloudWatch
-                    export_logs_filters = self._init_export_logs_filters(start_time, end_time, filters)
-                    logs_exporter = CloudWatchLogsExporter(
-                        resource_id=self.name,
-                        log_group_name=self.stack.log_group_name,
-                        bucket=bucket,
-                        output_dir=root_archive_dir,
-                        bucket_prefix=bucket_prefix,
-                        keep_s3_objects=keep_s3_objects,
-                    )
-                    logs_exporter.execute(
-                        log_stream_prefix=export_logs_filters.log_stream_prefix,
-                        start_time=export_logs_filters.start_time,
-                        end_time=export_logs_filters.end_time,
-                    )
-                else:
-                    LOGGER.debug(
-                        "CloudWatch logging is not enabled for cluster %s, only CFN Stack events will be exported.",
-                        {self.name},
-                    )
-
-                # Get stack events and write them into a file
-                stack_events_file = os.path.join(root_archive_dir, self._stack_events_stream_name)
-                export_stack_events(self.stack_name, stack_events_file)
-
-                archive_path = create_logs_archive(root_archive_dir, output_file)
-                if output_file:
-                    return output_file
-                else:
-                    s3_path = upload_archive(bucket, bucket_prefix, archive_path)
-                    return create_s3_presigned_url(s3_path)
+                logs_exporter, checkpoint = None, None
+                with LogsArchive(root_archive_dir, output_file, bucket, bucket_prefix) as logs_archive:
+                    if self.stack.log_group_name:
+                        # Export logs from CloudWatch
+                        if checkpoint_file:
+                            checkpoint = LogsExportCheckpoint(checkpoint_file, self.stack.log_group_name, filters)
+                            start_time, end_time = checkpoint.get_time_window(start_time, end_time)
+                        export_logs_filters = self._init_export_logs_filters(start_time, end_time, filters)
+                        logs_exporter = create_logs_exporter(
+                            resource_id=self.name,
+                            log_group_name=self.stack.log_group_name,
+                            bucket=bucket,
+                            output_dir=root_archive_dir,
+                            bucket_prefix=bucket_prefix,
+                            keep_s3_objects=keep_s3_objects,
+                            log_stream_prefix=export_logs_filters.log_stream_prefix,
+                            start_time=export_logs_filters.start_time,
+                            end_time=export_logs_filters.end_time,
+                            archive=logs_archive,
+                            checkpoint=checkpoint,
+                        )
+                        logs_exporter.execute(
+                            log_stream_prefix=export_logs_filters.log_stream_prefix,
+                            start_time=export_logs_filters.start_time,
+                            end_time=export_logs_filters.end_time,
+                        )
+                    else:
+                        LOGGER.debug(
+                            "CloudWatch logging is not enabled for cluster %s, only CFN Stack events will be exported.",
+                            {self.name},
+                        )
+
+                    # Get stack events and write them into a file
+                    stack_events_file = os.path.join(root_archive_dir, self._stack_events_stream_name)
+                    export_stack_events(self.stack_name, stack_events_file)
+                    logs_archive.add(stack_events_file)
+
+                if logs_exporter and checkpoint:
+                    # The checkpoint is moved forward only once the archive is complete
+                    checkpoint.complete(export_logs_filters.end_time)
+
+                return output_file if output_file else create_s3_presigned_url(logs_archive.path)
         except Exception as e:
             raise ClusterActionError(f"Unexpected error when exporting cluster's logs: {e}")
 
@@ -1147,6 +1201,130 @@ class Cluster:
                 raise NotFoundClusterActionError(f"The specified log stream {log_stream_name} does not exist.")
             raise _cluster_error_mapper(e, f"Unexpected error when retrieving log events: {e}.")
 
+    def follow_log_events(self, filters: List[str] = None, start_time: datetime = None):
+        """
+        Follow the events of the cluster's log streams as they are ingested, merged by timestamp.
+
+        :param filters: Filters in the format ["Name=name,Values=value"]
+               Accepted filters are: private_dns_name, node_type==HeadNode, queue_name
+        :param start_time: Start time of interval of interest for log events. Defaults to the current time
+        :returns a generator of the log events, each one including the name of its log stream
+        """
+        if not AWSApi.instance().cfn.stack_exists(self.stack_name):
+            raise NotFoundClusterActionError(f"Cluster {self.name} does not exist.")
+        if not self.stack.log_group_name:
+            raise BadRequestClusterActionError(f"CloudWatch logging is not enabled for cluster {self.name}.")
+
+        head_node = None
+        try:
+            head_node = self.head_node_instance
+        except ClusterActionError as e:
+            LOGGER.debug(e)
+        try:
+            follow_logs_filters = FollowClusterLogsFiltersParser(head_node=head_node, filters=filters)
+            follow_logs_filters.validate()
+            log_stream_prefix = follow_logs_filters.log_stream_prefix
+        except FiltersParserError as e:
+            raise BadRequestClusterActionError(str(e))
+
+        get_log_stream_names = None
+        if follow_logs_filters.queue_name:
+            # The log streams of a queue are those of its compute nodes, which change over time
+            get_log_stream_names = partial(self._get_queue_log_stream_names, follow_logs_filters.queue_name, {})
+        return LogEventsFollower(
+            self.stack.log_group_name,
+            log_stream_prefix=log_stream_prefix,
+            get_log_stream_names=get_log_stream_names,
+            start_time=start_time,
+        ).follow()
+
+    def _get_queue_log_stream_names(self, queue_name: str, known_log_stream_names: dict):
+        """
+        Return the names of the log streams of the compute nodes of the given queue.
+
+        The log streams of each node are described by the prefix of their names and stored in known_log_stream_names,
+        by node, to be reused at the next calls. Only the new nodes and the known nodes described least recently are
+        described again, to find the log streams created after their first description.
+        """
+        try:
+            instances, next_token = self.describe_instances(node_type=NodeType.COMPUTE, queue_name=queue_name)
+            while next_token:
+                page, next_token = self.describe_instances(
+                    node_type=NodeType.COMPUTE, queue_name=queue_name, next_token=next_token
+                )
+                instances.extend(page)
+            nodes = [instance.private_dns_name_short for instance in instances]
+            for node in set(known_log_stream_names) - set(nodes):
+                # Terminated nodes are forgotten
+                del known_log_stream_names[node]
+            # Known nodes are kept in the order they were described, the least recently described first
+            nodes_to_describe = [node for node in nodes if node not in known_log_stream_names]
+            nodes_to_describe.extend(list(known_log_stream_names)[:LOGS_TAIL_MAX_KNOWN_NODES_REFRESHED])
+            for node in dict.fromkeys(nodes_to_describe):
+                # Log stream names are in the form <private dns name short>.<instance id>.<log name>
+                log_streams = AWSApi.instance().logs.get_log_streams(
+                    self.stack.log_group_name, log_stream_name_prefix=f"{node}."
+                )
+                known_log_stream_names.pop(node, None)
+                known_log_stream_names[node] = [log_stream["logStreamName"] for log_stream in log_streams]
+            return [name for node in nodes for name in known_log_stream_names[node]]
+        except AWSClientError as e:
+            raise _cluster_error_mapper(
+                e, f"Unexpected error when retrieving the log streams of queue {queue_name}: {e}"
+            )
+
+    def search_log_events(
+        self,
+        filter_pattern: str,
+        start_time: datetime = None,
+        end_time: datetime = None,
+        filters: List[str] = None,
+        limit: int = None,
+    ):
+        """
+        Search the events of the cluster's log streams matching a CloudWatch Logs filter pattern.
+
+        :param filter_pattern: CloudWatch Logs filter pattern the log events must match
+        :param start_time: Start time of interval of interest for log events. Defaults to the log group creation time
+        :param end_time: End time of interval of interest for log events. Defaults to the current time
+        :param filters: Filters in the format ["Name=name,Values=value"]
+               Accepted filters are: private_dns_name, node_type==HeadNode
+        :param limit: The maximum number of log events returned, the earliest ones
+        :returns the list of the matching log events sorted by timestamp, each one including the name of its log stream
+        """
+        if not AWSApi.instance().cfn.stack_exists(self.stack_name):
+            raise NotFoundClusterActionError(f"Cluster {self.name} does not exist.")
+        if not self.stack.log_group_name:
+            raise BadRequestClusterActionError(f"CloudWatch logging is not enabled for cluster {self.name}.")
+
+        head_node = None
+        try:
+            head_node = self.head_node_instance
+        except ClusterActionError as e:
+            LOGGER.debug(e)
+        try:
+            search_logs_filters = SearchClusterLogsFiltersParser(
+                head_node=head_node,
+                log_group_name=self.stack.log_group_name,
+                start_time=start_time,
+                end_time=end_time,
+                filters=filters,
+            )
+            search_logs_filters.validate()
+            events = search_log_events(
+                self.stack.log_group_name,
+                filter_pattern,
+                search_logs_filters.start_time,
+                search_logs_filters.end_time,
+                log_stream_prefix=search_logs_filters.log_stream_prefix,
+                limit=limit,
+            )
+        except FiltersParserError as e:
+            raise BadRequestClusterActionError(str(e))
+        except AWSClientError as e:
+            raise _cluster_error_mapper(e, f"Unexpected error when searching cluster's logs: {e}")
+        return events
+
     @property
     def _stack_events_stream_name(self):
         """Return the name of the stack events log stream."""
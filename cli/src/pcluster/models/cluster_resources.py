@@ -14,7 +14,13 @@ from typing import List
 
 from pcluster.aws.aws_api import AWSApi
 from pcluster.aws.aws_resources import InstanceInfo, StackInfo
-from pcluster.constants import CW_LOGS_CFN_PARAM_NAME, OS_MAPPING, PCLUSTER_NODE_TYPE_TAG, PCLUSTER_VERSION_TAG
+from pcluster.constants import (
+    CW_LOGS_CFN_PARAM_NAME,
+    OS_MAPPING,
+    PCLUSTER_CLUSTER_NAME_TAG,
+    PCLUSTER_NODE_TYPE_TAG,
+    PCLUSTER_VERSION_TAG,
+)
 from pcluster.models.common import FiltersParserError, LogGroupTimeFiltersParser
 
 
@@ -106,6 +112,11 @@ class ClusterInstance(InstanceInfo):
         """Return os of the instance."""
         return self._get_tag(PCLUSTER_NODE_TYPE_TAG)
 
+    @property
+    def cluster_name(self) -> str:
+        """Return the name of the cluster the instance belongs to."""
+        return self._get_tag(PCLUSTER_CLUSTER_NAME_TAG)
+
     def _get_tag(self, tag_key: str):
         return next(iter([tag["Value"] for tag in self._tags if tag["Key"] == tag_key]), None)
 
@@ -199,3 +210,56 @@ class ListClusterLogsFiltersParser(ClusterLogsFiltersParser):
     def __init__(self, head_node: ClusterInstance, log_group_name: str, filters: str = None):
         super().__init__(head_node, filters)
         self._log_group_name = log_group_name
+
+
+class FollowClusterLogsFiltersParser(ClusterLogsFiltersParser):
+    """Class to manage follow cluster logs filters, that also accept the queue of the compute nodes."""
+
+    def __init__(self, head_node: ClusterInstance, filters: List[str] = None):
+        # The queue name must be defined before parsing the filters, to be accepted as filter
+        self._queue_name = None
+        super().__init__(head_node, filters)
+
+    @property
+    def queue_name(self):
+        """Get queue name filter."""
+        return self._queue_name
+
+    def validate(self):
+        """Check filters consistency."""
+        super().validate()
+        if self._queue_name and (self._private_dns_name or self._node_type):
+            raise FiltersParserError(
+                "Queue Name filter cannot be set at the same time as Private DNS Name or Node Type filters."
+            )
+
+
+class SearchClusterLogsFiltersParser(ClusterLogsFiltersParser):
+    """Class to manage search cluster logs filters."""
+
+    def __init__(
+        self,
+        head_node: ClusterInstance,
+        log_group_name: str,
+        start_time: datetime.datetime = None,
+        end_time: datetime.datetime = None,
+        filters: List[str] = None,
+    ):
+        super().__init__(head_node, filters)
+        self.time_parser = LogGroupTimeFiltersParser(log_group_name, start_time, end_time)
+
+    @property
+    def start_time(self):
+        """Get start time parameter."""
+        return self.time_parser.start_time
+
+    @property
+    def end_time(self):
+        """Get end time parameter."""
+        return self.time_parser.end_time
+
+    def validate(self):
+        """Check filter consistency, a time window without log events is a valid search with no results."""
+        super().validate()
+        if self.start_time >= self.end_time:
+            raise FiltersParserError("Start time must be earlier than end time.")
@@ -8,22 +8,46 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+import contextlib
 import datetime
 import gzip
+import io
+import itertools
 import json
 import logging
 import os
 import os.path
+import shutil
 import tarfile
 import time
-from typing import List
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, List
 
 import configparser
 
 from pcluster.api.encoder import JSONEncoder
 from pcluster.aws.aws_api import AWSApi
-from pcluster.aws.common import AWSClientError, get_region
-from pcluster.utils import datetime_to_epoch, to_utc_datetime, yaml_load
+from pcluster.aws.common import AWSClientError, PersistentCache, get_region
+from pcluster.constants import (
+    LOGS_EXPORT_CHECKPOINT_INGESTION_DELAY,
+    LOGS_EXPORT_DOWNLOAD_CHUNK_SIZE,
+    LOGS_EXPORT_DOWNLOAD_MAX_WORKERS,
+    LOGS_EXPORT_STREAMING_MAX_LOG_STREAMS,
+    LOGS_EXPORT_STREAMING_MAX_WINDOW,
+    LOGS_EXPORT_UPLOAD_PART_SIZE,
+    LOGS_SEARCH_INGESTION_DELAY,
+    LOGS_SEARCH_MAX_SUB_WINDOWS,
+    LOGS_SEARCH_MAX_WORKERS,
+    LOGS_SEARCH_SUB_WINDOW,
+    LOGS_TAIL_LOOKBACK,
+    LOGS_TAIL_MAX_INTERVAL,
+    LOGS_TAIL_MAX_LOG_STREAMS_PER_REQUEST,
+    LOGS_TAIL_MAX_WORKERS,
+    LOGS_TAIL_MIN_INTERVAL,
+    LOGS_TAIL_REFRESH_INTERVAL,
+)
+from pcluster.utils import datetime_to_epoch, grouper, poll, to_iso_timestr, to_utc_datetime, yaml_load
 
 LOGGER = logging.getLogger(__name__)
 
@@ -134,10 +158,123 @@ class LogsExporterError(Exception):
         super().__init__(message)
 
 
+class LogsExportCheckpoint:
+    """
+    Checkpoint manifest of the incremental exports of a log group, saved to a local JSON file.
+
+    The manifest records the filters of the exports and the end of the time window of the last complete export, so
+    that the next export only fetches the newer events. It also records the CloudWatch export task of an export in
+    progress, which is reused when the export is resumed after a failure.
+    """
+
+    def __init__(self, path: str, log_group_name: str, filters: List[str] = None):
+        self.path = path
+        self.log_group_name = log_group_name
+        self.filters = sorted(filters or [])
+        manifest = {}
+        if os.path.isfile(path):
+            try:
+                with open(path, encoding="utf-8") as manifest_file:
+                    manifest = json.load(manifest_file)
+            except (OSError, ValueError) as e:
+                raise LogsExporterError(f"Unable to read the checkpoint file {path}: {e}")
+            if manifest.get("logGroupName") != log_group_name:
+                raise LogsExporterError(
+                    f"The checkpoint file {path} refers to the log group {manifest.get('logGroupName')} "
+                    f"and not to {log_group_name}."
+                )
+            # Events of the log streams excluded by the filters of the previous exports would never be exported
+            if manifest.get("filters", []) != self.filters:
+                raise LogsExporterError(
+                    f"The checkpoint file {path} refers to the filters {manifest.get('filters', [])} "
+                    f"and not to {self.filters}."
+                )
+        # Timestamps are saved as epoch milliseconds, as in CloudWatch Logs
+        self.end_time = manifest.get("endTime")
+        self.export_task = manifest.get("exportTask")
+
+    def get_time_window(self, start_time: datetime.datetime = None, end_time: datetime.datetime = None):
+        """
+        Return the time window of the export, given the one requested.
+
+        An interrupted export is resumed with its own time window. Otherwise, the export starts right after the end of
+        the last complete export, the events at both ends of the window being exported, and ends before the events
+        that could still be ingested, which are exported by the next export.
+        """
+        if self.export_task:
+            LOGGER.info("Resuming the export interrupted while running export task %s", self.export_task["taskId"])
+            return to_utc_datetime(self.export_task["startTime"]), to_utc_datetime(self.export_task["endTime"])
+        if self.end_time is not None:
+            checkpoint_start_time = to_utc_datetime(self.end_time + 1)
+            if not start_time or start_time < checkpoint_start_time:
+                LOGGER.info(
+                    "Exporting the log events after the last export, ended at %s", to_utc_datetime(self.end_time)
+                )
+                start_time = checkpoint_start_time
+        ingested_end_time = datetime.datetime.now(tz=datetime.timezone.utc) - datetime.timedelta(
+            seconds=LOGS_EXPORT_CHECKPOINT_INGESTION_DELAY
+        )
+        if not end_time or end_time > ingested_end_time:
+            LOGGER.info("Exporting the log events until %s, the later ones could still be ingested", ingested_end_time)
+            end_time = ingested_end_time
+        if start_time and start_time >= end_time:
+            raise LogsExporterError(
+                f"No log events to export in the interval starting at {start_time}, log events are exported "
+                f"incrementally {LOGS_EXPORT_CHECKPOINT_INGESTION_DELAY // 60} minutes after their time."
+            )
+        return start_time, end_time
+
+    def start_export_task(self, task_id, bucket, bucket_prefix, delete_everything_under_prefix, start_time, end_time):
+        """Record the export task of the export in progress, to resume the export from it in case of failure."""
+        self.export_task = {
+            "taskId": task_id,
+            "bucket": bucket,
+            "bucketPrefix": bucket_prefix,
+            "deleteEverythingUnderPrefix": delete_everything_under_prefix,
+            "startTime": datetime_to_epoch(start_time),
+            "endTime": datetime_to_epoch(end_time),
+        }
+        self.save()
+
+    def discard_export_task(self):
+        """Forget the export task of the export in progress, e.g. because it failed."""
+        self.export_task = None
+        self.save()
+
+    def complete(self, end_time: datetime.datetime):
+        """Record the end of a complete export."""
+        self.end_time = datetime_to_epoch(end_time)
+        self.export_task = None
+        self.save()
+
+    def save(self):
+        """Write the manifest, replacing the previous one atomically to never leave a truncated manifest behind."""
+        manifest = {
+            "logGroupName": self.log_group_name,
+            "filters": self.filters,
+            "endTime": self.end_time,
+            "exportTask": self.export_task,
+        }
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as manifest_file:
+            json.dump(manifest, manifest_file, indent=2)
+        os.replace(temp_path, self.path)
+
+
 class CloudWatchLogsExporter:
     """Utility class used to export log group logs."""
 
-    def __init__(self, resource_id, log_group_name, bucket, output_dir, bucket_prefix=None, keep_s3_objects=False):
+    def __init__(
+        self,
+        resource_id,
+        log_group_name,
+        bucket,
+        output_dir,
+        bucket_prefix=None,
+        keep_s3_objects=False,
+        archive: "LogsArchive" = None,
+        checkpoint: LogsExportCheckpoint = None,
+    ):
         # check bucket
         bucket_region = AWSApi.instance().s3.get_bucket_region(bucket_name=bucket)
         if bucket_region != get_region():
@@ -149,6 +286,9 @@ class CloudWatchLogsExporter:
         self.log_group_name = log_group_name
         self.output_dir = output_dir
         self.keep_s3_objects = keep_s3_objects
+        # When given, log streams are moved to the archive as soon as they are downloaded
+        self.archive = archive
+        self.checkpoint = checkpoint
 
         if bucket_prefix:
             self.bucket_prefix = bucket_prefix
@@ -166,14 +306,17 @@ class CloudWatchLogsExporter:
         task_id = self._export_logs_to_s3(log_stream_prefix=log_stream_prefix, start_time=start_time, end_time=end_time)
         LOGGER.info("Log export task id: %s", task_id)
         # Download exported S3 objects to output dir subfolder
+        downloaded = False
         try:
             log_streams_dir = os.path.join(self.output_dir, "cloudwatch-logs")
             self._download_s3_objects_with_prefix(task_id, log_streams_dir)
+            downloaded = True
             LOGGER.info("Archive of CloudWatch logs saved to %s", self.output_dir)
         except OSError:
             raise LogsExporterError("Unable to download archive logs from S3, double check your filters are correct.")
         finally:
-            if not self.keep_s3_objects:
+            # The exported objects are needed to resume an interrupted export from its checkpoint
+            if not self.keep_s3_objects and (downloaded or not self.checkpoint):
                 if self.delete_everything_under_prefix:
                     delete_key = self.bucket_prefix
                 else:
@@ -186,18 +329,38 @@ class CloudWatchLogsExporter:
     ):
         """Export the contents of an image's CloudWatch log group to an s3 bucket."""
         try:
-            LOGGER.debug("Starting export of logs from log group %s to s3 bucket %s", self.log_group_name, self.bucket)
-            task_id = AWSApi.instance().logs.create_export_task(
-                log_group_name=self.log_group_name,
-                log_stream_name_prefix=log_stream_prefix,
-                bucket=self.bucket,
-                bucket_prefix=self.bucket_prefix,
-                start_time=start_time,
-                end_time=end_time,
-            )
+            export_task = self.checkpoint and self.checkpoint.export_task
+            if export_task and export_task["bucket"] == self.bucket:
+                # Resume the interrupted export, whose objects are under the prefix of its own export task
+                task_id = export_task["taskId"]
+                self.bucket_prefix = export_task["bucketPrefix"]
+                self.delete_everything_under_prefix = export_task["deleteEverythingUnderPrefix"]
+            else:
+                LOGGER.debug(
+                    "Starting export of logs from log group %s to s3 bucket %s", self.log_group_name, self.bucket
+                )
+                task_id = AWSApi.instance().logs.create_export_task(
+                    log_group_name=self.log_group_name,
+                    log_stream_name_prefix=log_stream_prefix,
+                    bucket=self.bucket,
+                    bucket_prefix=self.bucket_prefix,
+                    start_time=start_time,
+                    end_time=end_time,
+                )
+                if self.checkpoint:
+                    self.checkpoint.start_export_task(
+                        task_id,
+                        self.bucket,
+                        self.bucket_prefix,
+                        self.delete_everything_under_prefix,
+                        start_time,
+                        end_time,
+                    )
 
             result_status = self._wait_for_task_completion(task_id)
             if result_status != "COMPLETED":
+                if self.checkpoint:
+                    self.checkpoint.discard_export_task()
                 raise LogsExporterError(f"CloudWatch logs export task {task_id} failed with status: {result_status}")
             return task_id
         except AWSClientError as e:
@@ -214,35 +377,207 @@ class CloudWatchLogsExporter:
     def _wait_for_task_completion(task_id):
         """Wait for the CloudWatch logs export task given by task_id to finish."""
         LOGGER.debug("Waiting for export task with task ID=%s to finish...", task_id)
-        status = "PENDING"
         still_running_statuses = ("PENDING", "PENDING_CANCEL", "RUNNING")
-        while status in still_running_statuses:
-            time.sleep(1)
-            status = AWSApi.instance().logs.get_export_task_status(task_id)
-        return status
+        return poll(
+            lambda: AWSApi.instance().logs.get_export_task_status(task_id),
+            until=lambda status: status not in still_running_statuses,
+            max_interval=15,
+        )
 
     def _download_s3_objects_with_prefix(self, task_id, destdir):
-        """Download all object in bucket with given prefix into destdir."""
+        """
+        Download all object in bucket with given prefix into destdir.
+
+        Objects are downloaded concurrently and decompressed while being streamed to disk in bounded chunks.
+        The objects of the same log stream are appended, in order, to a single file, moved to the archive if any.
+        """
         prefix = f"{self.bucket_prefix}/{task_id}"
         LOGGER.debug("Downloading exported logs from s3 bucket %s (under key %s) to %s", self.bucket, prefix, destdir)
+        objects_by_path = {}
         for archive_object in AWSApi.instance().s3_resource.get_objects(bucket_name=self.bucket, prefix=prefix):
             decompressed_path = os.path.dirname(os.path.join(destdir, archive_object.key))
             decompressed_path = decompressed_path.replace(
                 r"{unwanted_path_segment}{sep}".format(unwanted_path_segment=prefix, sep=os.path.sep), ""
             )
-            compressed_path = f"{decompressed_path}.gz"
+            objects_by_path.setdefault(decompressed_path, []).append(archive_object.key)
+
+        total_objects = sum(len(keys) for keys in objects_by_path.values())
+        downloaded_objects = 0
+        with ThreadPoolExecutor(max_workers=LOGS_EXPORT_DOWNLOAD_MAX_WORKERS) as executor:
+            futures = {
+                executor.submit(self._download_and_decompress_s3_objects, sorted(keys), decompressed_path): (
+                    decompressed_path
+                )
+                for decompressed_path, keys in objects_by_path.items()
+            }
+            for future in as_completed(futures):
+                downloaded_objects += future.result()
+                if self.archive:
+                    self.archive.add(futures[future])
+                LOGGER.info("Downloaded %s of %s exported log objects", downloaded_objects, total_objects)
+
+    def _download_and_decompress_s3_objects(self, keys, decompressed_path):
+        """Stream the given gzipped objects from the bucket and write their decompressed content to a single file."""
+        os.makedirs(os.path.dirname(decompressed_path), exist_ok=True)
+        with open(decompressed_path, "wb") as outfile:
+            for key in keys:
+                LOGGER.debug("Downloading and extracting object with key=%s to %s", key, decompressed_path)
+                body = AWSApi.instance().s3.get_object(bucket_name=self.bucket, key=key)["Body"]
+                with gzip.GzipFile(fileobj=body) as gfile:
+                    shutil.copyfileobj(gfile, outfile, LOGS_EXPORT_DOWNLOAD_CHUNK_SIZE)
+        return len(keys)
+
+
+class CloudWatchLogsStreamingExporter:
+    """
+    Utility class used to export log group logs by reading the log events directly from CloudWatch Logs.
+
+    Log streams are read concurrently and written to the output dir with the same layout and format of the objects
+    exported to S3 by CloudWatchLogsExporter, without waiting for an export task.
+    """
+
+    def __init__(self, log_group_name, output_dir, log_streams: List[dict] = None, archive: "LogsArchive" = None):
+        self.log_group_name = log_group_name
+        self.output_dir = output_dir
+        # When given, log streams are moved to the archive as soon as they are written
+        self.archive = archive
+        # Log streams already retrieved for the time window, to avoid describing them again
+        self.log_streams = log_streams
+
+    def execute(self, log_stream_prefix=None, start_time: datetime.datetime = None, end_time: datetime.datetime = None):
+        """Write the events of the log streams in the given time window to the output dir."""
+        log_streams = self.log_streams
+        if log_streams is None:
+            log_streams = _get_log_streams_in_window(
+                AWSApi.instance().logs.get_log_streams(self.log_group_name, log_stream_prefix), start_time, end_time
+            )
+        log_streams_dir = os.path.join(self.output_dir, "cloudwatch-logs")
+        LOGGER.debug(
+            "Streaming %s log streams of log group %s to %s", len(log_streams), self.log_group_name, log_streams_dir
+        )
+        exported_log_streams = 0
+        with ThreadPoolExecutor(max_workers=LOGS_EXPORT_DOWNLOAD_MAX_WORKERS) as executor:
+            futures = {
+                executor.submit(
+                    self._write_log_stream, log_stream["logStreamName"], output_file, start_time, end_time
+                ): output_file
+                for log_stream in log_streams
+                for output_file in [os.path.join(log_streams_dir, log_stream["logStreamName"])]
+            }
+            for future in as_completed(futures):
+                future.result()
+                if self.archive:
+                    self.archive.add(futures[future])
+                exported_log_streams += 1
+                LOGGER.info("Exported %s of %s log streams", exported_log_streams, len(log_streams))
+        LOGGER.info("Archive of CloudWatch logs saved to %s", self.output_dir)
+
+    def _write_log_stream(self, log_stream_name, output_file, start_time, end_time):
+        """Write the events of the given log stream to the output file, one event per line preceded by its time."""
+        os.makedirs(os.path.dirname(output_file), exist_ok=True)
+        next_token = None
+        with open(output_file, "w", encoding="utf-8") as outfile:
+            while True:
+                response = AWSApi.instance().logs.get_log_events(
+                    log_group_name=self.log_group_name,
+                    log_stream_name=log_stream_name,
+                    start_time=start_time and datetime_to_epoch(start_time),
+                    # Unlike export tasks, GetLogEvents excludes the events at the end time
+                    end_time=end_time and datetime_to_epoch(end_time) + 1,
+                    start_from_head=True,
+                    next_token=next_token,
+                )
+                for event in response.get("events", []):
+                    event_time = to_iso_timestr(to_utc_datetime(event["timestamp"]))
+                    outfile.write(f"{event_time} {event['message']}\n")
+                # The end of the stream is reached when the same token is returned, pages in the middle of the stream
+                # can be empty
+                if response.get("nextForwardToken") in (None, next_token):
+                    break
+                next_token = response.get("nextForwardToken")
+
+
+def _get_log_streams_in_window(log_streams, start_time: datetime.datetime = None, end_time: datetime.datetime = None):
+    """
+    Return the log streams having events in the given time window.
+
+    The last ingestion time is used rather than the last event timestamp, which CloudWatch Logs updates only eventually
+    and would exclude the log streams with recent events.
+    """
+    start_epoch = start_time and datetime_to_epoch(start_time)
+    end_epoch = end_time and datetime_to_epoch(end_time)
+    return [
+        log_stream
+        for log_stream in log_streams
+        if "firstEventTimestamp" in log_stream
+        and (not end_epoch or log_stream["firstEventTimestamp"] <= end_epoch)
+        and (not start_epoch or log_stream.get("lastIngestionTime", start_epoch) >= start_epoch)
+    ]
+
+
+def _get_window_length(log_streams, start_time: datetime.datetime = None, end_time: datetime.datetime = None):
+    """Return the length in seconds of the time window, bounded by the first event of the given log streams."""
+    start_epoch = start_time and datetime_to_epoch(start_time)
+    first_event = min((log_stream["firstEventTimestamp"] for log_stream in log_streams), default=None)
+    if first_event is not None and (start_epoch is None or first_event > start_epoch):
+        start_epoch = first_event
+    if start_epoch is None:
+        return 0
+    end_epoch = datetime_to_epoch(end_time or datetime.datetime.now(tz=datetime.timezone.utc))
+    return max(0, end_epoch - start_epoch) / 1000
+
+
+def create_logs_exporter(
+    resource_id,
+    log_group_name,
+    bucket,
+    output_dir,
+    bucket_prefix=None,
+    keep_s3_objects=False,
+    log_stream_prefix=None,
+    start_time: datetime.datetime = None,
+    end_time: datetime.datetime = None,
+    archive: "LogsArchive" = None,
+    checkpoint: LogsExportCheckpoint = None,
+):
+    """
+    Return the exporter to be used for the log streams of the given log group in the given time window.
+
+    Logs are streamed directly from CloudWatch Logs when the log streams are few and the time window is short, and
+    exported to S3 otherwise. The size of the log streams is not considered, since CloudWatch Logs reports zero stored
+    bytes. The S3 export is always used when the exported objects have to be kept, and when resuming an export
+    interrupted while running an export task.
+    """
+    log_streams = None
+    if not keep_s3_objects:
+        try:
+            log_streams = _get_log_streams_in_window(
+                AWSApi.instance().logs.get_log_streams(log_group_name, log_stream_prefix), start_time, end_time
+            )
+        except AWSClientError as e:
+            LOGGER.debug("Unable to describe the log streams to export: %s", e)
 
-            LOGGER.debug("Downloading object with key=%s to %s", archive_object.key, compressed_path)
-            os.makedirs(os.path.dirname(compressed_path), exist_ok=True)
-            AWSApi.instance().s3_resource.download_file(
-                bucket_name=self.bucket, key=archive_object.key, output=compressed_path
+    if log_streams is not None and not (checkpoint and checkpoint.export_task):
+        window_length = _get_window_length(log_streams, start_time, end_time)
+        LOGGER.debug("Exporting %s log streams in a time window of %s seconds", len(log_streams), window_length)
+        if (
+            len(log_streams) <= LOGS_EXPORT_STREAMING_MAX_LOG_STREAMS
+            and window_length <= LOGS_EXPORT_STREAMING_MAX_WINDOW
+        ):
+            return CloudWatchLogsStreamingExporter(
+                log_group_name=log_group_name, output_dir=output_dir, log_streams=log_streams, archive=archive
             )
 
-            # Create a decompressed copy of the downloaded archive and remove the original
-            LOGGER.debug("Extracting object at %s to %s", compressed_path, decompressed_path)
-            with gzip.open(compressed_path) as gfile, open(decompressed_path, "wb") as outfile:
-                outfile.write(gfile.read())
-            os.remove(compressed_path)
+    return CloudWatchLogsExporter(
+        resource_id=resource_id,
+        log_group_name=log_group_name,
+        bucket=bucket,
+        output_dir=output_dir,
+        bucket_prefix=bucket_prefix,
+        keep_s3_objects=keep_s3_objects,
+        archive=archive,
+        checkpoint=checkpoint,
+    )
 
 
 def export_stack_events(stack_name: str, output_file: str):
@@ -258,23 +593,110 @@ def export_stack_events(stack_name: str, output_file: str):
         cfn_events_file.write(json.dumps(stack_events, cls=JSONEncoder, indent=2))
 
 
-def create_logs_archive(directory: str, output_file: str = None):
-    base_directory = os.path.dirname(directory)
-    base_name = os.path.basename(directory)
-    output_file = output_file or f"{os.path.join(base_directory, base_name)}.tar.gz"
-    LOGGER.debug("Creating archive of logs and saving it to %s", output_file)
-    with tarfile.open(output_file, "w:gz") as tar:
-        tar.add(directory, arcname=base_name)
-    return output_file
+class S3MultipartUploadStream(io.RawIOBase):
+    """
+    Writable stream uploading its content to an S3 object with a multipart upload.
+
+    The content is buffered and uploaded in parts of LOGS_EXPORT_UPLOAD_PART_SIZE bytes, so that the memory used is
+    bounded regardless of the size of the object. The upload is completed when the stream is closed and aborted by
+    abort(), which deletes the parts already uploaded.
+    """
 
+    def __init__(self, bucket: str, key: str):
+        super().__init__()
+        self.bucket = bucket
+        self.key = key
+        self._upload_id = AWSApi.instance().s3.create_multipart_upload(bucket_name=bucket, key=key)
+        self._buffer = bytearray()
+        self._parts = []
+
+    def writable(self):
+        """Tell that the stream is writable."""
+        return True
+
+    def write(self, data):
+        """Buffer the given data, uploading a part every time the buffer exceeds the part size."""
+        self._buffer.extend(data)
+        while len(self._buffer) >= LOGS_EXPORT_UPLOAD_PART_SIZE:
+            self._upload_part(bytes(self._buffer[:LOGS_EXPORT_UPLOAD_PART_SIZE]))
+            del self._buffer[:LOGS_EXPORT_UPLOAD_PART_SIZE]
+        return len(data)
+
+    def close(self):
+        """Upload the remaining data as last part and complete the upload."""
+        if not self.closed:
+            # The last part can be smaller than the minimum part size, an empty object still needs one part
+            if self._buffer or not self._parts:
+                self._upload_part(bytes(self._buffer))
+                self._buffer.clear()
+            AWSApi.instance().s3.complete_multipart_upload(
+                bucket_name=self.bucket, key=self.key, upload_id=self._upload_id, parts=self._parts
+            )
+        super().close()
+
+    def abort(self):
+        """Abort the upload, deleting the parts already uploaded."""
+        if not self.closed:
+            self._buffer.clear()
+            AWSApi.instance().s3.abort_multipart_upload(
+                bucket_name=self.bucket, key=self.key, upload_id=self._upload_id
+            )
+        super().close()
 
-def upload_archive(bucket: str, bucket_prefix: str, archive_path: str):
-    archive_filename = os.path.basename(archive_path)
-    with open(archive_path, "rb") as archive_file:
-        archive_data = archive_file.read()
-    bucket_path = f"{bucket_prefix}/{archive_filename}" if bucket_prefix else archive_filename
-    AWSApi.instance().s3.put_object(bucket, archive_data, bucket_path)
-    return f"s3://{bucket}/{bucket_path}"
+    def _upload_part(self, body):
+        part_number = len(self._parts) + 1
+        etag = AWSApi.instance().s3.upload_part(
+            bucket_name=self.bucket, key=self.key, upload_id=self._upload_id, part_number=part_number, body=body
+        )
+        self._parts.append({"ETag": etag, "PartNumber": part_number})
+
+
+class LogsArchive:
+    """
+    Streaming tar.gz archive of the exported logs.
+
+    Files are appended to the archive as soon as they are exported and then removed from the archive directory, so
+    that the exported logs are never staged on disk all together. The archive is written to the output file if
+    given, and uploaded to the bucket with a multipart upload otherwise.
+    """
+
+    def __init__(self, directory: str, output_file: str = None, bucket: str = None, bucket_prefix: str = None):
+        self.directory = directory
+        self.archive_name = os.path.basename(directory)
+        if output_file:
+            self.path = output_file
+            self._output = open(output_file, "wb")  # pylint: disable=consider-using-with
+        else:
+            archive_key = f"{self.archive_name}.tar.gz"
+            archive_key = f"{bucket_prefix}/{archive_key}" if bucket_prefix else archive_key
+            self.path = f"s3://{bucket}/{archive_key}"
+            self._output = S3MultipartUploadStream(bucket, archive_key)
+        LOGGER.debug("Creating archive of logs and saving it to %s", self.path)
+        self._tar = tarfile.open(fileobj=self._output, mode="w|gz")  # pylint: disable=consider-using-with
+        self._tar.add(directory, arcname=self.archive_name, recursive=False)
+
+    def add(self, path: str):
+        """Append the given file of the archive directory to the archive and remove it from disk."""
+        self._tar.add(path, arcname=os.path.join(self.archive_name, os.path.relpath(path, self.directory)))
+        os.remove(path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type:
+            # Close the archive to release its compression stream, the error being handled is the one to report
+            with contextlib.suppress(Exception):
+                self._tar.close()
+            # Do not leave incomplete archives behind
+            if isinstance(self._output, S3MultipartUploadStream):
+                self._output.abort()
+            else:
+                self._output.close()
+                os.remove(self.path)
+        else:
+            self._tar.close()
+            self._output.close()
 
 
 class LogStreams:
@@ -296,3 +718,139 @@ class LogStream:
         # The next_tokens are not present when the log stream is the Stack Events log stream
         self.next_ftoken = log_events_response.get("nextForwardToken", None)
         self.next_btoken = log_events_response.get("nextBackwardToken", None)
+
+
+class LogEventsFollower:
+    """
+    Follow the log events of many log streams of a log group, merging them by timestamp.
+
+    The log streams to follow are given either by a log stream name prefix or by a function returning their names,
+    which is called again every LOGS_TAIL_REFRESH_INTERVAL seconds to follow the log streams created in the meantime,
+    e.g. by new compute nodes. Log streams are read with FilterLogEvents, which reads a whole prefix or up to
+    LOGS_TAIL_MAX_LOG_STREAMS_PER_REQUEST log streams with a single request, instead of one request per log stream.
+    """
+
+    def __init__(
+        self,
+        log_group_name: str,
+        log_stream_prefix: str = None,
+        get_log_stream_names: Callable = None,
+        start_time: datetime.datetime = None,
+    ):
+        self.log_group_name = log_group_name
+        self.log_stream_prefix = log_stream_prefix
+        self._get_log_stream_names = get_log_stream_names
+        self._log_stream_names = None
+        self._log_stream_names_refresh_time = None
+        self._start_time = datetime_to_epoch(start_time or datetime.datetime.now(tz=datetime.timezone.utc))
+        # Timestamps of the events already returned, by event ID, to skip them when they are read again
+        self._returned_events = {}
+
+    def poll(self) -> List[dict]:
+        """Return the log events ingested since the last poll, sorted by timestamp."""
+        if self._get_log_stream_names:
+            if (
+                self._log_stream_names_refresh_time is None
+                or time.monotonic() - self._log_stream_names_refresh_time >= LOGS_TAIL_REFRESH_INTERVAL
+            ):
+                self._log_stream_names = self._get_log_stream_names()
+                self._log_stream_names_refresh_time = time.monotonic()
+            with ThreadPoolExecutor(max_workers=LOGS_TAIL_MAX_WORKERS) as executor:
+                events_groups = executor.map(
+                    lambda log_stream_names: AWSApi.instance().logs.get_filtered_log_events(
+                        self.log_group_name, log_stream_names=list(log_stream_names), start_time=self._start_time
+                    ),
+                    grouper(self._log_stream_names, LOGS_TAIL_MAX_LOG_STREAMS_PER_REQUEST),
+                )
+                events = [event for events_group in events_groups for event in events_group]
+        else:
+            events = AWSApi.instance().logs.get_filtered_log_events(
+                self.log_group_name, log_stream_name_prefix=self.log_stream_prefix, start_time=self._start_time
+            )
+
+        new_events = sorted(
+            (event for event in events if event["eventId"] not in self._returned_events),
+            key=lambda event: (event["timestamp"], event["logStreamName"]),
+        )
+        if new_events:
+            self._returned_events.update({event["eventId"]: event["timestamp"] for event in new_events})
+            # The next poll reads again the last seconds, to get the events ingested late
+            self._start_time = max(self._start_time, new_events[-1]["timestamp"] - LOGS_TAIL_LOOKBACK * 1000)
+            self._returned_events = {
+                event_id: timestamp
+                for event_id, timestamp in self._returned_events.items()
+                if timestamp >= self._start_time
+            }
+        return new_events
+
+    def follow(self):
+        """Yield the log events as they are ingested, polling less frequently while there are no new events."""
+        interval = LOGS_TAIL_MIN_INTERVAL
+        while True:
+            events = self.poll()
+            yield from events
+            interval = LOGS_TAIL_MIN_INTERVAL if events else min(interval * 2, LOGS_TAIL_MAX_INTERVAL)
+            time.sleep(interval)
+
+
+def search_log_events(
+    log_group_name: str,
+    filter_pattern: str,
+    start_time: datetime.datetime,
+    end_time: datetime.datetime,
+    log_stream_prefix: str = None,
+    limit: int = None,
+) -> List[dict]:
+    """
+    Return the log events of a log group matching the filter pattern in the given time window, sorted by timestamp.
+
+    The time window is split into sub-windows queried concurrently with FilterLogEvents. Sub-windows are aligned to
+    multiples of their size, so that the results of the sub-windows whose events are all ingested can be indexed in
+    the PersistentCache, when enabled, and reused by later searches over overlapping time windows.
+    Sub-windows are queried in order, up to LOGS_SEARCH_MAX_WORKERS at a time, so that when a limit is given the
+    later sub-windows are not queried once the earliest limit events are found.
+    """
+    start = datetime_to_epoch(start_time)
+    end = datetime_to_epoch(end_time)
+    sub_window = LOGS_SEARCH_SUB_WINDOW * 1000
+    while end // sub_window - start // sub_window + 1 > LOGS_SEARCH_MAX_SUB_WINDOWS:
+        sub_window *= 2
+    ingested_until = (
+        datetime_to_epoch(datetime.datetime.now(tz=datetime.timezone.utc)) - LOGS_SEARCH_INGESTION_DELAY * 1000
+    )
+    indexed = PersistentCache.is_enabled()
+
+    def _search_sub_window(sub_window_start):
+        sub_window_end = sub_window_start + sub_window - 1
+        if indexed and sub_window_end <= ingested_until:
+            # The whole sub-window is requested, to reuse its results whatever the boundaries of the next searches
+            return AWSApi.instance().logs.get_indexed_log_events(
+                log_group_name, filter_pattern, log_stream_prefix, sub_window_start, sub_window_end
+            )
+        return AWSApi.instance().logs.get_filtered_log_events(
+            log_group_name,
+            log_stream_name_prefix=log_stream_prefix,
+            start_time=max(sub_window_start, start),
+            end_time=min(sub_window_end, end),
+            filter_pattern=filter_pattern,
+        )
+
+    sub_window_starts = iter(range(start - start % sub_window, end + 1, sub_window))
+    events = []
+    with ThreadPoolExecutor(max_workers=LOGS_SEARCH_MAX_WORKERS) as executor:
+        futures = deque(
+            executor.submit(_search_sub_window, sub_window_start)
+            for sub_window_start in itertools.islice(sub_window_starts, LOGS_SEARCH_MAX_WORKERS)
+        )
+        while futures:
+            events.extend(event for event in futures.popleft().result() if start <= event["timestamp"] <= end)
+            if limit and len(events) >= limit:
+                # The events of the later sub-windows all follow the ones found
+                for future in futures:
+                    future.cancel()
+                break
+            next_sub_window_start = next(sub_window_starts, None)
+            if next_sub_window_start is not None:
+                futures.append(executor.submit(_search_sub_window, next_sub_window_start))
+    events.sort(key=lambda event: (event["timestamp"], event["logStreamName"]))
+    return events[:limit] if limit else events
@@ -9,10 +9,10 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
 import logging
-import time
 from abc import ABCMeta, abstractmethod
 from datetime import datetime, timezone
 from enum import Enum
+from typing import List
 
 from boto3.dynamodb.conditions import Attr
 from pkg_resources import packaging
@@ -20,6 +20,7 @@ from pkg_resources import packaging
 from pcluster.aws.aws_api import AWSApi
 from pcluster.aws.common import AWSClientError
 from pcluster.constants import PCLUSTER_DYNAMODB_PREFIX
+from pcluster.utils import poll
 
 LOGGER = logging.getLogger(__name__)
 
@@ -79,18 +80,17 @@ class ComputeFleetStatusManager(metaclass=ABCMeta):
         status, _ = self.get_status_with_last_updated_time(status_fallback=fallback)
         return status
 
-    def _wait_for_status_transition(self, wait_on_status, timeout=300, retry_every_seconds=15):
-        current_status = self.get_status()
-        start_time = time.time()
-        while current_status == wait_on_status and not self._timeout_expired(start_time, timeout):
-            current_status = self.get_status()
-            time.sleep(retry_every_seconds)
-
-        if current_status == wait_on_status:
+    def _wait_for_status_transition(self, wait_on_status, timeout=300, max_interval=15):
+        try:
+            return poll(
+                self.get_status,
+                until=lambda status: status != wait_on_status,
+                timeout=timeout,
+                max_interval=max_interval,
+            )
+        except TimeoutError:
             raise TimeoutError("Timeout expired while waiting for status transition.")
 
-        return current_status
-
     def update_status(self, request_status, in_progress_status, final_status, wait_transition=False):
         """
         Update the status of the compute fleet and wait for a status transition.
@@ -143,6 +143,44 @@ class ComputeFleetStatusManager(metaclass=ABCMeta):
         """Get compute fleet status and the last compute fleet status updated time."""
         pass
 
+    @abstractmethod
+    def _get_db_key(self):
+        """Return the key of the compute fleet status item in the DB table."""
+        pass
+
+    @abstractmethod
+    def _parse_status_item(self, compute_fleet_item):
+        """Return compute fleet status and last updated time from the item read from the DB table."""
+        pass
+
+    @staticmethod
+    def get_statuses(
+        managers: List["ComputeFleetStatusManager"], ddb_resource=None, fallback=ComputeFleetStatus.UNKNOWN
+    ) -> List[ComputeFleetStatus]:
+        """
+        Get the compute fleet status of multiple clusters, retrieving all the status items with batched calls.
+
+        :param ddb_resource: DynamoDB resource to use, the one of the region in use if not specified.
+        """
+        try:
+            items = (ddb_resource or AWSApi.instance().ddb_resource).batch_get_items(
+                {manager._table_name: [manager._get_db_key()] for manager in managers}
+            )
+        except AWSClientError as e:
+            LOGGER.warning("Failed when retrieving fleet statuses from DynamoDB with error %s", e)
+            return [fallback] * len(managers)
+
+        statuses = []
+        for manager in managers:
+            try:
+                table_items = items.get(manager._table_name)
+                status, _ = manager._parse_status_item({"Item": table_items[0]} if table_items else None)
+            except Exception as e:
+                LOGGER.warning("Failed when parsing fleet status of table %s with error %s", manager._table_name, e)
+                status = fallback
+            statuses.append(status)
+        return statuses
+
     @staticmethod
     def get_manager(cluster_name, version, scheduler):
         """Return compute fleet status manager based on version and plugin."""
@@ -151,10 +189,6 @@ class ComputeFleetStatusManager(metaclass=ABCMeta):
         else:
             return JsonComputeFleetStatusManager(cluster_name)
 
-    @staticmethod
-    def _timeout_expired(start_time, timeout):
-        return (time.time() - start_time) > timeout
-
 
 class JsonComputeFleetStatusManager(ComputeFleetStatusManager):
     """
@@ -185,15 +219,8 @@ class JsonComputeFleetStatusManager(ComputeFleetStatusManager):
     ):
         """Get compute fleet status and the last compute fleet status updated time."""
         try:
-            compute_fleet_item = AWSApi.instance().ddb_resource.get_item(self._table_name, {"Id": self.DB_KEY})
-            if not compute_fleet_item or "Item" not in compute_fleet_item:
-                raise Exception("COMPUTE_FLEET data not found in db table")
-            return (
-                ComputeFleetStatus(
-                    compute_fleet_item["Item"].get(self.DB_DATA).get(self.COMPUTE_FLEET_STATUS_ATTRIBUTE)
-                ),
-                compute_fleet_item["Item"].get(self.DB_DATA).get(self.COMPUTE_FLEET_LAST_UPDATED_TIME_ATTRIBUTE),
-            )
+            compute_fleet_item = AWSApi.instance().ddb_resource.get_item(self._table_name, self._get_db_key())
+            return self._parse_status_item(compute_fleet_item)
         except Exception as e:
             LOGGER.warning(
                 "Failed when retrieving fleet status from DynamoDB with error %s. "
@@ -202,6 +229,19 @@ class JsonComputeFleetStatusManager(ComputeFleetStatusManager):
             )
             return status_fallback, last_updated_time_fallback
 
+    def _get_db_key(self):
+        """Return the key of the compute fleet status item in the DB table."""
+        return {"Id": self.DB_KEY}
+
+    def _parse_status_item(self, compute_fleet_item):
+        """Return compute fleet status and last updated time from the item read from the DB table."""
+        if not compute_fleet_item or "Item" not in compute_fleet_item:
+            raise Exception("COMPUTE_FLEET data not found in db table")
+        return (
+            ComputeFleetStatus(compute_fleet_item["Item"].get(self.DB_DATA).get(self.COMPUTE_FLEET_STATUS_ATTRIBUTE)),
+            compute_fleet_item["Item"].get(self.DB_DATA).get(self.COMPUTE_FLEET_LAST_UPDATED_TIME_ATTRIBUTE),
+        )
+
     def _put_status(self, current_status, next_status):
         """Set compute fleet status on DB."""
         try:
@@ -248,15 +288,8 @@ class PlainTextComputeFleetStatusManager(ComputeFleetStatusManager):
     ):
         """Get compute fleet status and the last compute fleet status updated time."""
         try:
-            compute_fleet_status = AWSApi.instance().ddb_resource.get_item(
-                self._table_name, {"Id": self.COMPUTE_FLEET_STATUS_KEY}
-            )
-            if not compute_fleet_status or "Item" not in compute_fleet_status:
-                raise Exception("COMPUTE_FLEET status not found in db table")
-            return (
-                ComputeFleetStatus(compute_fleet_status["Item"][self.COMPUTE_FLEET_STATUS_ATTRIBUTE]),
-                compute_fleet_status["Item"].get(self.LAST_UPDATED_TIME_ATTRIBUTE),
-            )
+            compute_fleet_status = AWSApi.instance().ddb_resource.get_item(self._table_name, self._get_db_key())
+            return self._parse_status_item(compute_fleet_status)
         except Exception as e:
             LOGGER.warning(
                 "Failed when retrieving fleet status from DynamoDB with error %s. "
@@ -265,6 +298,19 @@ class PlainTextComputeFleetStatusManager(ComputeFleetStatusManager):
             )
             return status_fallback, last_updated_time_fallback
 
+    def _get_db_key(self):
+        """Return the key of the compute fleet status item in the DB table."""
+        return {"Id": self.COMPUTE_FLEET_STATUS_KEY}
+
+    def _parse_status_item(self, compute_fleet_item):
+        """Return compute fleet status and last updated time from the item read from the DB table."""
+        if not compute_fleet_item or "Item" not in compute_fleet_item:
+            raise Exception("COMPUTE_FLEET status not found in db table")
+        return (
+            ComputeFleetStatus(compute_fleet_item["Item"][self.COMPUTE_FLEET_STATUS_ATTRIBUTE]),
+            compute_fleet_item["Item"].get(self.LAST_UPDATED_TIME_ATTRIBUTE),
+        )
+
     def _put_status(self, current_status, next_status):
         """Set compute fleet status on DB."""
         try:
@@ -51,17 +51,16 @@ from pcluster.constants import (
 from pcluster.models.cluster_resources import FiltersParserError
 from pcluster.models.common import (
     BadRequest,
-    CloudWatchLogsExporter,
     Conflict,
     LimitExceeded,
     LogGroupTimeFiltersParser,
+    LogsArchive,
     LogStream,
     LogStreams,
     NotFound,
-    create_logs_archive,
+    create_logs_exporter,
     export_stack_events,
     parse_config,
-    upload_archive,
 )
 from pcluster.models.imagebuilder_resources import (
     BadRequestStackError,
@@ -701,36 +700,37 @@ class ImageBuilder:
                 root_archive_dir = os.path.join(output_tempdir, archive_name)
                 os.makedirs(root_archive_dir, exist_ok=True)
 
-                if AWSApi.instance().logs.log_group_exists(self._log_group_name):
-                    # Export logs from CloudWatch
-                    export_logs_filters = self._init_export_logs_filters(start_time, end_time)
-                    logs_exporter = CloudWatchLogsExporter(
-                        resource_id=self.image_id,
-                        log_group_name=self._log_group_name,
-                        bucket=bucket,
-                        output_dir=root_archive_dir,
-                        bucket_prefix=bucket_prefix,
-                        keep_s3_objects=keep_s3_objects,
-                    )
-                    logs_exporter.execute(
-                        start_time=export_logs_filters.start_time, end_time=export_logs_filters.end_time
-                    )
-                else:
-                    LOGGER.info(
-                        "Log streams not yet available for %s, only CFN Stack events will be exported.", {self.image_id}
-                    )
+                with LogsArchive(root_archive_dir, output_file, bucket, bucket_prefix) as logs_archive:
+                    if AWSApi.instance().logs.log_group_exists(self._log_group_name):
+                        # Export logs from CloudWatch
+                        export_logs_filters = self._init_export_logs_filters(start_time, end_time)
+                        logs_exporter = create_logs_exporter(
+                            resource_id=self.image_id,
+                            log_group_name=self._log_group_name,
+                            bucket=bucket,
+                            output_dir=root_archive_dir,
+                            bucket_prefix=bucket_prefix,
+                            keep_s3_objects=keep_s3_objects,
+                            start_time=export_logs_filters.start_time,
+                            end_time=export_logs_filters.end_time,
+                            archive=logs_archive,
+                        )
+                        logs_exporter.execute(
+                            start_time=export_logs_filters.start_time, end_time=export_logs_filters.end_time
+                        )
+                    else:
+                        LOGGER.info(
+                            "Log streams not yet available for %s, only CFN Stack events will be exported.",
+                            {self.image_id},
+                        )
 
-                if stack_exists:
-                    # Get stack events and write them into a file
-                    stack_events_file = os.path.join(root_archive_dir, self._stack_events_stream_name)
-                    export_stack_events(self.stack.name, stack_events_file)
+                    if stack_exists:
+                        # Get stack events and write them into a file
+                        stack_events_file = os.path.join(root_archive_dir, self._stack_events_stream_name)
+                        export_stack_events(self.stack.name, stack_events_file)
+                        logs_archive.add(stack_events_file)
 
-                archive_path = create_logs_archive(root_archive_dir, output_file)
-                if output_file:
-                    return output_file
-                else:
-                    s3_path = upload_archive(bucket, bucket_prefix, archive_path)
-                    return create_s3_presigned_url(s3_path)
+                return output_file if output_file else create_s3_presigned_url(logs_archive.path)
         except Exception as e:
             raise ImageBuilderActionError(f"Unexpected error when exporting image's logs: {e}")
 
@@ -14,6 +14,7 @@
 #
 from pcluster.aws.aws_api import AWSApi
 from pcluster.aws.aws_resources import StackInfo
+from pcluster.aws.cfn import CfnClient
 from pcluster.aws.common import AWSClientError
 from pcluster.constants import (
     PCLUSTER_IMAGE_BUILD_LOG_TAG,
@@ -57,11 +58,11 @@ class BadRequestStackError(StackError, BadRequest):
 class ImageBuilderStack(StackInfo):
     """Class representing a running stack associated to a building image."""
 
-    def __init__(self, stack_data: dict):
-        """Init stack info."""
+    def __init__(self, stack_data: dict, cfn: CfnClient = None):
+        """Init stack info, retrieving the stack resources with the given client or the one of the region in use."""
         super().__init__(stack_data)
         try:
-            self._imagebuilder_image_resource = AWSApi.instance().cfn.describe_stack_resource(
+            self._imagebuilder_image_resource = (cfn or AWSApi.instance().cfn).describe_stack_resource(
                 self.name, "ParallelClusterImage"
             )
         except AWSClientError:
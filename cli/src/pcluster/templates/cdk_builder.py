@@ -18,7 +18,7 @@ import tempfile
 from pcluster.config.cluster_config import BaseClusterConfig
 from pcluster.config.imagebuilder_config import ImageBuilderConfig
 from pcluster.models.s3_bucket import S3Bucket
-from pcluster.utils import load_yaml_dict
+from pcluster.utils import load_json_dict
 
 
 class CDKTemplateBuilder:
@@ -38,7 +38,7 @@ class CDKTemplateBuilder:
             app = App(outdir=str(tempdir))
             ClusterCdkStack(app, output_file, stack_name, cluster_config, bucket, log_group_name)
             app.synth()
-            generated_template = load_yaml_dict(os.path.join(tempdir, f"{output_file}.template.json"))
+            generated_template = load_json_dict(os.path.join(tempdir, f"{output_file}.template.json"))
 
         return generated_template
 
@@ -54,6 +54,25 @@ class CDKTemplateBuilder:
             app = App(outdir=str(tempdir))
             ImageBuilderCdkStack(app, output_file, image_config, image_id, bucket)
             app.synth()
-            generated_template = load_yaml_dict(os.path.join(tempdir, f"{output_file}.template.json"))
+            generated_template = load_json_dict(os.path.join(tempdir, f"{output_file}.template.json"))
 
         return generated_template
+
+    @staticmethod
+    def warm_up():
+        """
+        Load the CDK libraries used to build the templates and start the jsii runtime.
+
+        The jsii runtime is a Node.js process kept alive for the whole life of the Python process, so long-running
+        processes like the API can pay its startup once rather than at the first template built by each request.
+        """
+        from aws_cdk.core import App, Stack  # pylint: disable=C0415
+
+        import pcluster.templates.cluster_stack  # noqa: F401 pylint: disable=C0415,W0611
+        import pcluster.templates.imagebuilder_stack  # noqa: F401 pylint: disable=C0415,W0611
+
+        # Synthesize an empty stack to load the code paths of the synthesis in the jsii runtime
+        with tempfile.TemporaryDirectory() as tempdir:
+            app = App(outdir=str(tempdir))
+            Stack(app, "WarmUp")
+            app.synth()
@@ -10,6 +10,7 @@
 # limitations under the License.
 import abc
 import hashlib
+import json
 from hashlib import sha1
 from typing import List, Union
 
@@ -21,6 +22,7 @@ from aws_cdk import aws_logs as logs
 from aws_cdk.aws_iam import ManagedPolicy, PermissionsBoundary
 from aws_cdk.core import CfnDeletionPolicy, CfnTag, Construct, Fn, Stack
 
+from pcluster.aws.common import Cache
 from pcluster.config.cluster_config import (
     BaseClusterConfig,
     BaseComputeResource,
@@ -62,8 +64,9 @@ def create_hash_suffix(string_to_hash: str):
     )
 
 
+@Cache.cached
 def get_user_data_content(user_data_path: str):
-    """Retrieve user data content."""
+    """Retrieve user data content, the file is read once and then served from the cache."""
     user_data_file_path = pkg_resources.resource_filename(__name__, user_data_path)
     with open(user_data_file_path, "r", encoding="utf-8") as user_data_file:
         user_data_content = user_data_file.read()
@@ -899,6 +902,33 @@ class PclusterLambdaConstruct(Construct):
 class CdkLaunchTemplateBuilder(_LaunchTemplateBuilder):
     """Concrete class for building a CDK launch template."""
 
+    def __init__(self):
+        self._user_data = {}
+        self._user_data_renders = 0
+        self._deduplicated_user_data_renders = 0
+
+    def get_user_data(self, user_data_path: str, variables: dict):
+        """
+        Return the base64 encoded user data rendered from the given file with the given variables.
+
+        The rendered user data are shared by the launch templates of the builder, so that identical renders
+        reuse the same CFN intrinsic rather than building it again.
+        """
+        key = (user_data_path, json.dumps(variables, sort_keys=True, default=str))
+        self._user_data_renders += 1
+        if key in self._user_data:
+            self._deduplicated_user_data_renders += 1
+        else:
+            self._user_data[key] = Fn.base64(Fn.sub(get_user_data_content(user_data_path), variables))
+        return self._user_data[key]
+
+    def get_user_data_stats(self):
+        """Return a dict with the number of user data renders and how many of them were deduplicated."""
+        return {
+            "renders": self._user_data_renders,
+            "deduplicated_renders": self._deduplicated_user_data_renders,
+        }
+
     def _block_device_mapping_for_ebs(self, device_name, volume):
         return ec2.CfnLaunchTemplate.BlockDeviceMappingProperty(
             device_name=device_name,
@@ -15,6 +15,7 @@
 # This module contains all the classes required to convert a Cluster into a CFN template by using CDK.
 #
 import json
+import logging
 from collections import defaultdict, namedtuple
 from datetime import datetime
 from typing import Dict, List, Union
@@ -94,13 +95,14 @@ from pcluster.templates.cdk_builder_utils import (
     get_queue_security_groups_full,
     get_shared_storage_ids_by_type,
     get_slurm_specific_dna_json_for_head_node,
-    get_user_data_content,
     to_comma_separated_string,
 )
 from pcluster.templates.cw_dashboard_builder import CWDashboardConstruct
 from pcluster.templates.slurm_builder import SlurmConstruct
 from pcluster.utils import get_attr, get_http_tokens_setting, join_shell_args
 
+LOGGER = logging.getLogger(__name__)
+
 StorageInfo = namedtuple("StorageInfo", ["id", "config"])
 
 
@@ -145,6 +147,7 @@ class ClusterCdkStack:
             apply_permissions_boundary(cluster_config.iam.permissions_boundary, self)
         except AttributeError:
             pass
+        LOGGER.debug("User data renders: %s", self._launch_template_builder.get_user_data_stats())
 
     # -- Utility methods --------------------------------------------------------------------------------------------- #
 
@@ -383,6 +386,7 @@ class ClusterCdkStack:
                 cluster_hosted_zone=self.scheduler_resources.cluster_hosted_zone if self.scheduler_resources else None,
                 dynamodb_table=self.scheduler_resources.dynamodb_table if self.scheduler_resources else None,
                 head_eni=self._head_eni,
+                launch_template_builder=self._launch_template_builder,
             )
         self._add_scheduler_plugin_substack()
 
@@ -933,18 +937,16 @@ class ClusterCdkStack:
                 metadata_options=ec2.CfnLaunchTemplate.MetadataOptionsProperty(
                     http_tokens=get_http_tokens_setting(self.config.imds.imds_support)
                 ),
-                user_data=Fn.base64(
-                    Fn.sub(
-                        get_user_data_content("../resources/head_node/user_data.sh"),
-                        {
-                            **{
-                                "DisableMultiThreadingManually": "true"
-                                if head_node.disable_simultaneous_multithreading_manually
-                                else "false",
-                            },
-                            **get_common_user_data_env(head_node, self.config),
+                user_data=self._launch_template_builder.get_user_data(
+                    "../resources/head_node/user_data.sh",
+                    {
+                        **{
+                            "DisableMultiThreadingManually": "true"
+                            if head_node.disable_simultaneous_multithreading_manually
+                            else "false",
                         },
-                    )
+                        **get_common_user_data_env(head_node, self.config),
+                    },
                 ),
                 tag_specifications=[
                     ec2.CfnLaunchTemplate.TagSpecificationProperty(
@@ -1364,6 +1366,7 @@ class ComputeFleetConstruct(Construct):
         cluster_hosted_zone,
         dynamodb_table,
         head_eni,
+        launch_template_builder: CdkLaunchTemplateBuilder = None,
     ):
         super().__init__(scope, id)
         self._cleanup_lambda = cleanup_lambda
@@ -1378,7 +1381,7 @@ class ComputeFleetConstruct(Construct):
         self._dynamodb_table = dynamodb_table
         self._compute_node_instance_profiles = compute_node_instance_profiles
         self._head_eni = head_eni
-        self._launch_template_builder = CdkLaunchTemplateBuilder()
+        self._launch_template_builder = launch_template_builder or CdkLaunchTemplateBuilder()
         self._add_resources()
 
     # -- Utility methods --------------------------------------------------------------------------------------------- #
@@ -1450,37 +1453,144 @@ class ComputeFleetConstruct(Construct):
         return managed_placement_groups[placement_group_key].ref if managed else placement_group_key
 
     def _add_launch_templates(self, managed_placement_groups, instance_profiles):
+        # The parts of the launch templates that do not depend on the compute resource are prepared once per cluster
+        # and once per queue, rather than for each compute resource
+        cluster_user_data_variables = self._get_cluster_user_data_variables()
+        custom_tags = get_custom_tags(self._config)
+        volume_tags = get_default_volume_tags(self.stack_name, "Compute")
+        instance_tags = {}
         compute_launch_templates = {}
         for queue in self._config.scheduling.queues:
             compute_launch_templates[queue.name] = {}
-            queue_lt_security_groups = get_queue_security_groups_full(self._compute_security_group, queue)
-            queue_pre_install_action, queue_post_install_action = (None, None)
-            if queue.custom_actions:
-                queue_pre_install_action = queue.custom_actions.on_node_start
-                queue_post_install_action = queue.custom_actions.on_node_configured
+            queue_settings = {
+                "user_data_variables": {
+                    **cluster_user_data_variables,
+                    **self._get_queue_user_data_variables(queue),
+                    **get_common_user_data_env(queue, self._config),
+                },
+                "security_groups": get_queue_security_groups_full(self._compute_security_group, queue),
+                "block_device_mappings": self._launch_template_builder.get_block_device_mappings(
+                    queue.compute_settings.local_storage.root_volume, self._config.image.os
+                ),
+                "queue_tags": [CfnTag(key=PCLUSTER_QUEUE_NAME_TAG, value=queue.name)],
+            }
 
             for resource in queue.compute_resources:
+                # Default instance tags only differ by the architecture and the EFA settings of the compute resource
+                instance_tags_key = (
+                    getattr(resource, "architecture", None),
+                    bool(getattr(resource, "efa", None) and resource.efa.enabled),
+                )
+                if instance_tags_key not in instance_tags:
+                    instance_tags[instance_tags_key] = get_default_instance_tags(
+                        self.stack_name, self._config, resource, "Compute", self._shared_storage_infos
+                    )
                 compute_launch_templates[queue.name][resource.name] = self._add_compute_resource_launch_template(
                     queue,
                     resource,
-                    queue_pre_install_action,
-                    queue_post_install_action,
-                    queue_lt_security_groups,
+                    queue_settings,
+                    instance_tags[instance_tags_key],
+                    volume_tags,
+                    custom_tags,
                     self._get_placement_group_for_compute_resource(queue, managed_placement_groups, resource),
                     instance_profiles,
                 )
         return compute_launch_templates
 
+    def _get_cluster_user_data_variables(self):
+        """Return the user data variables of the compute nodes that are the same for all the queues."""
+        return {
+            "RAIDSharedDir": to_comma_separated_string(self._shared_storage_mount_dirs[SharedStorageType.RAID]),
+            "RAIDType": to_comma_separated_string(self._shared_storage_attributes[SharedStorageType.RAID]["Type"]),
+            "BaseOS": self._config.image.os,
+            "EFSIds": get_shared_storage_ids_by_type(self._shared_storage_infos, SharedStorageType.EFS),
+            "EFSSharedDirs": to_comma_separated_string(self._shared_storage_mount_dirs[SharedStorageType.EFS]),
+            "EFSEncryptionInTransits": to_comma_separated_string(
+                self._shared_storage_attributes[SharedStorageType.EFS]["EncryptionInTransits"],
+                use_lower_case=True,
+            ),
+            "EFSIamAuthorizations": to_comma_separated_string(
+                self._shared_storage_attributes[SharedStorageType.EFS]["IamAuthorizations"],
+                use_lower_case=True,
+            ),
+            "FSXIds": get_shared_storage_ids_by_type(self._shared_storage_infos, SharedStorageType.FSX),
+            "FSXMountNames": to_comma_separated_string(
+                self._shared_storage_attributes[SharedStorageType.FSX]["MountNames"]
+            ),
+            "FSXDNSNames": to_comma_separated_string(
+                self._shared_storage_attributes[SharedStorageType.FSX]["DNSNames"]
+            ),
+            "FSXVolumeJunctionPaths": to_comma_separated_string(
+                self._shared_storage_attributes[SharedStorageType.FSX]["VolumeJunctionPaths"]
+            ),
+            "FSXFileSystemTypes": to_comma_separated_string(
+                self._shared_storage_attributes[SharedStorageType.FSX]["FileSystemTypes"]
+            ),
+            "FSXSharedDirs": to_comma_separated_string(self._shared_storage_mount_dirs[SharedStorageType.FSX]),
+            "Scheduler": self._config.scheduling.scheduler,
+            "EbsSharedDirs": to_comma_separated_string(self._shared_storage_mount_dirs[SharedStorageType.EBS]),
+            "ClusterDNSDomain": str(self._cluster_hosted_zone.name) if self._cluster_hosted_zone else "",
+            "ClusterHostedZone": str(self._cluster_hosted_zone.ref) if self._cluster_hosted_zone else "",
+            "OSUser": OS_MAPPING[self._config.image.os]["user"],
+            "SlurmDynamoDBTable": self._dynamodb_table.ref if self._dynamodb_table else "NONE",
+            "LogGroupName": self._log_group.log_group_name
+            if self._config.monitoring.logs.cloud_watch.enabled
+            else "NONE",
+            "IntelHPCPlatform": "true" if self._config.is_intel_hpc_platform_enabled else "false",
+            "CWLoggingEnabled": "true" if self._config.is_cw_logging_enabled else "false",
+            "CustomNodePackage": self._config.custom_node_package or "",
+            "CustomAwsBatchCliPackage": self._config.custom_aws_batch_cli_package or "",
+            "ExtraJson": self._config.extra_chef_attributes,
+            "UsePrivateHostname": str(
+                get_attr(self._config, "scheduling.settings.dns.use_ec2_hostnames", default=False)
+            ).lower(),
+            "HeadNodePrivateIp": self._head_eni.attr_primary_private_ip_address,
+            "DirectoryServiceEnabled": str(self._config.directory_service is not None).lower(),
+            "Timeout": str(
+                get_attr(
+                    self._config,
+                    "dev_settings.timeouts.compute_node_bootstrap_timeout",
+                    NODE_BOOTSTRAP_TIMEOUT,
+                )
+            ),
+        }
+
+    @staticmethod
+    def _get_queue_user_data_variables(queue):
+        """Return the user data variables of the compute nodes that are the same for all the compute resources."""
+        queue_pre_install_action, queue_post_install_action = (None, None)
+        if queue.custom_actions:
+            queue_pre_install_action = queue.custom_actions.on_node_start
+            queue_post_install_action = queue.custom_actions.on_node_configured
+
+        return {
+            "PreInstallScript": queue_pre_install_action.script if queue_pre_install_action else "NONE",
+            "PreInstallArgs": join_shell_args(queue_pre_install_action.args)
+            if queue_pre_install_action and queue_pre_install_action.args
+            else "NONE",
+            "PostInstallScript": queue_post_install_action.script if queue_post_install_action else "NONE",
+            "PostInstallArgs": join_shell_args(queue_post_install_action.args)
+            if queue_post_install_action and queue_post_install_action.args
+            else "NONE",
+            "EphemeralDir": queue.compute_settings.local_storage.ephemeral_volume.mount_dir
+            if isinstance(queue, (SlurmQueue, SchedulerPluginQueue))
+            and queue.compute_settings.local_storage.ephemeral_volume
+            else DEFAULT_EPHEMERAL_DIR,
+            "QueueName": queue.name,
+        }
+
     def _add_compute_resource_launch_template(
         self,
         queue,
         compute_resource,
-        queue_pre_install_action,
-        queue_post_install_action,
-        queue_lt_security_groups,
+        queue_settings,
+        instance_tags,
+        volume_tags,
+        custom_tags,
         placement_group,
         instance_profiles,
     ):
+        queue_lt_security_groups = queue_settings["security_groups"]
         # LT network interfaces
         compute_lt_nw_interfaces = [
             ec2.CfnLaunchTemplate.NetworkInterfaceProperty(
@@ -1515,14 +1625,13 @@ class ComputeFleetConstruct(Construct):
         if isinstance(compute_resource, SlurmComputeResource):
             conditional_template_properties.update({"instance_type": compute_resource.instance_type})
 
+        compute_resource_tags = [CfnTag(key=PCLUSTER_COMPUTE_RESOURCE_NAME_TAG, value=compute_resource.name)]
         return ec2.CfnLaunchTemplate(
             self,
             f"LaunchTemplate{create_hash_suffix(queue.name + compute_resource.name)}",
             launch_template_name=f"{self.stack_name}-{queue.name}-{compute_resource.name}",
             launch_template_data=ec2.CfnLaunchTemplate.LaunchTemplateDataProperty(
-                block_device_mappings=self._launch_template_builder.get_block_device_mappings(
-                    queue.compute_settings.local_storage.root_volume, self._config.image.os
-                ),
+                block_device_mappings=queue_settings["block_device_mappings"],
                 # key_name=,
                 network_interfaces=compute_lt_nw_interfaces,
                 placement=ec2.CfnLaunchTemplate.PlacementProperty(group_name=placement_group),
@@ -1541,129 +1650,29 @@ class ComputeFleetConstruct(Construct):
                 metadata_options=ec2.CfnLaunchTemplate.MetadataOptionsProperty(
                     http_tokens=get_http_tokens_setting(self._config.imds.imds_support)
                 ),
-                user_data=Fn.base64(
-                    Fn.sub(
-                        get_user_data_content("../resources/compute_node/user_data.sh"),
-                        {
-                            **{
-                                "EnableEfa": "efa" if compute_resource.efa and compute_resource.efa.enabled else "NONE",
-                                "RAIDSharedDir": to_comma_separated_string(
-                                    self._shared_storage_mount_dirs[SharedStorageType.RAID]
-                                ),
-                                "RAIDType": to_comma_separated_string(
-                                    self._shared_storage_attributes[SharedStorageType.RAID]["Type"]
-                                ),
-                                "DisableMultiThreadingManually": "true"
-                                if compute_resource.disable_simultaneous_multithreading_manually
-                                else "false",
-                                "BaseOS": self._config.image.os,
-                                "PreInstallScript": queue_pre_install_action.script
-                                if queue_pre_install_action
-                                else "NONE",
-                                "PreInstallArgs": join_shell_args(queue_pre_install_action.args)
-                                if queue_pre_install_action and queue_pre_install_action.args
-                                else "NONE",
-                                "PostInstallScript": queue_post_install_action.script
-                                if queue_post_install_action
-                                else "NONE",
-                                "PostInstallArgs": join_shell_args(queue_post_install_action.args)
-                                if queue_post_install_action and queue_post_install_action.args
-                                else "NONE",
-                                "EFSIds": get_shared_storage_ids_by_type(
-                                    self._shared_storage_infos, SharedStorageType.EFS
-                                ),
-                                "EFSSharedDirs": to_comma_separated_string(
-                                    self._shared_storage_mount_dirs[SharedStorageType.EFS]
-                                ),
-                                "EFSEncryptionInTransits": to_comma_separated_string(
-                                    self._shared_storage_attributes[SharedStorageType.EFS]["EncryptionInTransits"],
-                                    use_lower_case=True,
-                                ),
-                                "EFSIamAuthorizations": to_comma_separated_string(
-                                    self._shared_storage_attributes[SharedStorageType.EFS]["IamAuthorizations"],
-                                    use_lower_case=True,
-                                ),
-                                "FSXIds": get_shared_storage_ids_by_type(
-                                    self._shared_storage_infos, SharedStorageType.FSX
-                                ),
-                                "FSXMountNames": to_comma_separated_string(
-                                    self._shared_storage_attributes[SharedStorageType.FSX]["MountNames"]
-                                ),
-                                "FSXDNSNames": to_comma_separated_string(
-                                    self._shared_storage_attributes[SharedStorageType.FSX]["DNSNames"]
-                                ),
-                                "FSXVolumeJunctionPaths": to_comma_separated_string(
-                                    self._shared_storage_attributes[SharedStorageType.FSX]["VolumeJunctionPaths"]
-                                ),
-                                "FSXFileSystemTypes": to_comma_separated_string(
-                                    self._shared_storage_attributes[SharedStorageType.FSX]["FileSystemTypes"]
-                                ),
-                                "FSXSharedDirs": to_comma_separated_string(
-                                    self._shared_storage_mount_dirs[SharedStorageType.FSX]
-                                ),
-                                "Scheduler": self._config.scheduling.scheduler,
-                                "EphemeralDir": queue.compute_settings.local_storage.ephemeral_volume.mount_dir
-                                if isinstance(queue, (SlurmQueue, SchedulerPluginQueue))
-                                and queue.compute_settings.local_storage.ephemeral_volume
-                                else DEFAULT_EPHEMERAL_DIR,
-                                "EbsSharedDirs": to_comma_separated_string(
-                                    self._shared_storage_mount_dirs[SharedStorageType.EBS]
-                                ),
-                                "ClusterDNSDomain": str(self._cluster_hosted_zone.name)
-                                if self._cluster_hosted_zone
-                                else "",
-                                "ClusterHostedZone": str(self._cluster_hosted_zone.ref)
-                                if self._cluster_hosted_zone
-                                else "",
-                                "OSUser": OS_MAPPING[self._config.image.os]["user"],
-                                "SlurmDynamoDBTable": self._dynamodb_table.ref if self._dynamodb_table else "NONE",
-                                "LogGroupName": self._log_group.log_group_name
-                                if self._config.monitoring.logs.cloud_watch.enabled
-                                else "NONE",
-                                "IntelHPCPlatform": "true" if self._config.is_intel_hpc_platform_enabled else "false",
-                                "CWLoggingEnabled": "true" if self._config.is_cw_logging_enabled else "false",
-                                "QueueName": queue.name,
-                                "ComputeResourceName": compute_resource.name,
-                                "EnableEfaGdr": "compute"
-                                if compute_resource.efa and compute_resource.efa.gdr_support
-                                else "NONE",
-                                "CustomNodePackage": self._config.custom_node_package or "",
-                                "CustomAwsBatchCliPackage": self._config.custom_aws_batch_cli_package or "",
-                                "ExtraJson": self._config.extra_chef_attributes,
-                                "UsePrivateHostname": str(
-                                    get_attr(self._config, "scheduling.settings.dns.use_ec2_hostnames", default=False)
-                                ).lower(),
-                                "HeadNodePrivateIp": self._head_eni.attr_primary_private_ip_address,
-                                "DirectoryServiceEnabled": str(self._config.directory_service is not None).lower(),
-                                "Timeout": str(
-                                    get_attr(
-                                        self._config,
-                                        "dev_settings.timeouts.compute_node_bootstrap_timeout",
-                                        NODE_BOOTSTRAP_TIMEOUT,
-                                    )
-                                ),
-                            },
-                            **get_common_user_data_env(queue, self._config),
-                        },
-                    )
+                user_data=self._launch_template_builder.get_user_data(
+                    "../resources/compute_node/user_data.sh",
+                    {
+                        **queue_settings["user_data_variables"],
+                        "EnableEfa": "efa" if compute_resource.efa and compute_resource.efa.enabled else "NONE",
+                        "DisableMultiThreadingManually": "true"
+                        if compute_resource.disable_simultaneous_multithreading_manually
+                        else "false",
+                        "ComputeResourceName": compute_resource.name,
+                        "EnableEfaGdr": "compute"
+                        if compute_resource.efa and compute_resource.efa.gdr_support
+                        else "NONE",
+                    },
                 ),
                 monitoring=ec2.CfnLaunchTemplate.MonitoringProperty(enabled=False),
                 tag_specifications=[
                     ec2.CfnLaunchTemplate.TagSpecificationProperty(
                         resource_type="instance",
-                        tags=get_default_instance_tags(
-                            self.stack_name, self._config, compute_resource, "Compute", self._shared_storage_infos
-                        )
-                        + [CfnTag(key=PCLUSTER_QUEUE_NAME_TAG, value=queue.name)]
-                        + [CfnTag(key=PCLUSTER_COMPUTE_RESOURCE_NAME_TAG, value=compute_resource.name)]
-                        + get_custom_tags(self._config),
+                        tags=instance_tags + queue_settings["queue_tags"] + compute_resource_tags + custom_tags,
                     ),
                     ec2.CfnLaunchTemplate.TagSpecificationProperty(
                         resource_type="volume",
-                        tags=get_default_volume_tags(self.stack_name, "Compute")
-                        + [CfnTag(key=PCLUSTER_QUEUE_NAME_TAG, value=queue.name)]
-                        + [CfnTag(key=PCLUSTER_COMPUTE_RESOURCE_NAME_TAG, value=compute_resource.name)]
-                        + get_custom_tags(self._config),
+                        tags=volume_tags + queue_settings["queue_tags"] + compute_resource_tags + custom_tags,
                     ),
                 ],
                 **conditional_template_properties,
@@ -18,7 +18,6 @@ import re
 import string
 import sys
 import time
-import urllib.request
 import zipfile
 from io import BytesIO
 from shlex import quote
@@ -26,19 +25,30 @@ from typing import NoReturn
 from urllib.parse import urlparse
 
 import dateutil.parser
-import pkg_resources
 import yaml
-from pkg_resources import packaging
 from yaml import SafeLoader
 from yaml.constructor import ConstructorError
 from yaml.resolver import BaseResolver
 
-from pcluster.aws.common import get_region
 from pcluster.constants import SUPPORTED_OSES_FOR_ARCHITECTURE, SUPPORTED_OSES_FOR_SCHEDULER
 
+# For reading package metadata, pkg_resources is not used since it is slow to import
+try:
+    import importlib.metadata as importlib_metadata  # pylint: disable=ungrouped-imports
+except ImportError:
+    import importlib_metadata
+
 LOGGER = logging.getLogger(__name__)
 
 
+def get_region():
+    """Get region used internally for all the AWS calls."""
+    # boto3 is imported only when needed, not to slow down the CLI startup
+    from pcluster.aws.common import get_region as get_aws_region  # pylint: disable=import-outside-toplevel
+
+    return get_aws_region()
+
+
 def get_partition():
     """Get partition for the region set in the environment."""
     return next(("aws-" + partition for partition in ["us-gov", "cn"] if get_region().startswith(partition)), "aws")
@@ -235,6 +245,34 @@ def verify_stack_status(stack_name, waiting_states, successful_states):
     return status in successful_states
 
 
+def poll(func, until, timeout: float = None, initial_interval: float = 1, max_interval: float = 30, backoff_factor=2):
+    """
+    Call func until the until callback is satisfied by its result, waiting an increasing jittered interval in between.
+
+    Polling starts with initial_interval, so that short operations are detected without waiting a full fixed interval,
+    and slows down exponentially up to max_interval, so that long operations do not burn API quota.
+
+    :param func: function returning the value to check
+    :param until: callback receiving the value returned by func, polling stops as soon as it returns True
+    :param timeout: seconds after which TimeoutError is raised, polling never expires if not specified
+    :return: the first value returned by func satisfying the until callback
+    """
+    deadline = time.monotonic() + timeout if timeout is not None else None
+    interval = initial_interval
+    while True:
+        result = func()
+        if until(result):
+            return result
+        delay = random.uniform(interval / 2, interval)
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"Timeout expired after {timeout} seconds.")
+            delay = min(delay, remaining)
+        time.sleep(delay)
+        interval = min(interval * backoff_factor, max_interval)
+
+
 def get_templates_bucket_path():
     """Return a string containing the path of bucket."""
     region = get_region()
@@ -247,12 +285,20 @@ def get_templates_bucket_path():
 
 def get_installed_version(base_version_only: bool = False):
     """Get the version of the installed aws-parallelcluster package."""
-    pkg_distribution = pkg_resources.get_distribution("aws-parallelcluster")
-    return pkg_distribution.version if not base_version_only else pkg_distribution.parsed_version.base_version
+    version = importlib_metadata.version("aws-parallelcluster")
+    if base_version_only:
+        from pkg_resources import packaging  # pylint: disable=import-outside-toplevel
+
+        return packaging.version.parse(version).base_version
+    return version
 
 
 def check_if_latest_version():
     """Check if the current package version is the latest one."""
+    import urllib.request  # pylint: disable=import-outside-toplevel
+
+    from pkg_resources import packaging  # pylint: disable=import-outside-toplevel
+
     try:
         pypi_url = "https://pypi.python.org/pypi/aws-parallelcluster/json"
         with urllib.request.urlopen(pypi_url) as url:  # nosec nosemgrep
@@ -273,6 +319,19 @@ def error(message) -> NoReturn:
     sys.exit(f"ERROR: {message}")
 
 
+def get_cache_dir(create: bool = False):
+    """
+    Return the directory where ParallelCluster caches data across CLI invocations.
+
+    :param create: create the directory if missing, accessible only by the current user (0700)
+    """
+    default_cache_dir = os.path.expanduser(os.path.join("~", ".parallelcluster", "cache"))
+    cache_dir = os.environ.get("PCLUSTER_PERSISTENT_CACHE_DIR", default=default_cache_dir)
+    if create:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+    return cache_dir
+
+
 def get_cli_log_file():
     default_log_file = os.path.expanduser(os.path.join("~", ".parallelcluster", "pcluster-cli.log"))
     return os.environ.get("PCLUSTER_LOG_FILE", default=default_log_file)
@@ -14,7 +14,7 @@ from typing import List
 
 from pcluster.aws.aws_api import AWSApi
 from pcluster.aws.common import get_region
-from pcluster.validators.common import FailureLevel, Validator
+from pcluster.validators.common import AWSResourceType, FailureLevel, Validator
 
 LOGGER = logging.getLogger(__name__)
 
@@ -66,6 +66,8 @@ class AwsBatchComputeInstanceTypeValidator(Validator):
     Validate instance types and max vCPUs combination.
     """
 
+    required_aws_resources = {AWSResourceType.INSTANCE_TYPE: ["instance_types"]}
+
     def _validate(self, instance_types: List[str], max_vcpus: int):
         supported_instances = _get_supported_batch_instance_types()
         if supported_instances:
@@ -159,6 +161,8 @@ class AwsBatchInstancesArchitectureCompatibilityValidator(Validator):
     With AWS Batch, compute instance type can contain a CSV list.
     """
 
+    required_aws_resources = {AWSResourceType.INSTANCE_TYPE: ["instance_types"]}
+
     def _validate(self, instance_types: List[str], architecture: str):
         for instance_type in instance_types:
             # When awsbatch is used as the scheduler instance families can be used.
@@ -42,7 +42,7 @@ from pcluster.utils import (
     get_supported_os_for_scheduler,
     remove_none_values,
 )
-from pcluster.validators.common import FailureLevel, Validator
+from pcluster.validators.common import AWSResourceType, FailureLevel, Validator
 
 # pylint: disable=C0302
 NAME_MAX_LENGTH = 25
@@ -124,6 +124,8 @@ class SchedulerOsValidator(Validator):
 class CustomAmiTagValidator(Validator):
     """Custom AMI tag validator to check if the AMI was created by pcluster to avoid runtime baking."""
 
+    required_aws_resources = {AWSResourceType.IMAGE: ["custom_ami"]}
+
     def _validate(self, custom_ami: str):
         tags = AWSApi.instance().ec2.describe_image(custom_ami).tags
         tags_dict = {}
@@ -303,6 +305,8 @@ class MaxCountValidator(Validator):
 class EfaValidator(Validator):
     """Check if EFA and EFA GDR are supported features in the given instance type."""
 
+    required_aws_resources = {AWSResourceType.INSTANCE_TYPE: ["instance_type"]}
+
     def _validate(self, instance_type, efa_enabled, gdr_support, multiaz_enabled):
 
         instance_type_supports_efa = AWSApi.instance().ec2.get_instance_type_info(instance_type).is_efa_supported()
@@ -343,6 +347,8 @@ class EfaPlacementGroupValidator(Validator):
 class EfaSecurityGroupValidator(Validator):
     """Validate Security Group if EFA is enabled."""
 
+    required_aws_resources = {AWSResourceType.SECURITY_GROUP: ["security_groups", "additional_security_groups"]}
+
     def _validate(self, efa_enabled, security_groups, additional_security_groups):
         if efa_enabled and security_groups:
             # Check security groups associated to the EFA
@@ -480,6 +486,8 @@ class ExistingFsxNetworkingValidator(Validator):
     The reason to have this structure is to make boto3 calls as few as possible.
     """
 
+    required_aws_resources = {AWSResourceType.SUBNET: ["head_node_subnet_id"]}
+
     def _describe_network_interfaces(self, file_systems):
         all_network_interfaces = []
         for file_system in file_systems:
@@ -12,9 +12,22 @@
 # This module contains all the classes representing the Resources objects.
 # These objects are obtained from the configuration file through a conversion based on the Schema classes.
 #
-
+import datetime
+import hashlib
+import json
+import logging
+import threading
+import time
 from abc import ABC, abstractmethod
 from enum import Enum
+from typing import Dict, List, Set, Tuple
+
+from pcluster.aws.aws_api import AWSApi
+from pcluster.aws.common import AWSCallsRecorder, PersistentCache
+from pcluster.aws.ec2 import Ec2Client
+from pcluster.constants import VALIDATION_RESULTS_CACHE_TTL
+
+LOGGER = logging.getLogger(__name__)
 
 
 class FailureLevel(Enum):
@@ -40,9 +53,29 @@ class ValidationResult:
         return f"ValidationResult(level={self.level}, message={self.message})"
 
 
+class AWSResourceType(Enum):
+    """Type of the AWS resources that validators can require to be described before their execution."""
+
+    SUBNET = "Subnet"
+    SECURITY_GROUP = "SecurityGroup"
+    INSTANCE_TYPE = "InstanceType"
+    IMAGE = "Image"
+    CAPACITY_RESERVATION = "CapacityReservation"
+
+    def __str__(self):
+        return str(self.value)
+
+
 class Validator(ABC):
     """Abstract validator. The children must implement the validate method."""
 
+    # Mapping between the type of the AWS resources required by the validator and the names of the validator arguments
+    # containing their ids. Required resources of all validators are described in bulk before executing them.
+    required_aws_resources: Dict[AWSResourceType, List[str]] = {}
+
+    # Time to live in seconds of the results stored in the ValidationResultsCache, 0 to never cache them
+    results_cache_ttl: int = VALIDATION_RESULTS_CACHE_TTL
+
     def __init__(self):
         self._failures = []
 
@@ -55,6 +88,20 @@ class Validator(ABC):
         """Identify the type of validator."""
         return self.__class__.__name__
 
+    def get_required_aws_resources(self, **kwargs) -> Dict[AWSResourceType, Set[str]]:
+        """Return the ids of the AWS resources required to validate the given arguments, grouped by type."""
+        required_resources = {}
+        for resource_type, argument_names in self.required_aws_resources.items():
+            resource_ids = required_resources.setdefault(resource_type, set())
+            for argument_name in argument_names:
+                value = kwargs.get(argument_name)
+                if isinstance(value, str):
+                    resource_ids.add(value)
+                elif isinstance(value, (list, tuple, set)):
+                    resource_ids.update(item for item in value if isinstance(item, str))
+            resource_ids.discard("")
+        return required_resources
+
     def execute(self, *arg, **kwargs):
         """Entry point of all validators to verify all input params are valid."""
         self._validate(*arg, **kwargs)
@@ -66,6 +113,197 @@ class Validator(ABC):
         pass
 
 
+class ValidationProfiler:
+    """
+    Profiler of the validators execution, enabled when debug logging is on.
+
+    For every validator the wall time, the AWS calls by service and operation and the cache hits and misses are
+    recorded. The report of the latest validation is written to the log and kept to be added to the CLI output.
+    """
+
+    _last_report = None
+
+    def __init__(self):
+        self.enabled = LOGGER.isEnabledFor(logging.DEBUG)
+        self._start_time = time.perf_counter()
+
+    def run(self, name: str, function, *args):
+        """Execute the function, returning its result and the profiling record of the execution, if enabled."""
+        if not self.enabled:
+            return function(*args), None
+        start_time = time.perf_counter()
+        with AWSCallsRecorder.record() as stats:
+            result = function(*args)
+        return result, {"name": name, "time": round(time.perf_counter() - start_time, 3), **stats}
+
+    def report(self, prefetch_records: List[Dict], validator_records: List[Dict]):
+        """Build the profiling report, sorting validators from the slowest, and write it to the log."""
+        total_aws_calls = {}
+        for record in prefetch_records + validator_records:
+            for call, count in record["awsCalls"].items():
+                total_aws_calls[call] = total_aws_calls.get(call, 0) + count
+        report = {
+            "totalTime": round(time.perf_counter() - self._start_time, 3),
+            "totalAwsCalls": dict(sorted(total_aws_calls.items())),
+            "prefetch": prefetch_records,
+            "validators": sorted(validator_records, key=lambda record: record["time"], reverse=True),
+        }
+        LOGGER.debug("Validation profiling report:\n%s", json.dumps(report, indent=2))
+        ValidationProfiler._last_report = report
+        return report
+
+    @staticmethod
+    def pop_last_report():
+        """Return the report of the latest profiled validation, if any, and forget it."""
+        report, ValidationProfiler._last_report = ValidationProfiler._last_report, None
+        return report
+
+
+# Cached functions returning the descriptions of the AWS resources, by resource type
+_AWS_RESOURCES_LOOKUPS = {
+    AWSResourceType.SUBNET: Ec2Client.describe_subnets.__qualname__,
+    AWSResourceType.SECURITY_GROUP: Ec2Client.describe_security_groups.__qualname__,
+    AWSResourceType.INSTANCE_TYPE: Ec2Client._describe_instance_type.__qualname__,
+    AWSResourceType.IMAGE: Ec2Client.describe_image.__qualname__,
+    AWSResourceType.CAPACITY_RESERVATION: Ec2Client.describe_capacity_reservations.__qualname__,
+}
+
+
+def _describe_aws_resources(resource_type: AWSResourceType, resource_ids: List[str]):
+    """Return the descriptions of the given AWS resources, found in the AWS clients caches if already described."""
+    ec2 = AWSApi.instance().ec2
+    if resource_type == AWSResourceType.SUBNET:
+        return ec2.describe_subnets(resource_ids)
+    if resource_type == AWSResourceType.SECURITY_GROUP:
+        return ec2.describe_security_groups(resource_ids)
+    if resource_type == AWSResourceType.INSTANCE_TYPE:
+        return [ec2.get_instance_type_info(instance_type) for instance_type in resource_ids]
+    if resource_type == AWSResourceType.IMAGE:
+        return [ec2.describe_image(image_id) for image_id in resource_ids]
+    return ec2.describe_capacity_reservations(resource_ids)
+
+
+class ValidationResultsCache:
+    """
+    Cache of the validators results, persisted across CLI invocations when the PersistentCache is enabled.
+
+    Results are keyed by the validator class, a canonical representation of its arguments and the current description
+    of the AWS resources it requires (see Validator.required_aws_resources), so that results are not reused once those
+    resources change. Results of validators performing other AWS calls depend on the state of AWS resources that is
+    not part of the key, hence they are not stored. Each result is stored in its own PersistentCache entry, namespaced
+    by region, account and ParallelCluster version, and expires after the results_cache_ttl of its validator.
+    """
+
+    # Attributes of the config Resources not describing the configuration
+    _IGNORED_ATTRIBUTES = {"_validators", "_validation_failures", "_Resource__params"}
+    _MAX_DEPTH = 20
+
+    def __init__(self):
+        self.enabled = PersistentCache.is_enabled()
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get_key(self, validator_class, validator_args: dict):
+        """Return the key of the results of the validator, None if they cannot be cached."""
+        if not self.enabled or not validator_class.results_cache_ttl:
+            return None
+        try:
+            key = json.dumps(
+                [f"{validator_class.__module__}.{validator_class.__qualname__}", self._canonicalize(validator_args, 0)],
+                sort_keys=True,
+            )
+        except Exception as e:
+            LOGGER.debug("Unable to compute the cache key of validator %s: %s", validator_class.__name__, e)
+            return None
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def _canonicalize(self, value, depth: int):
+        """Convert the value to a JSON serializable object, raising ValueError if it cannot be represented."""
+        if depth > self._MAX_DEPTH:
+            raise ValueError("maximum depth exceeded")
+        if value is None or isinstance(value, (str, int, float, bool)):
+            return value
+        if isinstance(value, Enum):
+            return [type(value).__qualname__, value.value]
+        if isinstance(value, (datetime.date, datetime.time)):
+            return value.isoformat()
+        if isinstance(value, dict):
+            return {str(key): self._canonicalize(item, depth + 1) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [self._canonicalize(item, depth + 1) for item in value]
+        if isinstance(value, (set, frozenset)):
+            return sorted((self._canonicalize(item, depth + 1) for item in value), key=json.dumps)
+        if hasattr(value, "__dict__"):
+            # Private attributes are part of the key too, since data objects (f.i. ImageInfo) keep their data there
+            attributes = {
+                name: self._canonicalize(item, depth + 1)
+                for name, item in list(vars(value).items())
+                if name not in self._IGNORED_ATTRIBUTES
+            }
+            return [type(value).__qualname__, attributes]
+        raise ValueError(f"unsupported type {type(value).__name__}")
+
+    def add_aws_facts(self, key, validator: "Validator", validator_args: dict):
+        """Return the key extended with the description of the AWS resources required by the validator, if any."""
+        if key is None:
+            return None
+        required_resources = {
+            resource_type: sorted(resource_ids)
+            for resource_type, resource_ids in validator.get_required_aws_resources(**validator_args).items()
+            if resource_ids
+        }
+        if not required_resources:
+            return key
+        try:
+            facts = {
+                str(resource_type): self._canonicalize(_describe_aws_resources(resource_type, resource_ids), 0)
+                for resource_type, resource_ids in required_resources.items()
+            }
+            facts_key = json.dumps([key, facts], sort_keys=True)
+        except Exception as e:
+            # Resources that cannot be described are reported by the validator, whose results are not cached
+            LOGGER.debug("Unable to describe the AWS resources of validator %s: %s", validator.type, e)
+            return None
+        return hashlib.sha256(facts_key.encode("utf-8")).hexdigest()
+
+    def get(self, key) -> Tuple[bool, List[ValidationResult]]:
+        """Return a tuple (found, failures) with the not expired results stored for the given key."""
+        if key is None:
+            return False, None
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            found, entry = PersistentCache.get(ValidationResultsCache, (key,), {})
+            if found:
+                with self._lock:
+                    self._entries[key] = entry
+        found = entry is not None and entry[0] > time.time()
+        AWSCallsRecorder.record_cache_lookup(hit=found)
+        return (True, entry[1]) if found else (False, None)
+
+    def put(self, key, validator_class, failures: List[ValidationResult], stats: dict):
+        """
+        Store the results of the validator for the given key.
+
+        Results are stored only if the validator did not depend on the state of AWS resources other than the ones
+        described in the key, according to the statistics recorded during its execution (see AWSCallsRecorder).
+        """
+        if key is None:
+            return
+        allowed_lookups = {
+            _AWS_RESOURCES_LOOKUPS[resource_type] for resource_type in validator_class.required_aws_resources
+        }
+        if stats["awsCalls"] or stats["cacheLookups"] - allowed_lookups:
+            LOGGER.debug(
+                "Not caching the results of validator %s, depending on AWS resources", validator_class.__name__
+            )
+            return
+        entry = (time.time() + validator_class.results_cache_ttl, failures)
+        with self._lock:
+            self._entries[key] = entry
+        PersistentCache.put(ValidationResultsCache, (key,), {}, entry, validator_class.results_cache_ttl)
+
+
 class ValidatorContext:
     """Context containing information about cluster environment meant to be passed to validators."""
 
@@ -262,6 +262,9 @@ class SharedEbsVolumeIdValidator(Validator):
     Validate the volume exist and is available.
     """
 
+    # The volume state changes while the cluster is created or updated
+    results_cache_ttl = 0
+
     def _validate(self, volume_id: str, head_node_instance_id: str = None):
         if volume_id:
             try:
@@ -17,7 +17,7 @@ from pcluster import imagebuilder_utils
 from pcluster.aws.aws_api import AWSApi
 from pcluster.aws.common import AWSClientError
 from pcluster.utils import get_resource_name_from_resource_arn
-from pcluster.validators.common import FailureLevel, Validator
+from pcluster.validators.common import AWSResourceType, FailureLevel, Validator
 
 LOGGER = logging.getLogger(__name__)
 
@@ -132,6 +132,8 @@ class InstanceTypeMemoryInfoValidator(Validator):
 class InstanceTypeBaseAMICompatibleValidator(Validator):
     """EC2 Instance type and base ami compatibility validator."""
 
+    required_aws_resources = {AWSResourceType.INSTANCE_TYPE: ["instance_type"]}
+
     def _validate(self, instance_type: str, image: str):
         image_info = self._validate_base_ami(image)
         instance_architectures = self._validate_instance_type(instance_type)
@@ -149,7 +151,7 @@ class InstanceTypeBaseAMICompatibleValidator(Validator):
     def _validate_base_ami(self, image: str):
         try:
             ami_id = imagebuilder_utils.get_ami_id(image)
-            image_info = AWSApi.instance().ec2.describe_image(ami_id=ami_id)
+            image_info = AWSApi.instance().ec2.describe_image(ami_id)
             return image_info
         except AWSClientError:
             self._add_failure(f"Invalid image '{image}'.", FailureLevel.ERROR)
@@ -216,6 +218,8 @@ class PlacementGroupNamingValidator(Validator):
 class CapacityTypeValidator(Validator):
     """Compute type validator. Verify that specified compute type is compatible with specified instance type."""
 
+    required_aws_resources = {AWSResourceType.INSTANCE_TYPE: ["instance_type"]}
+
     def _validate(self, capacity_type, instance_type):
         compute_type_value = capacity_type.value.lower()
         supported_usage_classes = AWSApi.instance().ec2.get_instance_type_info(instance_type).supported_usage_classes()
@@ -239,8 +243,10 @@ class AmiOsCompatibleValidator(Validator):
     If image has tag of OS, compare AMI OS with cluster OS, else print out a warning message.
     """
 
+    required_aws_resources = {AWSResourceType.IMAGE: ["image_id"]}
+
     def _validate(self, os: str, image_id: str):
-        image_info = AWSApi.instance().ec2.describe_image(ami_id=image_id)
+        image_info = AWSApi.instance().ec2.describe_image(image_id)
         image_os = image_info.image_os
         if image_os:
             if image_os != os:
@@ -259,6 +265,11 @@ class AmiOsCompatibleValidator(Validator):
 class CapacityReservationValidator(Validator):
     """Validate capacity reservation can be used with the instance type and subnet."""
 
+    required_aws_resources = {
+        AWSResourceType.CAPACITY_RESERVATION: ["capacity_reservation_id"],
+        AWSResourceType.SUBNET: ["subnet"],
+    }
+
     def _validate(self, capacity_reservation_id: str, instance_type: str, subnet: str):
         if capacity_reservation_id:
             if not instance_type:  # If the instance type doesn't exist, this is an invalid config
@@ -13,12 +13,14 @@ from typing import List, Union
 
 from pcluster.aws.aws_api import AWSApi
 from pcluster.aws.common import AWSClientError
-from pcluster.validators.common import FailureLevel, Validator
+from pcluster.validators.common import AWSResourceType, FailureLevel, Validator
 
 
 class SecurityGroupsValidator(Validator):
     """Security groups validator."""
 
+    required_aws_resources = {AWSResourceType.SECURITY_GROUP: ["security_group_ids"]}
+
     def _validate(self, security_group_ids: List[str]):
         if security_group_ids:
             for sg_id in security_group_ids:
@@ -37,6 +39,8 @@ class SubnetsValidator(Validator):
     instances.
     """
 
+    required_aws_resources = {AWSResourceType.SUBNET: ["subnet_ids"]}
+
     def _validate(self, subnet_ids: List[str]):
         try:
             subnets = AWSApi.instance().ec2.describe_subnets(subnet_ids=subnet_ids)
@@ -157,6 +161,11 @@ class MultiAzPlacementGroupValidator(Validator):
 class LambdaFunctionsVpcConfigValidator(Validator):
     """Validator of Pcluster Lambda functions' VPC configuration."""
 
+    required_aws_resources = {
+        AWSResourceType.SECURITY_GROUP: ["security_group_ids"],
+        AWSResourceType.SUBNET: ["subnet_ids"],
+    }
+
     def _validate(self, security_group_ids: List[str], subnet_ids: List[str]):
         existing_security_groups = AWSApi.instance().ec2.describe_security_groups(security_group_ids)
         existing_subnets = AWSApi.instance().ec2.describe_subnets(subnet_ids)
@@ -35,8 +35,18 @@ def clear_env(mocker):
 def reset_aws_api():
     """Reset AWSApi singleton to remove dependencies between tests."""
     from pcluster.aws.aws_api import AWSApi
+    from pcluster.aws.common import Boto3ClientPool
 
     AWSApi._instance = None
+    Boto3ClientPool.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_node_js_validation():
+    """Reset the Node.js validation done once per process to remove dependencies between tests."""
+    from pcluster.api import util
+
+    util._node_js_validated = False
 
 
 @pytest.fixture
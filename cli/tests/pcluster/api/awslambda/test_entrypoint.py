@@ -96,3 +96,20 @@ def test_lambda_handler(apigw_event, lambda_context, mocker):
 
     assert_that(ret["statusCode"]).is_equal_to(200)
     assert_that(data).contains_key("clusters")
+
+
+@pytest.mark.parametrize(
+    "warm_up_cdk, warm_up_error, expected_calls",
+    [(True, None, 1), (True, Exception("error"), 1), (False, None, 0)],
+)
+def test_init_flask_app_warm_up_cdk(mocker, warm_up_cdk, warm_up_error, expected_calls):
+    from pcluster.api.awslambda import entrypoint
+
+    mocker.patch("pcluster.api.awslambda.entrypoint.warm_up_cdk", warm_up_cdk)
+    warm_up_mock = mocker.patch(
+        "pcluster.api.awslambda.entrypoint.CDKTemplateBuilder.warm_up", side_effect=warm_up_error
+    )
+
+    # A failure in the warm-up does not prevent the initialization of the application
+    assert_that(entrypoint._init_flask_app()).is_not_none()
+    assert_that(warm_up_mock.call_count).is_equal_to(expected_calls)
@@ -6,6 +6,7 @@
 #  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 #  limitations under the License.
 import json
+import threading
 from datetime import datetime
 
 import pytest
@@ -815,6 +816,50 @@ class TestDescribeCluster:
             assert_that(response.status_code).is_equal_to(200)
             assert_that(response.get_json()).is_equal_to(expected_response)
 
+    def test_lookups_run_concurrently(self, mocker, client):
+        # Each lookup completes only when all of them are in progress, which can happen only if run concurrently
+        barrier = threading.Barrier(3, timeout=10)
+        # The lookups initializing the bucket and the config of the cluster run on the calling thread
+        lookup_threads = []
+
+        def _wait_for_lookups(return_value):
+            def _lookup(*_, **__):
+                barrier.wait()
+                return return_value
+
+            return _lookup
+
+        def _record_thread(lookup):
+            def _lookup(*args, **kwargs):
+                lookup_threads.append(threading.current_thread())
+                return lookup(*args, **kwargs)
+
+            return _lookup
+
+        mocker.patch(
+            "pcluster.aws.cfn.CfnClient.describe_stack",
+            return_value=cfn_describe_stack_mock_response(
+                {"Parameters": [{"ParameterKey": "Scheduler", "ParameterValue": "slurm"}]}
+            ),
+        )
+        mocker.patch("pcluster.aws.ec2.Ec2Client.describe_instances", side_effect=_wait_for_lookups(([], "")))
+        mocker.patch(
+            "pcluster.models.cluster.Cluster.compute_fleet_status", new_callable=mocker.PropertyMock
+        ).side_effect = _wait_for_lookups(ComputeFleetStatus.RUNNING)
+        mocker.patch(
+            "pcluster.models.cluster.Cluster.config_presigned_url", new_callable=mocker.PropertyMock
+        ).side_effect = _record_thread(_wait_for_lookups("presigned-url"))
+        mocker.patch("pcluster.models.cluster.Cluster.get_plugin_metadata", side_effect=_record_thread(lambda: None))
+
+        response = self._send_test_request(client)
+
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(200)
+            assert_that(response.get_json()["computeFleetStatus"]).is_equal_to("RUNNING")
+            assert_that(response.get_json()["clusterConfiguration"]).is_equal_to({"url": "presigned-url"})
+            assert_that(response.get_json()).does_not_contain_key("headNode")
+            assert_that(lookup_threads).is_equal_to([threading.current_thread()] * 2)
+
     @pytest.mark.parametrize(
         "region, cluster_name, expected_response",
         [
@@ -894,7 +939,7 @@ class TestListClusters:
     url = "/v3/clusters"
     method = "GET"
 
-    def _send_test_request(self, client, region="us-east-1", next_token=None, cluster_status_list=None):
+    def _send_test_request(self, client, region="us-east-1", next_token=None, cluster_status_list=None, details=None):
         query_string = []
         if region:
             query_string.append(("region", region))
@@ -902,6 +947,8 @@ class TestListClusters:
             query_string.append(("nextToken", next_token))
         if cluster_status_list:
             query_string.extend([("clusterStatus", status) for status in cluster_status_list])
+        if details is not None:
+            query_string.append(("details", details))
         headers = {"Accept": "application/json"}
         return client.open(self.url, method=self.method, headers=headers, query_string=query_string)
 
@@ -1118,6 +1165,201 @@ class TestListClusters:
             assert_that(response.status_code).is_equal_to(http_code)
             assert_that(response.get_json()).is_equal_to(expected_response)
 
+    @staticmethod
+    def _mock_multi_region_list_pcluster_stacks(mocker, responses):
+        def _list_pcluster_stacks(cfn, next_token=None):
+            response = responses[(cfn.region, next_token)]
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        return mocker.patch(
+            "pcluster.aws.cfn.CfnClient.list_pcluster_stacks", autospec=True, side_effect=_list_pcluster_stacks
+        )
+
+    @staticmethod
+    def _stack(name, version="3.0.0"):
+        return {
+            "StackName": name,
+            "StackId": f"arn:{name}",
+            "CreationTime": datetime(2021, 4, 30),
+            "StackStatus": CloudFormationStackStatus.CREATE_COMPLETE,
+            "Tags": [{"Key": "parallelcluster:version", "Value": version}],
+            "Parameters": [{"ParameterKey": "Scheduler", "ParameterValue": "slurm"}],
+        }
+
+    @staticmethod
+    def _cluster_summary(name, region, version="3.0.0"):
+        return {
+            "cloudformationStackArn": f"arn:{name}",
+            "cloudformationStackStatus": CloudFormationStackStatus.CREATE_COMPLETE,
+            "clusterName": name,
+            "clusterStatus": ClusterStatus.CREATE_COMPLETE,
+            "region": region,
+            "version": version,
+            "scheduler": {"type": "slurm"},
+        }
+
+    def test_multi_region_request(self, mocker, client):
+        list_pcluster_stacks_mock = self._mock_multi_region_list_pcluster_stacks(
+            mocker,
+            {
+                ("us-east-1", None): ([self._stack("name1")], "token1"),
+                ("eu-west-1", None): ([self._stack("name2")], None),
+                ("us-west-2", None): AWSClientError("list_pcluster_stacks", "Access denied"),
+                ("us-east-1", "token1"): ([self._stack("name3")], None),
+            },
+        )
+
+        response = self._send_test_request(client, "us-east-1,eu-west-1,us-west-2")
+
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(200)
+            assert_that(response.get_json()["clusters"]).is_equal_to(
+                [self._cluster_summary("name1", "us-east-1"), self._cluster_summary("name2", "eu-west-1")]
+            )
+            assert_that(response.get_json()["failedRegions"]).is_equal_to(
+                [{"region": "us-west-2", "message": "Access denied"}]
+            )
+        next_token = response.get_json()["nextToken"]
+
+        # Only the regions having more results are queried for the following page
+        list_pcluster_stacks_mock.reset_mock()
+        response = self._send_test_request(client, "us-east-1,eu-west-1,us-west-2", next_token)
+
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(200)
+            assert_that(response.get_json()).is_equal_to({"clusters": [self._cluster_summary("name3", "us-east-1")]})
+            assert_that(list_pcluster_stacks_mock.call_count).is_equal_to(1)
+
+    def test_all_regions_request(self, mocker, client):
+        mocker.patch(
+            "pcluster.aws.ec2.Ec2Client.get_enabled_regions", return_value=["eu-west-1", "us-east-1", "unsupported-1"]
+        )
+        self._mock_multi_region_list_pcluster_stacks(
+            mocker,
+            {
+                ("us-east-1", None): ([self._stack("name1")], None),
+                ("eu-west-1", None): ([self._stack("name2")], None),
+            },
+        )
+
+        response = self._send_test_request(client, "all")
+
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(200)
+            assert_that(response.get_json()).is_equal_to(
+                {
+                    "clusters": [
+                        self._cluster_summary("name2", "eu-west-1"),
+                        self._cluster_summary("name1", "us-east-1"),
+                    ]
+                }
+            )
+
+    def test_request_with_details(self, mocker, client):
+        batch_stack = self._stack("name2")
+        batch_stack["Parameters"] = [{"ParameterKey": "Scheduler", "ParameterValue": "awsbatch"}]
+        batch_stack["Outputs"] = [{"OutputKey": "BatchComputeEnvironmentArn", "OutputValue": "arn:ce"}]
+        slurm_stack = self._stack("name1", version="3.2.0")
+        slurm_stack["Parameters"].extend(
+            [
+                {"ParameterKey": "ResourcesS3Bucket", "ParameterValue": "bucket"},
+                {"ParameterKey": "ArtifactS3RootDirectory", "ParameterValue": "artifacts"},
+                {"ParameterKey": "ConfigVersion", "ParameterValue": "config-version"},
+            ]
+        )
+        mocker.patch(
+            "pcluster.aws.cfn.CfnClient.list_pcluster_stacks",
+            return_value=([slurm_stack, batch_stack, self._stack("name3")], None),
+        )
+        describe_instances_mock = mocker.patch(
+            "pcluster.aws.ec2.Ec2Client.describe_instances",
+            return_value=(
+                [
+                    {
+                        "InstanceId": "i-020c2ec1b6d550000",
+                        "InstanceType": "t2.micro",
+                        "LaunchTime": datetime(2021, 5, 10, 13, 55, 48),
+                        "PrivateIpAddress": "192.168.61.109",
+                        "State": {"Code": 16, "Name": "running"},
+                        "Tags": [{"Key": "parallelcluster:cluster-name", "Value": "name1"}],
+                    }
+                ],
+                None,
+            ),
+        )
+        get_statuses_mock = mocker.patch(
+            "pcluster.models.compute_fleet_status_manager.ComputeFleetStatusManager.get_statuses",
+            return_value=[ComputeFleetStatus.RUNNING, ComputeFleetStatus.UNKNOWN],
+        )
+        get_ce_state_mock = mocker.patch(
+            "pcluster.aws.batch.BatchClient.get_compute_environments_state", return_value={"arn:ce": "ENABLED"}
+        )
+        presigned_url_mock = mocker.patch("pcluster.aws.s3.S3Client.create_presigned_url", return_value="presigned-url")
+
+        response = self._send_test_request(client, details="true")
+
+        expected_clusters = [
+            self._cluster_summary("name1", "us-east-1", version="3.2.0"),
+            self._cluster_summary("name2", "us-east-1"),
+            self._cluster_summary("name3", "us-east-1"),
+        ]
+        expected_clusters[0].update(
+            {
+                "computeFleetStatus": "RUNNING",
+                "clusterConfiguration": {"url": "presigned-url"},
+                "headNode": {
+                    "instanceId": "i-020c2ec1b6d550000",
+                    "instanceType": "t2.micro",
+                    "launchTime": to_iso_timestr(datetime(2021, 5, 10, 13, 55, 48)),
+                    "privateIpAddress": "192.168.61.109",
+                    "state": "running",
+                },
+            }
+        )
+        expected_clusters[1].update(
+            {
+                "computeFleetStatus": "ENABLED",
+                "clusterConfiguration": {"url": "NOT_AVAILABLE"},
+                "scheduler": {"type": "awsbatch"},
+            }
+        )
+        expected_clusters[2].update({"computeFleetStatus": "UNKNOWN", "clusterConfiguration": {"url": "NOT_AVAILABLE"}})
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(200)
+            assert_that(response.get_json()).is_equal_to({"clusters": expected_clusters})
+        # A single call is done for all the clusters
+        describe_instances_mock.assert_called_once()
+        assert_that(describe_instances_mock.call_args[0][0][0]["Values"]).is_equal_to(["name1", "name2", "name3"])
+        get_statuses_mock.assert_called_once()
+        assert_that(len(get_statuses_mock.call_args[0][0])).is_equal_to(2)
+        get_ce_state_mock.assert_called_once_with(["arn:ce"])
+        presigned_url_mock.assert_called_once_with("bucket", "artifacts/configs/cluster-config.yaml", "config-version")
+
+    @pytest.mark.parametrize(
+        "region, next_token, expected_response",
+        [
+            (
+                "us-east-1,us-east-",
+                None,
+                {"message": "Bad Request: invalid or unsupported region 'us-east-'"},
+            ),
+            (
+                "us-east-1,eu-west-1",
+                "token",
+                {"message": "Bad Request: invalid next token 'token' for a multi-region request"},
+            ),
+        ],
+        ids=["bad_region", "bad_next_token"],
+    )
+    def test_malformed_multi_region_request(self, client, region, next_token, expected_response):
+        response = self._send_test_request(client, region, next_token)
+
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(400)
+            assert_that(response.get_json()).is_equal_to(expected_response)
+
 
 class TestUpdateCluster:
     url = "/v3/clusters/{cluster_name}"
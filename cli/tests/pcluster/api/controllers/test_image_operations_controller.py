@@ -280,6 +280,38 @@ class TestListImages:
             assert_that(response.status_code).is_equal_to(status_code)
             assert_that(response.get_json()).is_equal_to(expected_error)
 
+    def test_list_images_in_multiple_regions(self, client, mocker):
+        def _get_imagebuilder_stacks(cfn, next_token=None):
+            if cfn.region == "eu-west-1":
+                raise AWSClientError(function_name="get_imagebuilder_stacks", message="Access denied")
+            return [_create_stack(f"image-{cfn.region}", CloudFormationStackStatus.CREATE_IN_PROGRESS)], "nextPage"
+
+        mocker.patch(
+            "pcluster.aws.cfn.CfnClient.get_imagebuilder_stacks", autospec=True, side_effect=_get_imagebuilder_stacks
+        )
+        mocker.patch("pcluster.aws.cfn.CfnClient.describe_stack_resource", return_value=None)
+
+        response = self._send_test_request(client, ImageStatusFilteringOption.PENDING, region="us-east-1,eu-west-1")
+
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(200)
+            assert_that(response.get_json()["images"]).is_equal_to(
+                [
+                    {
+                        "imageId": "image-us-east-1",
+                        "imageBuildStatus": ImageBuildStatus.BUILD_IN_PROGRESS,
+                        "cloudformationStackStatus": CloudFormationStackStatus.CREATE_IN_PROGRESS,
+                        "cloudformationStackArn": "arn:image-us-east-1",
+                        "region": "us-east-1",
+                        "version": "3.0.0",
+                    }
+                ]
+            )
+            assert_that(response.get_json()["failedRegions"]).is_equal_to(
+                [{"region": "eu-west-1", "message": "Access denied"}]
+            )
+            assert_that(response.get_json()["nextToken"]).is_not_empty()
+
 
 class TestDeleteImage:
     url = "/v3/images/custom/{image_name}"
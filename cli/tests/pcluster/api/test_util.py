@@ -74,3 +74,16 @@ class TestParallelClusterApiUtil:
         warnings = [record for record in caplog.records if record.levelno == logging.CRITICAL]
         assert_that(warnings).is_length(1)
         assert_that(warnings[0].message).starts_with(expected_message)
+
+    def test_assert_valid_node_js_once(self, mocker):
+        mocker.patch("pcluster.api.util._node_js_validated", False)
+        executable_mock = mocker.patch("pcluster.api.util._assert_node_executable")
+        version_mock = mocker.patch("pcluster.api.util._assert_node_version", side_effect=[Exception("error"), None])
+
+        # A failed validation is repeated at the next call, a successful one is not
+        with pytest.raises(Exception):
+            util.assert_valid_node_js()
+        util.assert_valid_node_js()
+        util.assert_valid_node_js()
+        assert_that(executable_mock.call_count).is_equal_to(2)
+        assert_that(version_mock.call_count).is_equal_to(2)
@@ -127,6 +127,9 @@ class _DummyEc2Client(Ec2Client):
     def get_official_image_id(self, os, architecture, filters=None):
         return "dummy-ami-id"
 
+    def prefetch_instance_types_info(self, instance_types):
+        pass
+
     def describe_subnets(self, subnet_ids):
         return [
             {
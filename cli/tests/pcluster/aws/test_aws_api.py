@@ -12,10 +12,20 @@
 # This module contains all the classes representing the Resources objects.
 # These objects are obtained from the configuration file through a conversion based on the Schema classes.
 #
+import logging
+
 import pytest
 from assertpy import assert_that
+from botocore.awsrequest import AWSResponse
+from botocore.exceptions import ClientError
 
-from pcluster.aws.common import AWSExceptionHandler, ImageNotFoundError, StackNotFoundError
+from pcluster.aws.common import (
+    AdaptiveRateLimiter,
+    AWSExceptionHandler,
+    Boto3ClientPool,
+    ImageNotFoundError,
+    StackNotFoundError,
+)
 from tests.pcluster.aws.dummy_aws_api import _DummyAWSApi, mock_aws_api
 from tests.pcluster.test_utils import FAKE_NAME
 from tests.utils import MockedBoto3Request
@@ -90,4 +100,143 @@ def test_retry_on_boto3_throttling(boto3_stubber, mocker):
     ]
     client = boto3_stubber("cloudformation", mocked_requests)
     describe_stack_resources(client)
-    sleep_mock.assert_called_with(5)
+    assert_that(sleep_mock.call_count).is_equal_to(2)
+    # Jittered exponential backoff
+    for attempt, call in enumerate(sleep_mock.call_args_list, start=1):
+        assert_that(call[0][0]).is_between(0, 2**attempt)
+
+
+def test_retry_on_boto3_throttling_max_attempts(boto3_stubber, mocker):
+    @AWSExceptionHandler.retry_on_boto3_throttling
+    def describe_stack_resources(client):
+        client.describe_stack_resources(StackName=FAKE_NAME)
+
+    mocker.patch("pcluster.aws.common.BOTO3_RETRY_MAX_ATTEMPTS", 2)
+    sleep_mock = mocker.patch("pcluster.utils.time.sleep")
+    mocked_requests = [
+        MockedBoto3Request(
+            method="describe_stack_resources",
+            response="Error",
+            expected_params={"StackName": FAKE_NAME},
+            generate_error=True,
+            error_code="RequestLimitExceeded",
+        )
+    ] * 2
+    client = boto3_stubber("cloudformation", mocked_requests)
+    with pytest.raises(ClientError, match="RequestLimitExceeded"):
+        describe_stack_resources(client)
+    assert_that(sleep_mock.call_count).is_equal_to(1)
+
+
+def test_boto3_client_pool(mocker, set_env):
+    boto3_mock = mocker.patch("pcluster.aws.common.boto3")
+    boto3_mock.client.side_effect = lambda service_name, **kwargs: mocker.MagicMock(name=service_name)
+    session = boto3_mock.DEFAULT_SESSION
+    session.get_credentials.return_value.access_key = "AKIA1"
+    set_env("PCLUSTER_BOTO3_MAX_POOL_CONNECTIONS", "50")
+
+    session.region_name = "us-east-1"
+    ec2_client = Boto3ClientPool.get_client("ec2")
+    # Clients are reused for the same service, region, credentials and configuration
+    assert_that(Boto3ClientPool.get_client("ec2")).is_same_as(ec2_client)
+    assert_that(Boto3ClientPool.get_client("cloudformation")).is_not_same_as(ec2_client)
+    assert_that(Boto3ClientPool.get_client("ec2", {"retries": {"max_attempts": 1}})).is_not_same_as(ec2_client)
+    session.get_credentials.return_value.access_key = "AKIA2"
+    assert_that(Boto3ClientPool.get_client("ec2")).is_not_same_as(ec2_client)
+    session.get_credentials.return_value.access_key = "AKIA1"
+    session.region_name = "eu-west-1"
+    assert_that(Boto3ClientPool.get_client("ec2")).is_not_same_as(ec2_client)
+    session.region_name = "us-east-1"
+    assert_that(Boto3ClientPool.get_client("ec2")).is_same_as(ec2_client)
+
+    assert_that(boto3_mock.client.call_count).is_equal_to(5)
+    _, kwargs = boto3_mock.client.call_args
+    assert_that(kwargs["config"].max_pool_connections).is_equal_to(50)
+
+    Boto3ClientPool.clear()
+    assert_that(Boto3ClientPool.get_client("ec2")).is_not_same_as(ec2_client)
+
+
+class _RawResponse:
+    def __init__(self, body):
+        self._body = body
+
+    def stream(self, **kwargs):
+        yield self._body
+
+
+def _ec2_response(status_code, body):
+    return AWSResponse("https://ec2.us-east-1.amazonaws.com", status_code, {}, _RawResponse(body))
+
+
+def test_adaptive_rate_limiter(mocker, set_env):
+    set_env("AWS_DEFAULT_REGION", "us-east-1")
+    set_env("AWS_ACCESS_KEY_ID", "AKIAFAKE")
+    set_env("AWS_SECRET_ACCESS_KEY", "fake")
+    mocker.patch("pcluster.aws.common.boto3.DEFAULT_SESSION", None)
+    mocker.patch("pcluster.aws.common.AdaptiveRateLimiter._limiters", {})
+    mocker.patch("pcluster.utils.time.sleep")
+    mocker.patch.object(AdaptiveRateLimiter, "MIN_RATE", 100)
+
+    throttling_response = (
+        b"<Response><Errors><Error><Code>RequestLimitExceeded</Code><Message>Request limit exceeded.</Message>"
+        b"</Error></Errors><RequestID>id</RequestID></Response>"
+    )
+    success_response = b"<DescribeRegionsResponse><regionInfo/></DescribeRegionsResponse>"
+    responses = [_ec2_response(503, throttling_response)] * 2 + [_ec2_response(200, success_response)] * 3
+
+    client = Boto3ClientPool.get_client("ec2")
+    client.meta.events.register("before-send.ec2.DescribeRegions", lambda **kwargs: responses.pop(0))
+
+    limiter = AdaptiveRateLimiter.for_service("ec2")
+    # The first call is retried after two throttling errors, the limiter is then enabled
+    client.describe_regions()
+    assert_that(limiter.throttling_errors).is_equal_to(2)
+    assert_that(limiter.throttled_calls).is_equal_to(1)
+    assert_that(limiter.throttle_wait_seconds).is_greater_than(0)
+    # The rate is decreased on throttling errors and increased on the final successful attempt
+    rate_after_throttling = limiter.rate
+    assert_that(rate_after_throttling).is_equal_to(100 + AdaptiveRateLimiter.RATE_INCREASE_STEP)
+
+    # Successful calls increase the allowed rate
+    client.describe_regions()
+    client.describe_regions()
+    assert_that(limiter.rate).is_equal_to(rate_after_throttling + 2 * AdaptiveRateLimiter.RATE_INCREASE_STEP)
+    assert_that(AdaptiveRateLimiter.get_stats()["ec2"]).contains_entry({"throttling_errors": 2})
+
+
+def test_adaptive_rate_limiter_acquire(mocker):
+    sleep_mock = mocker.patch("pcluster.utils.time.sleep")
+    limiter = AdaptiveRateLimiter("ec2")
+    # Disabled limiter never waits
+    for _ in range(0, 10):
+        assert_that(limiter.acquire()).is_equal_to(0.0)
+    sleep_mock.assert_not_called()
+
+    limiter.on_throttling_error()
+    assert_that(limiter.rate).is_equal_to(10 * AdaptiveRateLimiter.RATE_DECREASE_FACTOR)
+    assert_that(limiter.acquire()).is_greater_than(0)
+    sleep_mock.assert_called()
+
+
+def test_adaptive_rate_limiter_without_throttling(mocker, set_env, caplog):
+    set_env("AWS_DEFAULT_REGION", "us-east-1")
+    set_env("AWS_ACCESS_KEY_ID", "AKIAFAKE")
+    set_env("AWS_SECRET_ACCESS_KEY", "fake")
+    mocker.patch("pcluster.aws.common.boto3.DEFAULT_SESSION", None)
+    mocker.patch("pcluster.aws.common.AdaptiveRateLimiter._limiters", {})
+    success_response = b"<DescribeRegionsResponse><regionInfo/></DescribeRegionsResponse>"
+
+    client = Boto3ClientPool.get_client("ec2")
+    client.meta.events.register(
+        "before-send.ec2.DescribeRegions", lambda **kwargs: _ec2_response(200, success_response)
+    )
+    with caplog.at_level(logging.INFO):
+        for _ in range(0, 3):
+            client.describe_regions()
+
+    # Calls neither throttled nor delayed by the limiter are not accounted as throttled
+    limiter = AdaptiveRateLimiter.for_service("ec2")
+    assert_that(limiter.throttled_calls).is_equal_to(0)
+    assert_that(limiter.throttle_wait_seconds).is_equal_to(0)
+    assert_that(caplog.text).does_not_contain("on throttling")
@@ -9,6 +9,7 @@ from datetime import datetime
 
 import pytest
 from assertpy import assert_that
+from botocore.awsrequest import AWSResponse
 
 from pcluster import utils as utils
 from pcluster.aws.cfn import CfnClient
@@ -98,63 +99,62 @@ class TestCfnClient:
                 CfnClient().list_pcluster_stacks(next_token=next_token)
             assert_that(e.value.error_code).is_equal_to("error")
 
-    def test_get_stack_events_retry(self, boto3_stubber, mocker):
-        sleep_mock = mocker.patch("pcluster.aws.common.time.sleep")
-        expected_events = [_generate_stack_event()]
-        mocked_requests = [
-            MockedBoto3Request(
-                method="describe_stack_events",
-                response="Error",
-                expected_params={"StackName": FAKE_NAME},
-                generate_error=True,
-                error_code="Throttling",
+    @pytest.mark.parametrize(
+        "method, operation, success_response, get_result_id",
+        [
+            (
+                "describe_stack",
+                "DescribeStacks",
+                b"<DescribeStacksResponse><DescribeStacksResult><Stacks><member><StackName>name</StackName>"
+                b"<CreationTime>2021-01-01T00:00:00Z</CreationTime><StackStatus>CREATE_COMPLETE</StackStatus>"
+                b"</member></Stacks></DescribeStacksResult></DescribeStacksResponse>",
+                lambda stack: stack["StackName"],
             ),
-            MockedBoto3Request(
-                method="describe_stack_events",
-                response={"StackEvents": expected_events},
-                expected_params={"StackName": FAKE_NAME},
+            (
+                "get_stack_events",
+                "DescribeStackEvents",
+                b"<DescribeStackEventsResponse><DescribeStackEventsResult><StackEvents><member><StackId>id</StackId>"
+                b"<EventId>event</EventId><StackName>name</StackName><Timestamp>2021-01-01T00:00:00Z</Timestamp>"
+                b"</member></StackEvents></DescribeStackEventsResult></DescribeStackEventsResponse>",
+                lambda events: events["StackEvents"][0]["StackName"],
             ),
-        ]
-        boto3_stubber("cloudformation", mocked_requests)
-        assert_that(CfnClient().get_stack_events(FAKE_NAME)["StackEvents"]).is_equal_to(expected_events)
-        sleep_mock.assert_called_with(5)
+        ],
+    )
+    def test_throttled_calls_retried_by_client(
+        self, mocker, set_env, method, operation, success_response, get_result_id
+    ):
+        set_env("AWS_DEFAULT_REGION", "us-east-1")
+        set_env("AWS_ACCESS_KEY_ID", "AKIAFAKE")
+        set_env("AWS_SECRET_ACCESS_KEY", "fake")
+        mocker.patch("pcluster.aws.common.boto3.DEFAULT_SESSION", None)
+        mocker.patch("pcluster.aws.common.AdaptiveRateLimiter._limiters", {})
+        mocker.patch("pcluster.utils.time.sleep")
+        throttling_response = (
+            b"<ErrorResponse><Error><Type>Sender</Type><Code>Throttling</Code><Message>Rate exceeded</Message>"
+            b"</Error><RequestId>id</RequestId></ErrorResponse>"
+        )
+        responses = [_cfn_response(400, throttling_response), _cfn_response(200, success_response)]
+        sent_requests = []
 
-    def test_get_stack_retry(self, boto3_stubber, mocker):
-        sleep_mock = mocker.patch("pcluster.aws.common.time.sleep")
-        expected_stack = {"StackName": FAKE_NAME, "CreationTime": 0, "StackStatus": "CREATED"}
-        mocked_requests = [
-            MockedBoto3Request(
-                method="describe_stacks",
-                response="Error",
-                expected_params={"StackName": FAKE_NAME},
-                generate_error=True,
-                error_code="Throttling",
-            ),
-            MockedBoto3Request(
-                method="describe_stacks",
-                response={"Stacks": [expected_stack]},
-                expected_params={"StackName": FAKE_NAME},
-            ),
-        ]
-        boto3_stubber("cloudformation", mocked_requests)
-        stack = CfnClient().describe_stack(FAKE_NAME)
-        assert_that(stack).is_equal_to(expected_stack)
-        sleep_mock.assert_called_with(5)
+        def _send(**kwargs):
+            sent_requests.append(kwargs)
+            return responses.pop(0)
 
-    def test_verify_stack_status_retry(self, boto3_stubber, mocker):
+        client = CfnClient()
+        client._client.meta.events.register(f"before-send.cloudformation.{operation}", _send)
+
+        # Throttled calls are retried once by the client, with no further retries around it
+        result = getattr(client, method)(FAKE_NAME)
+        assert_that(get_result_id(result)).is_equal_to("name")
+        assert_that(sent_requests).is_length(2)
+
+    def test_verify_stack_status(self, boto3_stubber, mocker):
         sleep_mock = mocker.patch("pcluster.aws.common.time.sleep")
         mocker.patch(
             "pcluster.aws.cfn.CfnClient.describe_stack",
             side_effect=[{"StackStatus": "CREATE_IN_PROGRESS"}, {"StackStatus": "CREATE_FAILED"}],
         )
         mocked_requests = [
-            MockedBoto3Request(
-                method="describe_stack_events",
-                response="Error",
-                expected_params={"StackName": FAKE_NAME},
-                generate_error=True,
-                error_code="Throttling",
-            ),
             MockedBoto3Request(
                 method="describe_stack_events",
                 response={"StackEvents": [_generate_stack_event()]},
@@ -242,3 +242,15 @@ class TestCfnClient:
             with pytest.raises(AWSClientError) as e:
                 CfnClient().list_pcluster_stacks(next_token=next_token)
             assert_that(e.value.error_code).is_equal_to("error")
+
+
+class _RawResponse:
+    def __init__(self, body):
+        self._body = body
+
+    def stream(self, **kwargs):
+        yield self._body
+
+
+def _cfn_response(status_code, body):
+    return AWSResponse("https://cloudformation.us-east-1.amazonaws.com", status_code, {}, _RawResponse(body))
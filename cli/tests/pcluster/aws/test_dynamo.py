@@ -11,6 +11,7 @@
 
 import pytest
 from boto3.dynamodb.conditions import Attr
+from botocore.exceptions import ClientError
 
 from pcluster.aws.dynamo import DynamoResource
 
@@ -66,3 +67,73 @@ class TestDynamoDBResource:
             ExpressionAttributeValues=expression_attribute_values,
             ConditionExpression=condition_expression,
         )
+
+    def test_batch_get_items(self, set_env, mocker):
+        set_env("AWS_DEFAULT_REGION", "us-east-1")
+        mocker.patch("pcluster.aws.dynamo.DYNAMODB_BATCH_GET_ITEM_MAX_KEYS", 2)
+        mock_dynamo_resource = mocker.patch("boto3.resource")
+        batch_get_item_mock = mock_dynamo_resource.return_value.batch_get_item
+        batch_get_item_mock.side_effect = [
+            {
+                "Responses": {"table1": [{"Id": "key1"}]},
+                "UnprocessedKeys": {"table2": {"Keys": [{"Id": "key2"}], "ConsistentRead": True}},
+            },
+            {"Responses": {"table2": [{"Id": "key2"}]}, "UnprocessedKeys": {}},
+            {"Responses": {"table3": [{"Id": "key3"}]}},
+        ]
+
+        sleep_mock = mocker.patch("pcluster.aws.dynamo.time.sleep")
+
+        items = DynamoResource().batch_get_items(
+            {"table1": [{"Id": "key1"}], "table2": [{"Id": "key2"}], "table3": [{"Id": "key3"}]}
+        )
+
+        assert items == {"table1": [{"Id": "key1"}], "table2": [{"Id": "key2"}], "table3": [{"Id": "key3"}]}
+        assert batch_get_item_mock.call_count == 3
+        batch_get_item_mock.assert_any_call(
+            RequestItems={
+                "table1": {"Keys": [{"Id": "key1"}], "ConsistentRead": True},
+                "table2": {"Keys": [{"Id": "key2"}], "ConsistentRead": True},
+            }
+        )
+        batch_get_item_mock.assert_called_with(
+            RequestItems={"table3": {"Keys": [{"Id": "key3"}], "ConsistentRead": True}}
+        )
+        # Unprocessed keys are requested again after a backoff
+        sleep_mock.assert_called_once()
+
+    def test_batch_get_items_unprocessed_keys(self, set_env, mocker):
+        set_env("AWS_DEFAULT_REGION", "us-east-1")
+        mock_dynamo_resource = mocker.patch("boto3.resource")
+        unprocessed_keys = {"table1": {"Keys": [{"Id": "key1"}], "ConsistentRead": True}}
+        batch_get_item_mock = mock_dynamo_resource.return_value.batch_get_item
+        batch_get_item_mock.return_value = {"Responses": {}, "UnprocessedKeys": unprocessed_keys}
+        mock_dynamo_resource.return_value.Table.return_value.get_item.return_value = {"Item": {"Id": "key1"}}
+        sleep_mock = mocker.patch("pcluster.aws.dynamo.time.sleep")
+
+        items = DynamoResource().batch_get_items({"table1": [{"Id": "key1"}]})
+
+        # Keys still unprocessed when the attempts are exhausted are read one by one
+        assert items == {"table1": [{"Id": "key1"}]}
+        assert batch_get_item_mock.call_count == 5
+        delays = [call.args[0] for call in sleep_mock.call_args_list]
+        assert len(delays) == 4
+        assert all(0 <= delay <= 0.1 * 2**attempt for attempt, delay in enumerate(delays, start=1))
+        mock_dynamo_resource.return_value.Table.assert_called_with("table1")
+
+    @pytest.mark.parametrize("error_code", ["ResourceNotFoundException", "AccessDeniedException"])
+    def test_batch_get_items_table_error(self, set_env, mocker, error_code):
+        set_env("AWS_DEFAULT_REGION", "us-east-1")
+        mock_dynamo_resource = mocker.patch("boto3.resource")
+        error = ClientError({"Error": {"Code": error_code, "Message": "error"}}, "BatchGetItem")
+        mock_dynamo_resource.return_value.batch_get_item.side_effect = error
+        tables = {"table1": mocker.MagicMock(), "table2": mocker.MagicMock()}
+        tables["table1"].get_item.side_effect = ClientError({"Error": {"Code": error_code}}, "GetItem")
+        tables["table2"].get_item.return_value = {"Item": {"Id": "key2"}}
+        mock_dynamo_resource.return_value.Table.side_effect = lambda table_name: tables[table_name]
+
+        items = DynamoResource().batch_get_items({"table1": [{"Id": "key1"}], "table2": [{"Id": "key2"}]})
+
+        # The items of the other tables are still retrieved
+        assert items == {"table2": [{"Id": "key2"}]}
+        tables["table2"].get_item.assert_called_once_with(ConsistentRead=True, Key={"Id": "key2"})
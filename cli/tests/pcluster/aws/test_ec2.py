@@ -16,7 +16,7 @@ from assertpy import assert_that, soft_assertions
 
 from pcluster.aws.aws_api import AWSApi
 from pcluster.aws.aws_resources import ImageInfo, InstanceTypeInfo
-from pcluster.aws.common import AWSClientError
+from pcluster.aws.common import AWSCallsRecorder, AWSClientError
 from pcluster.aws.ec2 import Ec2Client
 from pcluster.config.cluster_config import AmiSearchFilters, Tag
 from pcluster.constants import OS_TO_IMAGE_NAME_PART_MAP
@@ -502,6 +502,22 @@ def test_describe_subnets_cache(boto3_stubber):
     assert_that(AWSApi.instance().ec2.describe_subnets([subnet])[0]["State"]).is_equal_to("available")
 
 
+def test_recorded_aws_calls(boto3_stubber):
+    avail_zones = {"subnet-123": "us-east-1a", "subnet-234": "us-east-1b"}
+    mocked_requests = [
+        get_describe_subnets_mocked_request(["subnet-123"], "available", avail_zones),
+        get_describe_subnets_mocked_request(["subnet-234"], "available", avail_zones),
+    ]
+    boto3_stubber("ec2", mocked_requests)
+    with AWSCallsRecorder.record() as stats:
+        AWSApi.instance().ec2.describe_subnets(["subnet-123"])
+        AWSApi.instance().ec2.describe_subnets(["subnet-123"])
+    # Calls done outside of the recording block are not counted
+    AWSApi.instance().ec2.describe_subnets(["subnet-234"])
+
+    assert_that(stats).is_equal_to({"awsCalls": {"ec2:DescribeSubnets": 1}, "cacheHits": 1, "cacheMisses": 1})
+
+
 def test_get_subnet_ids_az_mapping(boto3_stubber):
     subnet_ids = ["subnet-123", "subnet-456"]
     avail_zones = {"subnet-123": "us-east-1a", "subnet-456": "us-east-1b"}
@@ -619,3 +635,48 @@ def test_describe_volume(boto3_stubber):
     response = AWSApi.instance().ec2.describe_volume(volume_id)
 
     assert_that(response["AvailabilityZone"] == az).is_true()
+
+
+def get_describe_instance_types_mocked_request(instance_types):
+    return MockedBoto3Request(
+        method="describe_instance_types",
+        response={"InstanceTypes": [{"InstanceType": instance_type} for instance_type in instance_types]},
+        expected_params={"InstanceTypes": instance_types},
+    )
+
+
+def test_prefetch_instance_types_info(boto3_stubber):
+    instance_types = [f"c5.{size}xlarge" for size in range(1, 151)]
+    # Instance types are described in chunks of 100, duplicates and additional instance types data are skipped
+    mocked_requests = [
+        get_describe_instance_types_mocked_request(instance_types[0:100]),
+        get_describe_instance_types_mocked_request(instance_types[100:150]),
+    ]
+    boto3_stubber("ec2", mocked_requests)
+    ec2_client = AWSApi.instance().ec2
+    ec2_client.additional_instance_types_data = {"t2.custom": {"InstanceType": "t2.custom", "VCpuInfo": {}}}
+    ec2_client.prefetch_instance_types_info(instance_types + ["c5.1xlarge", "t2.custom"])
+
+    # Following lookups are served from the cache, no further boto3 call is expected
+    for instance_type in instance_types + ["t2.custom"]:
+        assert_that(ec2_client.get_instance_type_info(instance_type).instance_type()).is_equal_to(instance_type)
+
+
+def test_prefetch_images_info(boto3_stubber):
+    ami_ids = ["ami-12345678", "ami-23456789"]
+    # Images are described with a single request, duplicates are skipped
+    mocked_requests = [
+        MockedBoto3Request(
+            method="describe_images",
+            response={"Images": [{"ImageId": ami_id, "Name": f"image-{ami_id}"} for ami_id in ami_ids]},
+            expected_params={"ImageIds": ami_ids},
+        )
+    ]
+    boto3_stubber("ec2", mocked_requests)
+    ec2_client = AWSApi.instance().ec2
+    ec2_client.prefetch_images_info(ami_ids + ["ami-12345678"])
+
+    # Following lookups and prefetches are served from the cache, no further boto3 call is expected
+    ec2_client.prefetch_images_info(ami_ids)
+    for ami_id in ami_ids:
+        assert_that(ec2_client.describe_image(ami_id).name).is_equal_to(f"image-{ami_id}")
@@ -100,7 +100,11 @@ class TestCreateClusterCommand:
         describe_cluster_mock = mocker.patch(
             "pcluster.api.controllers.cluster_operations_controller.describe_cluster", return_value=response
         )
-        cf_waiter_mock = mocker.patch("botocore.waiter.Waiter.wait")
+        describe_stack_mock = mocker.patch(
+            "pcluster.aws.cfn.CfnClient.describe_stack",
+            side_effect=[{"StackStatus": "CREATE_IN_PROGRESS"}, {"StackStatus": "CREATE_COMPLETE"}],
+        )
+        sleep_mock = mocker.patch("pcluster.utils.time.sleep")
         mock_aws_api(mocker)
 
         path = str(test_datadir / "config.yaml")
@@ -119,7 +123,8 @@ class TestCreateClusterCommand:
             "create_cluster_request_content": {"clusterName": "cluster", "clusterConfiguration": ""},
         }
         create_cluster_mock.assert_called_with(**expected_args)
-        assert_that(cf_waiter_mock.call_args[1]).is_equal_to({"StackName": "cluster"})
+        describe_stack_mock.assert_called_with("cluster")
+        assert_that(sleep_mock.call_count).is_equal_to(1)
         describe_cluster_mock.assert_called_with(cluster_name="cluster")
 
     @pytest.mark.parametrize("cluster_name_arg, region_arg", [("--cluster-name", "--region"), ("-n", "-r")])
@@ -158,6 +163,22 @@ class TestCreateClusterCommand:
         }
         create_cluster_mock.assert_called_with(**expected_args)
 
+    def test_validation_profile(self, mocker, test_datadir):
+        """Verify the report of the validation profiling is added to the output, also in case of errors."""
+        report = {"totalTime": 1.0, "totalAwsCalls": {}, "prefetch": [], "validators": []}
+        mocker.patch("pcluster.validators.common.ValidationProfiler.pop_last_report", return_value=report)
+        response_dict = {"message": "Request would have succeeded, but DryRun flag is set."}
+        mocker.patch(
+            "pcluster.api.controllers.cluster_operations_controller.create_cluster",
+            return_value=(response_dict, 412),
+            autospec=True,
+        )
+
+        path = str(test_datadir / "config.yaml")
+        with pytest.raises(APIOperationException) as exc_info:
+            run(["create-cluster", "--cluster-name", "cluster", "--cluster-configuration", path, "--dryrun", "true"])
+        assert_that(exc_info.value.data).is_equal_to({**response_dict, "validationProfile": report})
+
     def test_error(self, mocker, test_datadir):
         api_response = {"message": "error"}, 400
         mocker.patch(
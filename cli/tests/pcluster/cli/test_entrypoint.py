@@ -5,6 +5,15 @@
 #  or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 #  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 #  limitations under the License.
+import stat
+import subprocess
+import sys
+
+from assertpy import assert_that
+
+import pcluster.cli.model
+from pcluster.aws.common import PersistentCache
+from pcluster.cli.model import CLI_MODEL_CACHE_FILE_PREFIX
 
 
 class TestParallelClusterCli:
@@ -19,3 +28,59 @@ class TestParallelClusterCli:
         run_cli(command, expect_failure=True)
 
         assert_out_err(expected_out="", expected_err=(test_datadir / "pcluster-command-error.txt").read_text().strip())
+
+
+def test_entrypoint_import_does_not_load_controllers():
+    """Verify the CLI startup does not import the modules only needed when invoking an API operation."""
+    lazy_modules = [
+        "boto3",
+        "connexion",
+        "pkg_resources",
+        "pcluster.api.controllers.cluster_operations_controller",
+        "pcluster.api.controllers.image_operations_controller",
+        "pcluster.models.cluster",
+    ]
+    script = (
+        "import sys; import pcluster.cli.entrypoint; "
+        f"print([module for module in {lazy_modules} if module in sys.modules])"
+    )
+    output = subprocess.check_output([sys.executable, "-c", script], encoding="utf-8")
+    assert_that(output.strip()).is_equal_to("[]")
+
+
+def test_get_model(mocker, tmpdir):
+    mocker.patch("pcluster.cli.model.get_cache_dir", return_value=str(tmpdir))
+    stale_model = tmpdir.join(f"{CLI_MODEL_CACHE_FILE_PREFIX}stale.json")
+    stale_model.write("{}")
+    load_model_spy = mocker.spy(pcluster.cli.model, "load_model")
+
+    model = pcluster.cli.model.get_model()
+    assert_that(load_model_spy.call_count).is_equal_to(1)
+    assert_that(model).contains_key("list-clusters")
+    cached_models = tmpdir.listdir()
+    assert_that(cached_models).is_length(1).does_not_contain(stale_model)
+
+    # The compiled model is read from the cache on following invocations
+    assert_that(pcluster.cli.model.get_model()).is_equal_to(model)
+    assert_that(load_model_spy.call_count).is_equal_to(1)
+
+    # A corrupted model is compiled again
+    cached_models[0].write("{")
+    assert_that(pcluster.cli.model.get_model()).is_equal_to(model)
+    assert_that(load_model_spy.call_count).is_equal_to(2)
+
+
+def test_get_model_shares_persistent_cache_dir(mocker, set_env, tmp_path):
+    cache_dir = tmp_path / "parallelcluster" / "cache"
+    set_env("PCLUSTER_PERSISTENT_CACHE_ENABLED", "true")
+    set_env("PCLUSTER_PERSISTENT_CACHE_DIR", str(cache_dir))
+    mocker.patch(
+        "pcluster.aws.common.PersistentCache._get_namespace_dir",
+        return_value=str(cache_dir / "us-east-1-123456789012-3.4.0"),
+    )
+    pcluster.cli.model.get_model()
+
+    # The cache directory created by the CLI is accepted by the persistent cache
+    assert_that(stat.S_IMODE(cache_dir.stat().st_mode)).is_equal_to(0o700)
+    PersistentCache.put(test_get_model, (), {}, "value", ttl=60)
+    assert_that(PersistentCache.get(test_get_model, (), {})).is_equal_to((True, "value"))
@@ -84,11 +84,12 @@ class TestExportClusterLogsCommand:
                 "end_time": "2021-06-07",
                 "filters": "Name=node-type,Values=HeadNode",
             },
+            {"checkpoint_file": "checkpoint.json"},
         ],
     )
     def test_execute(self, mocker, set_env, args):
         export_logs_mock = mocker.patch(
-            "pcluster.cli.commands.cluster_logs.Cluster.export_logs",
+            "pcluster.models.cluster.Cluster.export_logs",
             return_value=args.get("output_file", "https://u.r.l."),
         )
         set_env("AWS_DEFAULT_REGION", "us-east-1")
@@ -110,6 +111,7 @@ class TestExportClusterLogsCommand:
             "filters": None,
             "start_time": None,
             "end_time": None,
+            "checkpoint_file": None,
         }
         expected_params.update(args)
         expected_params.update(
@@ -118,6 +120,7 @@ class TestExportClusterLogsCommand:
                 "start_time": args.get("start_time") and to_utc_datetime(args["start_time"]),
                 "end_time": args.get("end_time") and to_utc_datetime(args["end_time"]),
                 "filters": [args.get("filters")] if args.get("filters") else None,
+                "checkpoint_file": args.get("checkpoint_file") and os.path.realpath(args.get("checkpoint_file")),
             }
         )
         export_logs_mock.assert_called_with(**expected_params)
@@ -62,7 +62,7 @@ class TestExportImageLogsCommand:
     )
     def test_execute(self, mocker, set_env, args):
         export_logs_mock = mocker.patch(
-            "pcluster.cli.commands.image_logs.ImageBuilder.export_logs",
+            "pcluster.models.imagebuilder.ImageBuilder.export_logs",
             return_value=args.get("output_file", "https://u.r.l."),
         )
         set_env("AWS_DEFAULT_REGION", "us-east-1")
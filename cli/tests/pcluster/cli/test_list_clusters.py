@@ -45,6 +45,7 @@ class TestListClustersCommand:
                     "cluster_status": ["DELETE_IN_PROGRESS", "CREATE_IN_PROGRESS"],
                     "next_token": "token",
                     "region": "us-east-1",
+                    "details": True,
                 },
                 ListClustersResponseContent(clusters=[], next_token="token"),
                 {"clusters": [], "nextToken": "token"},
@@ -83,7 +84,7 @@ class TestListClustersCommand:
                 *args.get("cluster_status")
             )
             args["cluster_status"] = ANY
-        base_args = {"region": None, "next_token": None, "cluster_status": None}
+        base_args = {"region": None, "next_token": None, "cluster_status": None, "details": None}
         list_clusters_mock.assert_called_with(**{**base_args, **args})
 
     def test_error(self, mocker):
@@ -109,4 +110,6 @@ class TestListClustersCommand:
         if "cluster_status" in args:
             cli_args.extend(["--cluster-status"])
             cli_args.extend(args["cluster_status"])
+        if "details" in args:
+            cli_args.extend(["--details", str(args["details"]).lower()])
         return cli_args
@@ -0,0 +1,87 @@
+#  Copyright 2022 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+#  with the License. A copy of the License is located at http://aws.amazon.com/apache2.0/
+#  or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+from assertpy import assert_that
+
+from pcluster.cli.entrypoint import run
+from pcluster.models.cluster import BadRequestClusterActionError
+from pcluster.utils import to_kebab_case, to_utc_datetime
+
+BASE_COMMAND = ["pcluster", "tail-cluster-logs"]
+REQUIRED_ARGS = {"cluster-name": "clustername"}
+
+
+class TestTailClusterLogsCommand:
+    def test_helper(self, test_datadir, run_cli, assert_out_err):
+        command = BASE_COMMAND + ["--help"]
+        run_cli(command, expect_failure=False)
+
+        assert_out_err(expected_out=(test_datadir / "pcluster-help.txt").read_text().strip(), expected_err="")
+
+    @pytest.mark.parametrize(
+        "args, error_message",
+        [
+            ({}, "the following arguments are required: -n/--cluster-name"),
+            ({**REQUIRED_ARGS, "filters": "Name=wrong,Values=test"}, "filters parameter must be in the form"),
+            ({**REQUIRED_ARGS, "start_time": "wrong"}, "Start time and end time filters must be in the ISO 8601"),
+        ],
+    )
+    def test_invalid_args(self, args, error_message, run_cli, capsys):
+        command = BASE_COMMAND + self._build_cli_args(args)
+        run_cli(command, expect_failure=True)
+
+        out, err = capsys.readouterr()
+        assert_that(out + err).contains(error_message)
+
+    @pytest.mark.parametrize(
+        "args",
+        [
+            {},
+            {"filters": "Name=queue-name,Values=queue1", "start_time": "2021-06-02T00:00:00Z"},
+        ],
+    )
+    def test_execute(self, mocker, set_env, capsys, args):
+        events = [
+            {"timestamp": 1622802790248, "logStreamName": "ip-10-0-0-1.i-123.cloud-init", "message": "first\n"},
+            {"timestamp": 1622802790249, "logStreamName": "ip-10-0-0-2.i-456.cloud-init", "message": "second"},
+        ]
+        follow_log_events_mock = mocker.patch(
+            "pcluster.models.cluster.Cluster.follow_log_events", return_value=iter(events)
+        )
+        set_env("AWS_DEFAULT_REGION", "us-east-1")
+
+        command = ["tail-cluster-logs"] + self._build_cli_args({**REQUIRED_ARGS, **args})
+        out = run(command)
+
+        assert_that(out).is_none()
+        assert_that(capsys.readouterr().out).is_equal_to(
+            "2021-06-04T10:33:10.248Z ip-10-0-0-1.i-123.cloud-init first\n"
+            "2021-06-04T10:33:10.249Z ip-10-0-0-2.i-456.cloud-init second\n"
+        )
+        follow_log_events_mock.assert_called_with(
+            filters=[args["filters"]] if args.get("filters") else None,
+            start_time=args.get("start_time") and to_utc_datetime(args["start_time"]),
+        )
+
+    def test_execute_error(self, mocker, set_env):
+        mocker.patch(
+            "pcluster.models.cluster.Cluster.follow_log_events",
+            side_effect=BadRequestClusterActionError("CloudWatch logging is not enabled for cluster clustername."),
+        )
+        set_env("AWS_DEFAULT_REGION", "us-east-1")
+
+        with pytest.raises(SystemExit, match="Unable to follow cluster's logs.\nCloudWatch logging is not enabled"):
+            run(["tail-cluster-logs"] + self._build_cli_args(REQUIRED_ARGS))
+
+    @staticmethod
+    def _build_cli_args(args):
+        cli_args = []
+        for k, val in args.items():
+            cli_args.extend([f"--{to_kebab_case(k)}", str(val)])
+        return cli_args
@@ -105,7 +105,11 @@ class TestUpdateClusterCommand:
             "pcluster.api.controllers.cluster_operations_controller.describe_cluster", return_value=response
         )
 
-        cf_waiter_mock = mocker.patch("botocore.waiter.Waiter.wait")
+        describe_stack_mock = mocker.patch(
+            "pcluster.aws.cfn.CfnClient.describe_stack",
+            side_effect=[{"StackStatus": "UPDATE_IN_PROGRESS"}, {"StackStatus": "UPDATE_COMPLETE"}],
+        )
+        sleep_mock = mocker.patch("pcluster.utils.time.sleep")
         mock_aws_api(mocker)
 
         path = str(test_datadir / "config.yaml")
@@ -125,7 +129,8 @@ class TestUpdateClusterCommand:
             "validation_failure_level": None,
         }
         update_cluster_mock.assert_called_with(**expected_args)
-        assert_that(cf_waiter_mock.call_args[1]).is_equal_to({"StackName": "cluster"})
+        describe_stack_mock.assert_called_with("cluster")
+        assert_that(sleep_mock.call_count).is_equal_to(1)
         describe_cluster_mock.assert_called_with(cluster_name="cluster")
 
     def test_execute(self, mocker, test_datadir):
@@ -8,13 +8,18 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+import logging
+import threading
+import time
 from typing import List
 
 import pytest
 from assertpy import assert_that
 
-from pcluster.config.common import Resource
-from pcluster.validators.common import FailureLevel, Validator, ValidatorContext
+from pcluster.aws.common import AWSCallsRecorder
+from pcluster.config.common import Resource, TypeMatchValidatorsSuppressor
+from pcluster.constants import VALIDATION_RESULTS_CACHE_TTL
+from pcluster.validators.common import AWSResourceType, FailureLevel, ValidationProfiler, Validator, ValidatorContext
 
 
 class FakeInfoValidator(Validator):
@@ -150,6 +155,232 @@ def test_nested_resource_validate():
     assert_validation_result(validation_failures[2], FailureLevel.INFO, "Wrong value other-value.")
 
 
+def test_validators_executed_concurrently():
+    """Verify that validators of the whole resource tree run concurrently and failures keep the registration order."""
+    barrier = threading.Barrier(3, timeout=10)
+
+    class FakeConcurrentValidator(Validator):
+        """Dummy validator waiting for the other validators to be running at the same time."""
+
+        def _validate(self, param):
+            barrier.wait()
+            self._add_failure(f"Concurrent {param}.", FailureLevel.WARNING)
+
+    class FakeNestedResource(Resource):
+        """Fake nested resource class to test validators."""
+
+        def __init__(self, fake_value):
+            super().__init__()
+            self.fake_attribute = fake_value
+
+        def _register_validators(self, context: ValidatorContext = None):
+            self._register_validator(FakeConcurrentValidator, param=self.fake_attribute)
+            self._register_validator(FakeErrorValidator, param=self.fake_attribute)
+
+    class FakeParentResource(Resource):
+        """Fake resource class to test validators."""
+
+        def __init__(self, list_of_resources: List[FakeNestedResource]):
+            super().__init__()
+            self.list_of_resources = list_of_resources
+
+        def _register_validators(self, context: ValidatorContext = None):
+            self._register_validator(FakeConcurrentValidator, param="parent")
+
+    fake_resource = FakeParentResource([FakeNestedResource("value1"), FakeNestedResource("value2")])
+    validation_failures = fake_resource.validate()
+
+    assert_that([failure.message for failure in validation_failures]).is_equal_to(
+        ["Concurrent value1.", "Error value1.", "Concurrent value2.", "Error value2.", "Concurrent parent."]
+    )
+
+    # Suppressed validators are not executed
+    validation_failures = fake_resource.validate(
+        suppressors=[TypeMatchValidatorsSuppressor({"FakeConcurrentValidator"})]
+    )
+    assert_that([failure.message for failure in validation_failures]).is_equal_to(["Error value1.", "Error value2."])
+
+
+def test_required_aws_resources_prefetch(mocker):
+    """Verify that the AWS resources required by validators are described in bulk before executing them."""
+    prefetch_mock = mocker.patch("pcluster.config.common._prefetch_aws_resources")
+
+    class FakeSubnetsValidator(Validator):
+        """Dummy validator requiring subnets."""
+
+        required_aws_resources = {AWSResourceType.SUBNET: ["subnet_id", "subnet_ids"]}
+
+        def _validate(self, subnet_id, subnet_ids):
+            pass
+
+    class FakeInstanceTypeValidator(Validator):
+        """Dummy validator requiring an instance type."""
+
+        required_aws_resources = {AWSResourceType.INSTANCE_TYPE: ["instance_type"]}
+
+        def _validate(self, instance_type):
+            pass
+
+    class FakeResource(Resource):
+        """Fake resource class to test validators."""
+
+        def _register_validators(self, context: ValidatorContext = None):
+            self._register_validator(FakeSubnetsValidator, subnet_id="subnet-2", subnet_ids=["subnet-1", "subnet-2"])
+            self._register_validator(FakeSubnetsValidator, subnet_id="subnet-3", subnet_ids=None)
+            self._register_validator(FakeInstanceTypeValidator, instance_type="c5.xlarge")
+
+    FakeResource().validate()
+    assert_that(prefetch_mock.call_count).is_equal_to(2)
+    prefetch_mock.assert_any_call(AWSResourceType.SUBNET, ["subnet-1", "subnet-2", "subnet-3"])
+    prefetch_mock.assert_any_call(AWSResourceType.INSTANCE_TYPE, ["c5.xlarge"])
+
+    # Resources required only by suppressed validators are not described
+    prefetch_mock.reset_mock()
+    FakeResource().validate(suppressors=[TypeMatchValidatorsSuppressor({"FakeSubnetsValidator"})])
+    prefetch_mock.assert_called_once_with(AWSResourceType.INSTANCE_TYPE, ["c5.xlarge"])
+
+
+def test_validation_results_cache(mocker, set_env, tmp_path):
+    """Verify that validators results are reused across validations until they expire."""
+    set_env("PCLUSTER_PERSISTENT_CACHE_ENABLED", "true")
+    set_env("PCLUSTER_PERSISTENT_CACHE_DIR", str(tmp_path))
+    mocker.patch(
+        "pcluster.aws.common.PersistentCache._get_namespace_dir",
+        return_value=str(tmp_path / "us-east-1-123456789012-3.4.0"),
+    )
+    mocker.patch("pcluster.config.common._prefetch_aws_resources")
+    subnets = {"subnet-1": {"SubnetId": "subnet-1", "VpcId": "vpc-1"}}
+    mocker.patch(
+        "pcluster.validators.common._describe_aws_resources",
+        side_effect=lambda resource_type, resource_ids: [subnets[subnet_id] for subnet_id in resource_ids],
+    )
+    # Validators are executed concurrently, hence executions are compared regardless of their order
+    executions = []
+
+    class FakeCachedValidator(Validator):
+        """Dummy validator recording its executions."""
+
+        def _validate(self, param):
+            executions.append(("cached", param))
+            self._add_failure(f"Wrong value {param}.", FailureLevel.WARNING)
+
+    class FakeSubnetValidator(Validator):
+        """Dummy validator recording its executions, depending on the description of a subnet."""
+
+        required_aws_resources = {AWSResourceType.SUBNET: ["subnet_id"]}
+
+        def _validate(self, subnet_id):
+            executions.append(("subnet", subnet_id))
+            AWSCallsRecorder.record_cache_lookup(True, "Ec2Client.describe_subnets")
+
+    class FakeAwsValidator(Validator):
+        """Dummy validator recording its executions, performing AWS calls."""
+
+        def _validate(self, param):
+            executions.append(("aws", param))
+            AWSCallsRecorder.record_aws_call("ec2", "DescribeVpcs")
+
+    class FakeNotCachedValidator(Validator):
+        """Dummy validator recording its executions, with results never cached."""
+
+        results_cache_ttl = 0
+
+        def _validate(self, param):
+            executions.append(("not-cached", param))
+
+    class FakeNestedResource(Resource):
+        """Fake nested resource class to test validators."""
+
+        def __init__(self, fake_value):
+            super().__init__()
+            self.fake_attribute = fake_value
+
+    class FakeResource(Resource):
+        """Fake resource class to test validators."""
+
+        def __init__(self, fake_value):
+            super().__init__()
+            self.nested_resource = FakeNestedResource(fake_value)
+
+        def _register_validators(self, context: ValidatorContext = None):
+            self._register_validator(FakeCachedValidator, param=self.nested_resource)
+            self._register_validator(FakeNotCachedValidator, param=self.nested_resource.fake_attribute)
+            self._register_validator(FakeSubnetValidator, subnet_id="subnet-1")
+            self._register_validator(FakeAwsValidator, param=self.nested_resource.fake_attribute)
+
+    for _ in range(0, 2):
+        validation_failures = FakeResource("value1").validate()
+        assert_validation_result(validation_failures[0], FailureLevel.WARNING, "Wrong value")
+    assert_that(sorted(name for name, _ in executions)).is_equal_to(
+        sorted(["cached", "not-cached", "subnet", "aws", "not-cached", "aws"])
+    )
+
+    # Changed arguments are validated again
+    del executions[:]
+    FakeResource("value2").validate()
+    assert_that(sorted(name for name, _ in executions)).is_equal_to(sorted(["cached", "not-cached", "aws"]))
+
+    # Changed AWS resources are validated again
+    del executions[:]
+    subnets["subnet-1"] = {"SubnetId": "subnet-1", "VpcId": "vpc-2"}
+    FakeResource("value1").validate()
+    assert_that(sorted(name for name, _ in executions)).is_equal_to(sorted(["not-cached", "subnet", "aws"]))
+
+    # Expired results are validated again
+    del executions[:]
+    mocker.patch("pcluster.validators.common.time.time", return_value=time.time() + VALIDATION_RESULTS_CACHE_TTL + 1)
+    FakeResource("value1").validate()
+    assert_that(sorted(name for name, _ in executions)).is_equal_to(sorted(["cached", "not-cached", "subnet", "aws"]))
+
+
+@pytest.mark.parametrize("debug_enabled", [True, False])
+def test_validation_profiling(caplog, debug_enabled):
+    """Verify that the execution of validators is profiled only when debug logging is enabled."""
+    caplog.set_level(logging.DEBUG if debug_enabled else logging.INFO, logger="pcluster")
+
+    class FakeAwsValidator(Validator):
+        """Dummy validator performing AWS calls."""
+
+        def _validate(self, param):
+            for _ in range(param):
+                AWSCallsRecorder.record_aws_call("ec2", "DescribeSubnets")
+            AWSCallsRecorder.record_cache_lookup(hit=True)
+
+    class FakeResource(Resource):
+        """Fake resource class to test validators."""
+
+        def _register_validators(self, context: ValidatorContext = None):
+            self._register_validator(FakeAwsValidator, param=1)
+            self._register_validator(FakeInfoValidator, param="value")
+            self._register_validator(FakeAwsValidator, param=2)
+
+    FakeResource().validate()
+    report = ValidationProfiler.pop_last_report()
+
+    if debug_enabled:
+        assert_that(report["totalAwsCalls"]).is_equal_to({"ec2:DescribeSubnets": 3})
+        assert_that(report["prefetch"]).is_empty()
+        assert_that(report["validators"]).is_length(3)
+        assert_that(
+            sorted(
+                ((record["name"], record["awsCalls"], record["cacheHits"]) for record in report["validators"]),
+                key=lambda record: (record[0], sum(record[1].values())),
+            )
+        ).is_equal_to(
+            [
+                ("FakeAwsValidator", {"ec2:DescribeSubnets": 1}, 1),
+                ("FakeAwsValidator", {"ec2:DescribeSubnets": 2}, 1),
+                ("FakeInfoValidator", {}, 0),
+            ]
+        )
+        assert_that(caplog.text).contains("Validation profiling report")
+        # The report is returned only once
+        assert_that(ValidationProfiler.pop_last_report()).is_none()
+    else:
+        assert_that(report).is_none()
+        assert_that(caplog.text).does_not_contain("Validation profiling report")
+
+
 @pytest.mark.parametrize(
     "value, default, expected_value, expected_implied",
     [
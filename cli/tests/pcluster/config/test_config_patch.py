@@ -295,6 +295,13 @@ def test_multiple_param_changes(mocker, pcluster_config_reader, test_datadir):
 
     _check_patch(src_conf.source_config, dst_conf.source_config, expected_changes, UpdatePolicy.UNSUPPORTED)
 
+    patch = ConfigPatch(dummy_cluster(), base_config=src_conf.source_config, target_config=dst_conf.source_config)
+    assert_that(patch.changed_paths).contains_only(
+        ("HeadNode", "Networking", "SubnetId"),
+        ("Scheduling", "SlurmQueues[queue1]", "Networking", "SubnetIds"),
+        ("HeadNode", "Networking", "AdditionalSecurityGroups"),
+    )
+
 
 def _test_equal_configs(base_conf, target_conf):
     # Without doing any changes the two configs must be equal
@@ -19,6 +19,7 @@ import yaml
 from assertpy import assert_that
 from botocore.response import StreamingBody
 from dateutil import tz
+from freezegun import freeze_time
 
 from pcluster.api.models import ClusterStatus
 from pcluster.aws.aws_resources import ImageInfo
@@ -33,10 +34,11 @@ from pcluster.constants import (
     PCLUSTER_VERSION_TAG,
 )
 from pcluster.models.cluster import BadRequestClusterActionError, Cluster, ClusterActionError, NodeType
-from pcluster.models.cluster_resources import ClusterStack
+from pcluster.models.cluster_resources import ClusterInstance, ClusterStack
 from pcluster.models.compute_fleet_status_manager import ComputeFleetStatus
 from pcluster.models.s3_bucket import S3Bucket, S3FileFormat
 from pcluster.schemas.cluster_schema import ClusterSchema
+from pcluster.validators.common import FailureLevel
 from tests.pcluster.aws.dummy_aws_api import mock_aws_api
 from tests.pcluster.config.dummy_cluster_config import dummy_slurm_cluster_config
 from tests.pcluster.models.dummy_s3_bucket import mock_bucket, mock_bucket_object_utils, mock_bucket_utils
@@ -482,8 +484,7 @@ class TestCluster:
         set_env("AWS_DEFAULT_REGION", "us-east-2")
         stack_exists_mock = mocker.patch("pcluster.aws.cfn.CfnClient.stack_exists", return_value=stack_exists)
         download_stack_events_mock = mocker.patch("pcluster.models.cluster.export_stack_events")
-        create_logs_archive_mock = mocker.patch("pcluster.models.cluster.create_logs_archive")
-        upload_archive_mock = mocker.patch("pcluster.models.cluster.upload_archive")
+        logs_archive_mock = mocker.patch("pcluster.models.cluster.LogsArchive")
         presign_mock = mocker.patch("pcluster.models.cluster.create_s3_presigned_url")
         mocker.patch(
             "pcluster.models.cluster.ClusterStack.log_group_name",
@@ -495,7 +496,7 @@ class TestCluster:
             "pcluster.models.cluster.Cluster._init_export_logs_filters",
             return_value=_MockExportClusterLogsFiltersParser(),
         )
-        cw_logs_exporter_mock = mocker.patch("pcluster.models.cluster.CloudWatchLogsExporter", autospec=True)
+        cw_logs_exporter_mock = mocker.patch("pcluster.models.cluster.create_logs_exporter")
 
         kwargs.update({"bucket": "bucket_name"})
         if expected_error:
@@ -505,7 +506,7 @@ class TestCluster:
             cluster.export_logs(**kwargs)
             # check archive steps
             download_stack_events_mock.assert_called()
-            create_logs_archive_mock.assert_called()
+            logs_archive_mock.assert_called()
 
             # check preliminary steps
             stack_exists_mock.assert_called_with(cluster.stack_name)
@@ -518,10 +519,276 @@ class TestCluster:
                 logs_filter_mock.assert_not_called()
 
             if "output_file" not in kwargs:
-                print("kwargs", kwargs)
-                upload_archive_mock.assert_called()
                 presign_mock.assert_called()
 
+    @pytest.mark.parametrize(
+        "logging_enabled, filters, expected_log_stream_prefix, expected_log_stream_names, expected_error",
+        [
+            (False, None, None, None, "CloudWatch logging is not enabled"),
+            (True, None, None, None, None),
+            (True, ["Name=node-type,Values=HeadNode"], "ip-10-0-0-1", None, None),
+            (
+                True,
+                ["Name=queue-name,Values=queue1"],
+                None,
+                ["ip-10-0-0-2.i-456.cloud-init", "ip-10-0-0-3.i-789.cloud-init"],
+                None,
+            ),
+            (True, ["Name=node-type,Values=Compute"], None, None, "The only accepted value for Node Type filter"),
+        ],
+    )
+    def test_follow_log_events(
+        self,
+        cluster,
+        mocker,
+        set_env,
+        logging_enabled,
+        filters,
+        expected_log_stream_prefix,
+        expected_log_stream_names,
+        expected_error,
+    ):
+        mock_aws_api(mocker)
+        set_env("AWS_DEFAULT_REGION", "us-east-2")
+        mocker.patch("pcluster.aws.cfn.CfnClient.stack_exists", return_value=True)
+        mocker.patch(
+            "pcluster.models.cluster.ClusterStack.log_group_name",
+            new_callable=PropertyMock(return_value="log-group-name" if logging_enabled else None),
+        )
+        instances = {
+            NodeType.HEAD_NODE: [({"PrivateDnsName": "ip-10-0-0-1.ec2.internal"}, None)],
+            NodeType.COMPUTE: [
+                ({"PrivateDnsName": "ip-10-0-0-2.ec2.internal"}, "token"),
+                ({"PrivateDnsName": "ip-10-0-0-3.ec2.internal"}, None),
+            ],
+        }
+
+        def _describe_instances(node_type, next_token=None, queue_name=None):
+            instance, token = instances[node_type][1 if next_token else 0]
+            return [ClusterInstance(instance)], token
+
+        mocker.patch("pcluster.models.cluster.Cluster.describe_instances", side_effect=_describe_instances)
+        log_stream_names = [
+            "ip-10-0-0-1.i-123.cloud-init",
+            "ip-10-0-0-2.i-456.cloud-init",
+            "ip-10-0-0-3.i-789.cloud-init",
+            "ip-10-0-0-30.i-012.cloud-init",
+        ]
+        mocker.patch(
+            "pcluster.aws.logs.LogsClient.get_log_streams",
+            side_effect=lambda log_group_name, log_stream_name_prefix: [
+                {"logStreamName": name} for name in log_stream_names if name.startswith(log_stream_name_prefix)
+            ],
+        )
+        follower_mock = mocker.patch("pcluster.models.cluster.LogEventsFollower")
+
+        if expected_error:
+            with pytest.raises(BadRequestClusterActionError, match=expected_error):
+                cluster.follow_log_events(filters=filters)
+        else:
+            events = cluster.follow_log_events(filters=filters)
+
+            assert_that(events).is_equal_to(follower_mock.return_value.follow.return_value)
+            follower_kwargs = follower_mock.call_args.kwargs
+            assert_that(follower_mock.call_args.args).is_equal_to(("log-group-name",))
+            assert_that(follower_kwargs["log_stream_prefix"]).is_equal_to(expected_log_stream_prefix)
+            if expected_log_stream_names:
+                # Log streams are matched by the full host name of the compute nodes of the queue
+                assert_that(follower_kwargs["get_log_stream_names"]()).is_equal_to(expected_log_stream_names)
+            else:
+                assert_that(follower_kwargs["get_log_stream_names"]).is_none()
+
+    def test_get_queue_log_stream_names(self, cluster, mocker):
+        mock_aws_api(mocker)
+        mocker.patch("pcluster.models.cluster.LOGS_TAIL_MAX_KNOWN_NODES_REFRESHED", 1)
+        mocker.patch(
+            "pcluster.models.cluster.ClusterStack.log_group_name",
+            new_callable=PropertyMock(return_value="log-group-name"),
+        )
+        nodes = ["ip-10-0-0-2", "ip-10-0-0-3"]
+        mocker.patch(
+            "pcluster.models.cluster.Cluster.describe_instances",
+            side_effect=lambda **kwargs: (
+                [ClusterInstance({"PrivateDnsName": f"{node}.ec2.internal"}) for node in nodes],
+                None,
+            ),
+        )
+        log_stream_names = ["ip-10-0-0-2.i-456.cloud-init", "ip-10-0-0-3.i-789.cloud-init"]
+        get_log_streams_mock = mocker.patch(
+            "pcluster.aws.logs.LogsClient.get_log_streams",
+            side_effect=lambda log_group_name, log_stream_name_prefix: [
+                {"logStreamName": name} for name in log_stream_names if name.startswith(log_stream_name_prefix)
+            ],
+        )
+        known_log_stream_names = {}
+
+        def _get_queue_log_stream_names():
+            get_log_streams_mock.reset_mock()
+            names = cluster._get_queue_log_stream_names("queue1", known_log_stream_names)
+            return names, [call.kwargs["log_stream_name_prefix"] for call in get_log_streams_mock.call_args_list]
+
+        # The log streams of each node are described by prefix
+        assert_that(_get_queue_log_stream_names()).is_equal_to((log_stream_names, ["ip-10-0-0-2.", "ip-10-0-0-3."]))
+        # Known nodes are described again one at a time, the least recently described first
+        log_stream_names.append("ip-10-0-0-3.i-789.slurmd")
+        assert_that(_get_queue_log_stream_names()).is_equal_to(
+            (["ip-10-0-0-2.i-456.cloud-init", "ip-10-0-0-3.i-789.cloud-init"], ["ip-10-0-0-2."])
+        )
+        assert_that(_get_queue_log_stream_names()).is_equal_to(
+            (
+                ["ip-10-0-0-2.i-456.cloud-init", "ip-10-0-0-3.i-789.cloud-init", "ip-10-0-0-3.i-789.slurmd"],
+                ["ip-10-0-0-3."],
+            )
+        )
+        # New nodes are always described and terminated nodes are forgotten
+        nodes[:] = ["ip-10-0-0-3", "ip-10-0-0-4"]
+        log_stream_names.append("ip-10-0-0-4.i-012.cloud-init")
+        assert_that(_get_queue_log_stream_names()).is_equal_to(
+            (
+                ["ip-10-0-0-3.i-789.cloud-init", "ip-10-0-0-3.i-789.slurmd", "ip-10-0-0-4.i-012.cloud-init"],
+                ["ip-10-0-0-4.", "ip-10-0-0-3."],
+            )
+        )
+        assert_that(known_log_stream_names).does_not_contain_key("ip-10-0-0-2")
+
+    @pytest.mark.parametrize(
+        "logging_enabled, kwargs, expected_search_args, expected_error",
+        [
+            (False, {}, None, "CloudWatch logging is not enabled"),
+            (
+                True,
+                {"end_time": datetime.datetime(2021, 6, 5, tzinfo=datetime.timezone.utc)},
+                (
+                    datetime.datetime(2021, 6, 1, tzinfo=datetime.timezone.utc),
+                    datetime.datetime(2021, 6, 5, tzinfo=datetime.timezone.utc),
+                    None,
+                ),
+                None,
+            ),
+            (
+                True,
+                {
+                    "start_time": datetime.datetime(2021, 6, 2, tzinfo=datetime.timezone.utc),
+                    "end_time": datetime.datetime(2021, 6, 3, tzinfo=datetime.timezone.utc),
+                    "filters": ["Name=node-type,Values=HeadNode"],
+                    "limit": 1,
+                },
+                (
+                    datetime.datetime(2021, 6, 2, tzinfo=datetime.timezone.utc),
+                    datetime.datetime(2021, 6, 3, tzinfo=datetime.timezone.utc),
+                    "ip-10-0-0-1",
+                ),
+                None,
+            ),
+            (
+                True,
+                {
+                    "start_time": datetime.datetime(2021, 6, 3, tzinfo=datetime.timezone.utc),
+                    "end_time": datetime.datetime(2021, 6, 2, tzinfo=datetime.timezone.utc),
+                },
+                None,
+                "Start time must be earlier than end time",
+            ),
+            (
+                True,
+                {"filters": ["Name=node-type,Values=Compute"]},
+                None,
+                "The only accepted value for Node Type filter",
+            ),
+        ],
+    )
+    def test_search_log_events(
+        self, cluster, mocker, set_env, logging_enabled, kwargs, expected_search_args, expected_error
+    ):
+        mock_aws_api(mocker)
+        set_env("AWS_DEFAULT_REGION", "us-east-2")
+        mocker.patch("pcluster.aws.cfn.CfnClient.stack_exists", return_value=True)
+        mocker.patch(
+            "pcluster.models.cluster.ClusterStack.log_group_name",
+            new_callable=PropertyMock(return_value="log-group-name" if logging_enabled else None),
+        )
+        mocker.patch(
+            "pcluster.models.cluster.Cluster.describe_instances",
+            return_value=([ClusterInstance({"PrivateDnsName": "ip-10-0-0-1.ec2.internal"})], None),
+        )
+        mocker.patch(
+            "pcluster.aws.logs.LogsClient.describe_log_group",
+            return_value={"creationTime": 1622505600000},
+        )
+        events = [{"timestamp": 1622592000000 + index, "message": f"event{index}"} for index in range(2)]
+        search_log_events_mock = mocker.patch("pcluster.models.cluster.search_log_events", return_value=events)
+
+        if expected_error:
+            with pytest.raises(BadRequestClusterActionError, match=expected_error):
+                cluster.search_log_events("ERROR", **kwargs)
+            search_log_events_mock.assert_not_called()
+        else:
+            result = cluster.search_log_events("ERROR", **kwargs)
+
+            assert_that(result).is_equal_to(events)
+            start_time, end_time, log_stream_prefix = expected_search_args
+            # The limit is applied by the search, to stop querying the later sub-windows
+            search_log_events_mock.assert_called_with(
+                "log-group-name",
+                "ERROR",
+                start_time,
+                end_time,
+                log_stream_prefix=log_stream_prefix,
+                limit=kwargs.get("limit"),
+            )
+
+    @pytest.mark.parametrize("export_error", [False, True])
+    @freeze_time("2021-06-05T10:10:00Z")
+    def test_export_logs_with_checkpoint(self, cluster, mocker, set_env, tmpdir, export_error):
+        mock_aws_api(mocker)
+        set_env("AWS_DEFAULT_REGION", "us-east-2")
+        mocker.patch("pcluster.aws.cfn.CfnClient.stack_exists", return_value=True)
+        mocker.patch(
+            "pcluster.models.cluster.export_stack_events",
+            side_effect=AWSClientError("describe_stack_events", "error") if export_error else None,
+        )
+        mocker.patch("pcluster.models.cluster.LogsArchive")
+        mocker.patch("pcluster.models.cluster.create_s3_presigned_url")
+        mocker.patch(
+            "pcluster.models.cluster.ClusterStack.log_group_name",
+            new_callable=PropertyMock(return_value="log-group-name"),
+        )
+        export_logs_filters = _MockExportClusterLogsFiltersParser()
+        export_logs_filters.end_time = datetime.datetime(2021, 6, 5, 10, 0, 0, tzinfo=datetime.timezone.utc)
+        logs_filter_mock = mocker.patch(
+            "pcluster.models.cluster.Cluster._init_export_logs_filters", return_value=export_logs_filters
+        )
+        mocker.patch("pcluster.models.cluster.create_logs_exporter")
+        checkpoint_file = tmpdir.join("checkpoint.json")
+        filters = ["Name=node-type,Values=HeadNode"]
+        checkpoint = {
+            "logGroupName": "log-group-name",
+            "filters": filters,
+            "endTime": 1622800800000,
+            "exportTask": None,
+        }
+        checkpoint_file.write(json.dumps(checkpoint))
+
+        if export_error:
+            with pytest.raises(ClusterActionError, match="error"):
+                cluster.export_logs(bucket="bucket_name", filters=filters, checkpoint_file=str(checkpoint_file))
+        else:
+            cluster.export_logs(bucket="bucket_name", filters=filters, checkpoint_file=str(checkpoint_file))
+
+        # Only the log events after the last export and already ingested are exported
+        logs_filter_mock.assert_called_with(
+            datetime.datetime(2021, 6, 4, 10, 0, 0, 1000, tzinfo=datetime.timezone.utc),
+            datetime.datetime(2021, 6, 5, 10, 0, 0, tzinfo=datetime.timezone.utc),
+            filters,
+        )
+        if export_error:
+            # The checkpoint is not moved forward when the export fails
+            assert_that(json.loads(checkpoint_file.read())).is_equal_to(checkpoint)
+        else:
+            assert_that(json.loads(checkpoint_file.read())).is_equal_to(
+                {"logGroupName": "log-group-name", "filters": filters, "endTime": 1622887200000, "exportTask": None}
+            )
+
     @pytest.mark.parametrize(
         "stack_exists, logging_enabled, client_error, expected_error",
         [
@@ -617,6 +884,40 @@ class TestCluster:
 
         stack_exists_mock.assert_called_with(cluster.stack_name)
 
+    @pytest.mark.parametrize("incremental_validation_enabled", [False, True])
+    def test_validate_and_parse_config_incremental(self, mocker, set_env, incremental_validation_enabled):
+        mock_aws_api(mocker)
+        mocker.patch("pcluster.aws.ec2.Ec2Client.describe_image")
+        mocker.patch("pcluster.config.common._prefetch_aws_resources")
+        executed_validators = []
+        mocker.patch(
+            "pcluster.config.common.Resource._validator_execute",
+            side_effect=lambda validator_class, *_: executed_validators.append(validator_class.__name__) or [],
+        )
+        if incremental_validation_enabled:
+            set_env("PCLUSTER_INCREMENTAL_VALIDATION_ENABLED", "true")
+        cluster = Cluster(FAKE_NAME, config=OLD_CONFIGURATION)
+
+        target_config, _ = cluster._validate_and_parse_config(
+            validator_suppressors=None,
+            validation_failure_level=FailureLevel.ERROR,
+            config_text=OLD_CONFIGURATION.replace("MaxCount: 11", "MaxCount: 12"),
+            incremental=True,
+        )
+
+        if incremental_validation_enabled:
+            # Only validators of the changed compute resource and the ones depending on it are executed,
+            # together with the ones checking AWS resources, which may have changed in the meantime
+            assert_that(executed_validators).contains("ComputeResourceSizeValidator", "NameValidator")
+            assert_that(executed_validators).contains("SubnetsValidator", "SecurityGroupsValidator")
+            assert_that(executed_validators).does_not_contain("KeyPairValidator", "HeadNodeImdsValidator")
+            # The patch computed for the validation is reused to check the update
+            config_patch_mock = mocker.patch("pcluster.models.cluster.ConfigPatch")
+            cluster._get_update_patch(target_config)
+            config_patch_mock.assert_not_called()
+        else:
+            assert_that(executed_validators).contains("KeyPairValidator", "ComputeResourceSizeValidator")
+
     @pytest.mark.parametrize("force", [False, True])
     def test_validate_empty_change_set(self, mocker, force):
         mock_aws_api(mocker)
@@ -20,6 +20,8 @@ from pcluster.models.cluster_resources import (
     ClusterLogsFiltersParser,
     ExportClusterLogsFiltersParser,
     FiltersParserError,
+    FollowClusterLogsFiltersParser,
+    SearchClusterLogsFiltersParser,
 )
 from tests.pcluster.aws.dummy_aws_api import mock_aws_api
 
@@ -208,3 +210,78 @@ class TestExportClusterLogsFiltersParser:
             if "start_time" not in attrs:
                 describe_log_group_mock.assert_called_with(log_group_name)
                 assert_that(export_logs_filters.start_time).is_equal_to(creation_time_mock)
+
+
+class TestFollowClusterLogsFiltersParser:
+    @pytest.mark.parametrize(
+        "filters, expected_queue_name, expected_log_stream_prefix, expected_error",
+        [
+            (["Name=queue-name,Values=queue1"], "queue1", None, None),
+            (["Name=node-type,Values=HeadNode"], None, "ip-10-0-0-102", None),
+            (None, None, None, None),
+            (
+                ["Name=queue-name,Values=queue1", "Name=private-dns-name,Values=ip-10-10-10-10"],
+                None,
+                None,
+                "Queue Name filter cannot be set at the same time as Private DNS Name or Node Type filters.",
+            ),
+        ],
+    )
+    def test_validate(self, mock_head_node, filters, expected_queue_name, expected_log_stream_prefix, expected_error):
+        logs_filters = FollowClusterLogsFiltersParser(mock_head_node, filters)
+
+        if expected_error:
+            with pytest.raises(FiltersParserError, match=expected_error):
+                logs_filters.validate()
+        else:
+            logs_filters.validate()
+            assert_that(logs_filters.queue_name).is_equal_to(expected_queue_name)
+            assert_that(logs_filters.log_stream_prefix).is_equal_to(expected_log_stream_prefix)
+
+
+class TestSearchClusterLogsFiltersParser:
+    @pytest.mark.parametrize(
+        "start_time, end_time, filters, expected_log_stream_prefix, expected_error",
+        [
+            (
+                datetime.datetime(2012, 7, 9, tzinfo=datetime.timezone.utc),
+                datetime.datetime(2012, 7, 29, tzinfo=datetime.timezone.utc),
+                ["Name=private-dns-name,Values=ip-10-10-10-10"],
+                "ip-10-10-10-10",
+                None,
+            ),
+            (None, None, ["Name=node-type,Values=HeadNode"], "ip-10-0-0-102", None),
+            (
+                datetime.datetime(2012, 7, 29, tzinfo=datetime.timezone.utc),
+                datetime.datetime(2012, 7, 9, tzinfo=datetime.timezone.utc),
+                None,
+                None,
+                "Start time must be earlier than end time.",
+            ),
+            (None, None, ["Name=queue-name,Values=queue1"], None, "Filter queue-name not supported."),
+        ],
+    )
+    def test_validate(
+        self, mocker, mock_head_node, start_time, end_time, filters, expected_log_stream_prefix, expected_error
+    ):
+        mock_aws_api(mocker)
+        mocker.patch("pcluster.aws.logs.LogsClient.describe_log_group", return_value={"creationTime": 1623061001000})
+        # A time window without log events is not an error for searches
+        filter_log_events_mock = mocker.patch("pcluster.aws.logs.LogsClient.filter_log_events", return_value=[])
+
+        if expected_error:
+            with pytest.raises(FiltersParserError, match=expected_error):
+                SearchClusterLogsFiltersParser(
+                    mock_head_node, "log_group_name", start_time, end_time, filters
+                ).validate()
+        else:
+            logs_filters = SearchClusterLogsFiltersParser(
+                mock_head_node, "log_group_name", start_time, end_time, filters
+            )
+            logs_filters.validate()
+            assert_that(logs_filters.log_stream_prefix).is_equal_to(expected_log_stream_prefix)
+            # The start time defaults to the creation time of the log group
+            assert_that(logs_filters.start_time).is_equal_to(
+                start_time or datetime.datetime(2021, 6, 7, 10, 16, 41, tzinfo=datetime.timezone.utc)
+            )
+        filter_log_events_mock.assert_not_called()
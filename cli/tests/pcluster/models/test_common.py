@@ -9,18 +9,30 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
 import datetime
+import gzip
+import io
+import json
 import os
+import tarfile
 import time
 
 import pytest
 from assertpy import assert_that
+from freezegun import freeze_time
 
-from pcluster.aws.common import AWSClientError
+from pcluster.aws.common import AWSClientError, PersistentCache
+from pcluster.aws.logs import LogsClient
 from pcluster.models.common import (
     CloudWatchLogsExporter,
+    CloudWatchLogsStreamingExporter,
     FiltersParserError,
+    LogEventsFollower,
     LogGroupTimeFiltersParser,
+    LogsArchive,
+    LogsExportCheckpoint,
     LogsExporterError,
+    create_logs_exporter,
+    search_log_events,
 )
 from tests.pcluster.aws.dummy_aws_api import mock_aws_api
 
@@ -326,3 +338,737 @@ class TestCloudWatchLogsExporter:
         else:
             task_id = cw_logs_exporter._export_logs_to_s3("log_group_name", "bucket")
             wait_for_completion_mock.assert_called_with(task_id)
+
+    def test_download_s3_objects_with_prefix(self, cw_logs_exporter, mocker, tmpdir):
+        mock_aws_api(mocker)
+        prefix = f"{cw_logs_exporter.bucket_prefix}/task_id"
+        objects = {
+            f"{prefix}/stream1/000001.gz": b"second part of stream1\n",
+            f"{prefix}/stream1/000000.gz": b"first part of stream1\n",
+            f"{prefix}/stream2/000000.gz": b"stream2\n" * 1000,
+        }
+        mocker.patch(
+            "pcluster.aws.s3_resource.S3Resource.get_objects",
+            return_value=[mocker.MagicMock(key=key) for key in objects],
+        )
+        get_object_mock = mocker.patch(
+            "pcluster.aws.s3.S3Client.get_object",
+            side_effect=lambda bucket_name, key: {"Body": io.BytesIO(gzip.compress(objects[key]))},
+        )
+        mocker.patch("pcluster.models.common.LOGS_EXPORT_DOWNLOAD_CHUNK_SIZE", 16)
+
+        cw_logs_exporter._download_s3_objects_with_prefix("task_id", str(tmpdir))
+
+        assert_that(get_object_mock.call_count).is_equal_to(len(objects))
+        assert_that(tmpdir.join("stream1").read_binary()).is_equal_to(
+            b"first part of stream1\nsecond part of stream1\n"
+        )
+        assert_that(tmpdir.join("stream2").read_binary()).is_equal_to(b"stream2\n" * 1000)
+        # No intermediate compressed copy is written
+        assert_that(tmpdir.listdir()).is_length(2)
+
+    @pytest.mark.parametrize(
+        "export_task, task_result, download_error, expected_export_task, expected_delete",
+        [
+            pytest.param(None, "COMPLETED", None, "new_task_id", True, id="new export task"),
+            pytest.param(
+                {"taskId": "task_id", "bucket": "bucket_name"}, "COMPLETED", None, "task_id", True, id="resume"
+            ),
+            pytest.param(
+                {"taskId": "task_id", "bucket": "other_bucket"},
+                "COMPLETED",
+                None,
+                "new_task_id",
+                True,
+                id="resume with another bucket",
+            ),
+            pytest.param(None, "FAILED", None, None, False, id="failed export task"),
+            pytest.param(None, "COMPLETED", OSError(), "new_task_id", False, id="interrupted download"),
+        ],
+    )
+    def test_execute_with_checkpoint(
+        self,
+        mocker,
+        set_env,
+        tmpdir,
+        export_task,
+        task_result,
+        download_error,
+        expected_export_task,
+        expected_delete,
+    ):
+        mock_aws_api(mocker)
+        set_env("AWS_DEFAULT_REGION", "us-east-2")
+        mocker.patch("pcluster.aws.s3.S3Client.get_bucket_region", return_value="us-east-2")
+        mocker.patch("pcluster.aws.s3_resource.S3Resource.is_empty", return_value=True)
+        create_export_task_mock = mocker.patch(
+            "pcluster.aws.logs.LogsClient.create_export_task", return_value="new_task_id"
+        )
+        mocker.patch(
+            "pcluster.models.common.CloudWatchLogsExporter._wait_for_task_completion", return_value=task_result
+        )
+        download_objects_mock = mocker.patch(
+            "pcluster.models.common.CloudWatchLogsExporter._download_s3_objects_with_prefix",
+            side_effect=download_error,
+        )
+        delete_objects_mock = mocker.patch("pcluster.aws.s3_resource.S3Resource.delete_objects")
+        checkpoint = LogsExportCheckpoint(str(tmpdir.join("checkpoint.json")), "groupname")
+        if export_task:
+            export_task.update(
+                {
+                    "bucketPrefix": "previous_prefix",
+                    "deleteEverythingUnderPrefix": False,
+                    "startTime": 1622800800000,
+                    "endTime": 1622804400000,
+                }
+            )
+            checkpoint.export_task = export_task
+            checkpoint.save()
+        start_time = datetime.datetime(2021, 6, 4, 10, 0, 0, tzinfo=datetime.timezone.utc)
+        end_time = datetime.datetime(2021, 6, 4, 11, 0, 0, tzinfo=datetime.timezone.utc)
+        cw_logs_exporter = CloudWatchLogsExporter(
+            resource_id="clustername",
+            log_group_name="groupname",
+            bucket="bucket_name",
+            output_dir=str(tmpdir),
+            checkpoint=checkpoint,
+        )
+
+        if task_result != "COMPLETED" or download_error:
+            with pytest.raises(LogsExporterError):
+                cw_logs_exporter.execute(start_time=start_time, end_time=end_time)
+        else:
+            cw_logs_exporter.execute(start_time=start_time, end_time=end_time)
+
+        if expected_export_task == "task_id":
+            create_export_task_mock.assert_not_called()
+            download_objects_mock.assert_called_with("task_id", str(tmpdir.join("cloudwatch-logs")))
+            delete_objects_mock.assert_called_with(bucket_name="bucket_name", prefix="previous_prefix/task_id")
+        else:
+            create_export_task_mock.assert_called()
+        if expected_export_task:
+            # The export task is recorded as soon as it is started, to resume the export in case of failure
+            with open(checkpoint.path, encoding="utf-8") as checkpoint_file:
+                assert_that(json.load(checkpoint_file)["exportTask"]).contains_entry({"taskId": expected_export_task})
+        else:
+            assert_that(checkpoint.export_task).is_none()
+        if expected_delete:
+            delete_objects_mock.assert_called()
+        else:
+            # The exported objects are kept to resume the export
+            delete_objects_mock.assert_not_called()
+
+
+def _log_stream(name, first_event, last_ingestion):
+    return {
+        "logStreamName": name,
+        "firstEventTimestamp": first_event,
+        "lastEventTimestamp": first_event,
+        "lastIngestionTime": last_ingestion,
+        "storedBytes": 0,
+    }
+
+
+class TestCloudWatchLogsStreamingExporter:
+    def test_execute(self, mocker, tmpdir):
+        mock_aws_api(mocker)
+        events = {
+            "stream1": [
+                {"events": [{"timestamp": 1622802790248, "message": "first"}], "nextForwardToken": "token1"},
+                {"events": [{"timestamp": 1622802791248, "message": "second"}], "nextForwardToken": "token2"},
+                {"events": [], "nextForwardToken": "token2"},
+            ],
+            "stream2": [
+                {"events": [{"timestamp": 1622802792248, "message": "other"}], "nextForwardToken": "token1"},
+                {"events": [], "nextForwardToken": "token1"},
+            ],
+        }
+        get_log_events_mock = mocker.patch(
+            "pcluster.aws.logs.LogsClient.get_log_events",
+            side_effect=lambda log_stream_name, next_token, **kwargs: events[log_stream_name][
+                int(next_token[-1]) if next_token else 0
+            ],
+        )
+        mocker.patch(
+            "pcluster.aws.logs.LogsClient.get_log_streams",
+            return_value=[
+                _log_stream("stream1", 1622802790248, 1622802791248),
+                # The last event timestamp is updated only eventually, the last ingestion time is used instead
+                {**_log_stream("stream2", 1622802792248, 1622802792248), "lastEventTimestamp": 1622702790248},
+                # Log streams without events in the time window are not read
+                _log_stream("stream3", 1622702790248, 1622702790248),
+                {"logStreamName": "empty"},
+            ],
+        )
+        start_time = datetime.datetime(2021, 6, 4, 10, 0, 0, tzinfo=datetime.timezone.utc)
+        end_time = datetime.datetime(2021, 6, 4, 11, 0, 0, tzinfo=datetime.timezone.utc)
+
+        CloudWatchLogsStreamingExporter("groupname", str(tmpdir)).execute("stream", start_time, end_time)
+
+        assert_that(get_log_events_mock.call_count).is_equal_to(5)
+        get_log_events_mock.assert_any_call(
+            log_group_name="groupname",
+            log_stream_name="stream2",
+            start_time=1622800800000,
+            # The events at the end time are exported, as with export tasks
+            end_time=1622804400001,
+            start_from_head=True,
+            next_token=None,
+        )
+        assert_that(tmpdir.join("cloudwatch-logs").listdir()).is_length(2)
+        assert_that(tmpdir.join("cloudwatch-logs", "stream1").read()).is_equal_to(
+            "2021-06-04T10:33:10.248Z first\n2021-06-04T10:33:11.248Z second\n"
+        )
+        assert_that(tmpdir.join("cloudwatch-logs", "stream2").read()).is_equal_to("2021-06-04T10:33:12.248Z other\n")
+
+    def test_execute_with_empty_page(self, mocker, tmpdir):
+        mock_aws_api(mocker)
+        pages = [
+            {"events": [{"timestamp": 1622802790248, "message": "first"}], "nextForwardToken": "token1"},
+            # Empty pages are returned for time ranges without events, the stream continues with the next token
+            {"events": [], "nextForwardToken": "token2"},
+            {"events": [{"timestamp": 1622802799248, "message": "second"}], "nextForwardToken": "token3"},
+            {"events": [], "nextForwardToken": "token3"},
+        ]
+        get_log_events_mock = mocker.patch(
+            "pcluster.aws.logs.LogsClient.get_log_events",
+            side_effect=lambda next_token, **kwargs: pages[int(next_token[-1]) if next_token else 0],
+        )
+        log_streams = [_log_stream("stream1", 1622802790248, 1622802799248)]
+
+        CloudWatchLogsStreamingExporter("groupname", str(tmpdir), log_streams=log_streams).execute()
+
+        assert_that(get_log_events_mock.call_count).is_equal_to(4)
+        assert_that(tmpdir.join("cloudwatch-logs", "stream1").read()).is_equal_to(
+            "2021-06-04T10:33:10.248Z first\n2021-06-04T10:33:19.248Z second\n"
+        )
+
+    def test_execute_with_archive(self, mocker, tmpdir):
+        mock_aws_api(mocker)
+        mocker.patch(
+            "pcluster.aws.logs.LogsClient.get_log_events",
+            return_value={"events": [{"timestamp": 1622802790248, "message": "first"}], "nextForwardToken": None},
+        )
+        archive_mock = mocker.MagicMock()
+        log_streams = [_log_stream("stream1", 1622802790248, 1622802790248)]
+
+        CloudWatchLogsStreamingExporter(
+            "groupname", str(tmpdir), log_streams=log_streams, archive=archive_mock
+        ).execute()
+
+        archive_mock.add.assert_called_once_with(str(tmpdir.join("cloudwatch-logs", "stream1")))
+
+
+@pytest.mark.parametrize(
+    "log_streams, window_seconds, keep_s3_objects, get_log_streams_error, expected_exporter",
+    [
+        pytest.param([_log_stream("stream1", 0, 1000)], 1, False, None, CloudWatchLogsStreamingExporter, id="small"),
+        pytest.param([_log_stream("stream1", 0, 1000)], 1, True, None, CloudWatchLogsExporter, id="keep objects"),
+        pytest.param([_log_stream("stream1", 0, 1000)], 1, False, True, CloudWatchLogsExporter, id="error"),
+        pytest.param([_log_stream("stream1", 0, 20000)], 20, False, None, CloudWatchLogsExporter, id="long window"),
+        pytest.param(
+            # The time window starts at the first event of the log streams
+            [_log_stream("stream1", 15000, 20000)],
+            20,
+            False,
+            None,
+            CloudWatchLogsStreamingExporter,
+            id="long window before first event",
+        ),
+        pytest.param(
+            [_log_stream(f"stream{index}", 0, 1000) for index in range(3)],
+            1,
+            False,
+            None,
+            CloudWatchLogsExporter,
+            id="many log streams",
+        ),
+    ],
+)
+def test_create_logs_exporter(
+    mocker, set_env, log_streams, window_seconds, keep_s3_objects, get_log_streams_error, expected_exporter
+):
+    mock_aws_api(mocker)
+    set_env("AWS_DEFAULT_REGION", "us-east-2")
+    mocker.patch("pcluster.aws.s3.S3Client.get_bucket_region", return_value="us-east-2")
+    mocker.patch("pcluster.aws.s3_resource.S3Resource.is_empty", return_value=True)
+    mocker.patch("pcluster.models.common.LOGS_EXPORT_STREAMING_MAX_WINDOW", 10)
+    mocker.patch("pcluster.models.common.LOGS_EXPORT_STREAMING_MAX_LOG_STREAMS", 2)
+    mocker.patch(
+        "pcluster.aws.logs.LogsClient.get_log_streams",
+        return_value=log_streams,
+        side_effect=AWSClientError("describe_log_streams", "error") if get_log_streams_error else None,
+    )
+
+    logs_exporter = create_logs_exporter(
+        resource_id="clustername",
+        log_group_name="groupname",
+        bucket="bucket_name",
+        output_dir="output_dir",
+        keep_s3_objects=keep_s3_objects,
+        start_time=datetime.datetime.fromtimestamp(0, tz=datetime.timezone.utc),
+        end_time=datetime.datetime.fromtimestamp(window_seconds, tz=datetime.timezone.utc),
+    )
+
+    assert_that(logs_exporter).is_instance_of(expected_exporter)
+    if expected_exporter == CloudWatchLogsStreamingExporter:
+        assert_that(logs_exporter.log_streams).is_equal_to(log_streams)
+
+
+class TestLogsArchive:
+    def test_output_file(self, tmpdir):
+        archive_dir = tmpdir.mkdir("cluster-logs")
+        archive_dir.mkdir("cloudwatch-logs").join("stream1").write("first")
+        archive_dir.join("stack-events").write("events")
+        output_file = str(tmpdir.join("archive.tar.gz"))
+
+        with LogsArchive(str(archive_dir), output_file=output_file) as logs_archive:
+            logs_archive.add(str(archive_dir.join("cloudwatch-logs", "stream1")))
+            logs_archive.add(str(archive_dir.join("stack-events")))
+
+        assert_that(logs_archive.path).is_equal_to(output_file)
+        # Files are removed as soon as they are archived
+        assert_that(archive_dir.join("cloudwatch-logs").listdir()).is_empty()
+        with tarfile.open(output_file, "r:gz") as tar:
+            assert_that(tar.getnames()).contains_only(
+                "cluster-logs", "cluster-logs/cloudwatch-logs/stream1", "cluster-logs/stack-events"
+            )
+            assert_that(tar.extractfile("cluster-logs/cloudwatch-logs/stream1").read()).is_equal_to(b"first")
+
+    def test_output_file_removed_on_error(self, tmpdir):
+        archive_dir = tmpdir.mkdir("cluster-logs")
+        output_file = tmpdir.join("archive.tar.gz")
+
+        with pytest.raises(LogsExporterError):
+            with LogsArchive(str(archive_dir), output_file=str(output_file)):
+                raise LogsExporterError("error")
+
+        assert_that(output_file.check()).is_false()
+
+    @pytest.mark.parametrize("error", [False, True])
+    def test_multipart_upload(self, mocker, tmpdir, error):
+        mock_aws_api(mocker)
+        mocker.patch("pcluster.models.common.LOGS_EXPORT_UPLOAD_PART_SIZE", 64)
+        create_upload_mock = mocker.patch("pcluster.aws.s3.S3Client.create_multipart_upload", return_value="upload-id")
+        uploaded_parts = []
+        upload_part_mock = mocker.patch(
+            "pcluster.aws.s3.S3Client.upload_part",
+            side_effect=lambda part_number, body, **kwargs: uploaded_parts.append(body) or f"etag{part_number}",
+        )
+        complete_upload_mock = mocker.patch("pcluster.aws.s3.S3Client.complete_multipart_upload")
+        abort_upload_mock = mocker.patch("pcluster.aws.s3.S3Client.abort_multipart_upload")
+        archive_dir = tmpdir.mkdir("cluster-logs")
+        # Random content is not compressed, so that the archive spans several parts
+        archive_dir.join("stream1").write_binary(os.urandom(1024))
+
+        try:
+            with LogsArchive(str(archive_dir), bucket="bucket_name", bucket_prefix="prefix") as logs_archive:
+                logs_archive.add(str(archive_dir.join("stream1")))
+                if error:
+                    raise LogsExporterError("error")
+        except LogsExporterError:
+            pass
+
+        assert_that(logs_archive.path).is_equal_to("s3://bucket_name/prefix/cluster-logs.tar.gz")
+        create_upload_mock.assert_called_with(bucket_name="bucket_name", key="prefix/cluster-logs.tar.gz")
+        if error:
+            abort_upload_mock.assert_called_with(
+                bucket_name="bucket_name", key="prefix/cluster-logs.tar.gz", upload_id="upload-id"
+            )
+            complete_upload_mock.assert_not_called()
+        else:
+            abort_upload_mock.assert_not_called()
+            parts = [
+                {"ETag": f"etag{index}", "PartNumber": index} for index in range(1, upload_part_mock.call_count + 1)
+            ]
+            assert_that(len(parts)).is_greater_than(1)
+            complete_upload_mock.assert_called_with(
+                bucket_name="bucket_name", key="prefix/cluster-logs.tar.gz", upload_id="upload-id", parts=parts
+            )
+            assert_that(all(len(part) == 64 for part in uploaded_parts[:-1])).is_true()
+            with tarfile.open(fileobj=io.BytesIO(b"".join(uploaded_parts)), mode="r:gz") as tar:
+                assert_that(tar.getnames()).contains_only("cluster-logs", "cluster-logs/stream1")
+
+
+class TestLogsExportCheckpoint:
+    @pytest.mark.parametrize(
+        "manifest, start_time, end_time, expected_start_time, expected_end_time",
+        [
+            pytest.param(
+                None,
+                None,
+                None,
+                None,
+                datetime.datetime(2021, 6, 4, 11, 50, 0, tzinfo=datetime.timezone.utc),
+                id="first export",
+            ),
+            pytest.param(
+                None,
+                datetime.datetime(2021, 6, 4, 10, 0, 0, tzinfo=datetime.timezone.utc),
+                datetime.datetime(2021, 6, 4, 11, 0, 0, tzinfo=datetime.timezone.utc),
+                datetime.datetime(2021, 6, 4, 10, 0, 0, tzinfo=datetime.timezone.utc),
+                datetime.datetime(2021, 6, 4, 11, 0, 0, tzinfo=datetime.timezone.utc),
+                id="first export with time window",
+            ),
+            pytest.param(
+                {"logGroupName": "groupname", "filters": [], "endTime": 1622800800000, "exportTask": None},
+                None,
+                None,
+                datetime.datetime(2021, 6, 4, 10, 0, 0, 1000, tzinfo=datetime.timezone.utc),
+                datetime.datetime(2021, 6, 4, 11, 50, 0, tzinfo=datetime.timezone.utc),
+                id="incremental export",
+            ),
+            pytest.param(
+                {"logGroupName": "groupname", "filters": [], "endTime": 1622800800000, "exportTask": None},
+                datetime.datetime(2021, 6, 4, 11, 0, 0, tzinfo=datetime.timezone.utc),
+                datetime.datetime(2021, 6, 4, 11, 59, 0, tzinfo=datetime.timezone.utc),
+                datetime.datetime(2021, 6, 4, 11, 0, 0, tzinfo=datetime.timezone.utc),
+                datetime.datetime(2021, 6, 4, 11, 50, 0, tzinfo=datetime.timezone.utc),
+                id="time window after the last export",
+            ),
+            pytest.param(
+                {
+                    "logGroupName": "groupname",
+                    "filters": [],
+                    "endTime": 1622700000000,
+                    "exportTask": {"taskId": "task_id", "startTime": 1622700000001, "endTime": 1622800800000},
+                },
+                None,
+                None,
+                datetime.datetime(2021, 6, 3, 6, 0, 0, 1000, tzinfo=datetime.timezone.utc),
+                datetime.datetime(2021, 6, 4, 10, 0, 0, tzinfo=datetime.timezone.utc),
+                id="resumed export",
+            ),
+        ],
+    )
+    @freeze_time("2021-06-04T12:00:00Z")
+    def test_get_time_window(self, tmpdir, manifest, start_time, end_time, expected_start_time, expected_end_time):
+        checkpoint_file = tmpdir.join("checkpoint.json")
+        if manifest:
+            checkpoint_file.write(json.dumps(manifest))
+
+        checkpoint = LogsExportCheckpoint(str(checkpoint_file), "groupname")
+
+        assert_that(checkpoint.get_time_window(start_time, end_time)).is_equal_to(
+            (expected_start_time, expected_end_time)
+        )
+
+    @freeze_time("2021-06-04T12:00:00Z")
+    def test_get_time_window_without_new_events(self, tmpdir):
+        checkpoint_file = tmpdir.join("checkpoint.json")
+        # The last export ended less than the ingestion delay ago
+        checkpoint_file.write(
+            json.dumps({"logGroupName": "groupname", "filters": [], "endTime": 1622807700000, "exportTask": None})
+        )
+
+        with pytest.raises(LogsExporterError, match="No log events to export in the interval starting at"):
+            LogsExportCheckpoint(str(checkpoint_file), "groupname").get_time_window()
+
+    @pytest.mark.parametrize(
+        "content, filters, expected_error",
+        [
+            ("not json", None, "Unable to read the checkpoint file"),
+            (
+                json.dumps({"logGroupName": "othergroup"}),
+                None,
+                "refers to the log group othergroup and not to groupname",
+            ),
+            (
+                json.dumps({"logGroupName": "groupname", "filters": ["Name=node-type,Values=HeadNode"]}),
+                None,
+                "refers to the filters \\['Name=node-type,Values=HeadNode'\\] and not to \\[\\]",
+            ),
+            (
+                json.dumps({"logGroupName": "groupname", "filters": []}),
+                ["Name=private-dns-name,Values=ip-10-0-0-1"],
+                "refers to the filters \\[\\] and not to \\['Name=private-dns-name,Values=ip-10-0-0-1'\\]",
+            ),
+        ],
+    )
+    def test_invalid_checkpoint_file(self, tmpdir, content, filters, expected_error):
+        checkpoint_file = tmpdir.join("checkpoint.json")
+        checkpoint_file.write(content)
+
+        with pytest.raises(LogsExporterError, match=expected_error):
+            LogsExportCheckpoint(str(checkpoint_file), "groupname", filters)
+
+    def test_complete(self, tmpdir):
+        checkpoint_file = tmpdir.join("checkpoint.json")
+        checkpoint = LogsExportCheckpoint(str(checkpoint_file), "groupname", ["Name=node-type,Values=HeadNode"])
+        checkpoint.start_export_task(
+            "task_id",
+            "bucket_name",
+            "prefix",
+            True,
+            datetime.datetime(2021, 6, 4, 10, 0, 0, tzinfo=datetime.timezone.utc),
+            datetime.datetime(2021, 6, 4, 11, 0, 0, tzinfo=datetime.timezone.utc),
+        )
+        assert_that(json.loads(checkpoint_file.read())["exportTask"]).is_equal_to(
+            {
+                "taskId": "task_id",
+                "bucket": "bucket_name",
+                "bucketPrefix": "prefix",
+                "deleteEverythingUnderPrefix": True,
+                "startTime": 1622800800000,
+                "endTime": 1622804400000,
+            }
+        )
+
+        checkpoint.complete(datetime.datetime(2021, 6, 4, 11, 0, 0, tzinfo=datetime.timezone.utc))
+
+        assert_that(json.loads(checkpoint_file.read())).is_equal_to(
+            {
+                "logGroupName": "groupname",
+                "filters": ["Name=node-type,Values=HeadNode"],
+                "endTime": 1622804400000,
+                "exportTask": None,
+            }
+        )
+        # No temporary file is left behind
+        assert_that(tmpdir.listdir()).is_length(1)
+        # The same filters are accepted by the next export
+        assert_that(
+            LogsExportCheckpoint(str(checkpoint_file), "groupname", ["Name=node-type,Values=HeadNode"]).end_time
+        ).is_equal_to(1622804400000)
+
+
+def _log_event(event_id, timestamp, log_stream_name="stream1"):
+    return {"eventId": event_id, "timestamp": timestamp, "logStreamName": log_stream_name, "message": event_id}
+
+
+class TestLogEventsFollower:
+    def test_poll_with_log_stream_prefix(self, mocker):
+        mock_aws_api(mocker)
+        get_filtered_log_events_mock = mocker.patch(
+            "pcluster.aws.logs.LogsClient.get_filtered_log_events",
+            side_effect=[
+                [_log_event("event2", 1622802790000, "stream2"), _log_event("event1", 1622802790000, "stream1")],
+                # Events already returned are read again, together with the events ingested late
+                [
+                    _log_event("event1", 1622802790000, "stream1"),
+                    _log_event("event3", 1622802789000, "stream1"),
+                    _log_event("event2", 1622802790000, "stream2"),
+                    _log_event("event4", 1622802800000, "stream1"),
+                ],
+                [],
+            ],
+        )
+        start_time = datetime.datetime(2021, 6, 4, 10, 0, 0, tzinfo=datetime.timezone.utc)
+        follower = LogEventsFollower("groupname", log_stream_prefix="ip-10-0-0-1", start_time=start_time)
+
+        assert_that([event["eventId"] for event in follower.poll()]).is_equal_to(["event1", "event2"])
+        assert_that([event["eventId"] for event in follower.poll()]).is_equal_to(["event3", "event4"])
+        assert_that(follower.poll()).is_empty()
+
+        assert_that([call.kwargs["start_time"] for call in get_filtered_log_events_mock.call_args_list]).is_equal_to(
+            # Each poll reads again the 30 seconds before the latest event
+            [1622800800000, 1622802760000, 1622802770000]
+        )
+        get_filtered_log_events_mock.assert_called_with(
+            "groupname", log_stream_name_prefix="ip-10-0-0-1", start_time=1622802770000
+        )
+
+    def test_poll_with_log_stream_names(self, mocker):
+        mock_aws_api(mocker)
+        get_filtered_log_events_mock = mocker.patch(
+            "pcluster.aws.logs.LogsClient.get_filtered_log_events",
+            side_effect=lambda log_group_name, log_stream_names, start_time: [
+                _log_event(log_stream_name, 1622802790000 - index, log_stream_name)
+                for index, log_stream_name in enumerate(log_stream_names)
+            ],
+        )
+        monotonic_mock = mocker.patch("pcluster.models.common.time.monotonic", return_value=0)
+        log_stream_names = [f"stream{index:03}" for index in range(250)]
+        get_log_stream_names_mock = mocker.MagicMock(return_value=log_stream_names)
+        follower = LogEventsFollower("groupname", get_log_stream_names=get_log_stream_names_mock)
+
+        events = follower.poll()
+
+        # Log streams are read with a request every 100 log streams, and their events are merged by timestamp
+        assert_that(get_filtered_log_events_mock.call_count).is_equal_to(3)
+        assert_that(events).is_length(250)
+        assert_that(events).is_sorted(key=lambda event: event["timestamp"])
+
+        # Log stream names are listed again only after the refresh interval
+        follower.poll()
+        assert_that(get_log_stream_names_mock.call_count).is_equal_to(1)
+        monotonic_mock.return_value = 60
+        follower.poll()
+        assert_that(get_log_stream_names_mock.call_count).is_equal_to(2)
+
+    def test_follow(self, mocker):
+        poll_mock = mocker.patch(
+            "pcluster.models.common.LogEventsFollower.poll",
+            side_effect=[
+                [_log_event("event1", 1622802790000)],
+                [],
+                [],
+                [],
+                [],
+                [],
+                [_log_event("event2", 1622802800000)],
+                KeyboardInterrupt(),
+            ],
+        )
+        sleep_mock = mocker.patch("pcluster.models.common.time.sleep")
+
+        events = []
+        with pytest.raises(KeyboardInterrupt):
+            for event in LogEventsFollower("groupname").follow():
+                events.append(event["eventId"])
+
+        assert_that(events).is_equal_to(["event1", "event2"])
+        assert_that(poll_mock.call_count).is_equal_to(8)
+        # The interval doubles while there are no new events, up to the maximum interval
+        assert_that([call.args[0] for call in sleep_mock.call_args_list]).is_equal_to([2, 4, 8, 16, 30, 30, 2])
+
+
+class TestSearchLogEvents:
+    @staticmethod
+    def _get_filtered_log_events(log_group_name, log_stream_name_prefix, start_time, end_time, filter_pattern):
+        # An event at each end of the requested window, returned in reverse order
+        return [_log_event(f"event-{end_time}", end_time, "stream2"), _log_event(f"event-{start_time}", start_time)]
+
+    def test_search_sub_windows(self, mocker, set_env):
+        mock_aws_api(mocker)
+        set_env("PCLUSTER_PERSISTENT_CACHE_ENABLED", "false")
+        get_filtered_log_events_mock = mocker.patch(
+            "pcluster.aws.logs.LogsClient.get_filtered_log_events", side_effect=self._get_filtered_log_events
+        )
+        get_indexed_log_events_mock = mocker.patch("pcluster.aws.logs.LogsClient.get_indexed_log_events")
+
+        events = search_log_events(
+            "groupname",
+            "ERROR",
+            datetime.datetime(2021, 6, 4, 10, 30, tzinfo=datetime.timezone.utc),
+            datetime.datetime(2021, 6, 4, 12, 15, tzinfo=datetime.timezone.utc),
+            log_stream_prefix="ip-10-0-0-1",
+        )
+
+        # Sub-windows are aligned to the hour and clipped to the searched time window
+        assert_that(
+            sorted(
+                (call.kwargs["start_time"], call.kwargs["end_time"])
+                for call in get_filtered_log_events_mock.call_args_list
+            )
+        ).is_equal_to(
+            [
+                (1622802600000, 1622804399999),
+                (1622804400000, 1622807999999),
+                (1622808000000, 1622808900000),
+            ]
+        )
+        get_filtered_log_events_mock.assert_any_call(
+            "groupname",
+            log_stream_name_prefix="ip-10-0-0-1",
+            start_time=1622804400000,
+            end_time=1622807999999,
+            filter_pattern="ERROR",
+        )
+        get_indexed_log_events_mock.assert_not_called()
+        assert_that([event["timestamp"] for event in events]).is_equal_to(
+            [1622802600000, 1622804399999, 1622804400000, 1622807999999, 1622808000000, 1622808900000]
+        )
+
+    @pytest.mark.parametrize("limit, expected_sub_windows", [(None, 10), (3, 2), (4, 2), (5, 3)])
+    def test_search_with_limit(self, mocker, set_env, limit, expected_sub_windows):
+        mock_aws_api(mocker)
+        set_env("PCLUSTER_PERSISTENT_CACHE_ENABLED", "false")
+        mocker.patch("pcluster.models.common.LOGS_SEARCH_MAX_WORKERS", 1)
+        get_filtered_log_events_mock = mocker.patch(
+            "pcluster.aws.logs.LogsClient.get_filtered_log_events", side_effect=self._get_filtered_log_events
+        )
+
+        events = search_log_events(
+            "groupname",
+            "ERROR",
+            datetime.datetime(2021, 6, 4, 0, 0, tzinfo=datetime.timezone.utc),
+            datetime.datetime(2021, 6, 4, 9, 59, 59, 999000, tzinfo=datetime.timezone.utc),
+            limit=limit,
+        )
+
+        # Sub-windows are queried in order, the later ones are not queried once the earliest events are found
+        assert_that(get_filtered_log_events_mock.call_count).is_equal_to(expected_sub_windows)
+        assert_that(events).is_length(limit or 20)
+        assert_that([event["timestamp"] for event in events]).is_sorted()
+        assert_that(events[0]["timestamp"]).is_equal_to(1622764800000)
+
+    def test_search_sub_windows_size(self, mocker, set_env):
+        mock_aws_api(mocker)
+        set_env("PCLUSTER_PERSISTENT_CACHE_ENABLED", "false")
+        get_filtered_log_events_mock = mocker.patch(
+            "pcluster.aws.logs.LogsClient.get_filtered_log_events", return_value=[]
+        )
+
+        search_log_events(
+            "groupname",
+            "ERROR",
+            datetime.datetime(2021, 5, 1, 3, 0, tzinfo=datetime.timezone.utc),
+            datetime.datetime(2021, 5, 31, 3, 0, tzinfo=datetime.timezone.utc),
+        )
+
+        # A month of hourly sub-windows would be too many, so they are extended to 8 hours
+        windows = sorted(
+            (call.kwargs["start_time"], call.kwargs["end_time"]) for call in get_filtered_log_events_mock.call_args_list
+        )
+        assert_that(windows).is_length(91)
+        assert_that(windows[1]).is_equal_to((1619856000000, 1619884799999))
+        assert_that(all(end + 1 == next_start for (_, end), (next_start, _) in zip(windows, windows[1:]))).is_true()
+
+    @freeze_time("2021-06-04T12:05:00Z")
+    def test_search_with_index(self, mocker, set_env, tmp_path):
+        mock_aws_api(mocker)
+        set_env("PCLUSTER_PERSISTENT_CACHE_ENABLED", "true")
+        set_env("PCLUSTER_PERSISTENT_CACHE_DIR", str(tmp_path))
+        mocker.patch(
+            "pcluster.aws.common.PersistentCache._get_namespace_dir",
+            side_effect=lambda region=None, partition=None: os.path.join(
+                PersistentCache._get_partition_dir(partition), "us-east-1-123456789012-3.4.0"
+            ),
+        )
+        mocker.patch("pcluster.aws.logs.LogsClient.region", new_callable=mocker.PropertyMock, return_value=None)
+        LogsClient.get_indexed_log_events.cache.clear()
+        get_filtered_log_events_mock = mocker.patch(
+            "pcluster.aws.logs.LogsClient.get_filtered_log_events", side_effect=self._get_filtered_log_events
+        )
+
+        events = search_log_events(
+            "groupname",
+            "ERROR",
+            datetime.datetime(2021, 6, 4, 10, 30, tzinfo=datetime.timezone.utc),
+            datetime.datetime(2021, 6, 4, 12, 5, tzinfo=datetime.timezone.utc),
+        )
+
+        # The first sub-window is all ingested, so it is requested in full and its results are indexed, while the
+        # events of the others may still be ingested
+        assert_that(
+            sorted(
+                (call.kwargs["start_time"], call.kwargs["end_time"])
+                for call in get_filtered_log_events_mock.call_args_list
+            )
+        ).is_equal_to(
+            [
+                (1622800800000, 1622804399999),
+                (1622804400000, 1622807999999),
+                (1622808000000, 1622808300000),
+            ]
+        )
+        # Events outside the searched time window are discarded
+        assert_that([event["timestamp"] for event in events]).is_equal_to(
+            [1622804399999, 1622804400000, 1622807999999, 1622808000000, 1622808300000]
+        )
+        # The index is stored in its own partition of the persistent cache
+        assert_that(list(tmp_path.glob("partitions/log-index/*/*.pickle"))).is_length(1)
+        assert_that(list(tmp_path.glob("*/*.pickle"))).is_empty()
+
+        # A later search reads the indexed results from disk, without requesting them again
+        LogsClient.get_indexed_log_events.cache.clear()
+        get_filtered_log_events_mock.reset_mock()
+        events = search_log_events(
+            "groupname",
+            "ERROR",
+            datetime.datetime(2021, 6, 4, 10, 0, tzinfo=datetime.timezone.utc),
+            datetime.datetime(2021, 6, 4, 10, 59, 59, 999000, tzinfo=datetime.timezone.utc),
+        )
+        get_filtered_log_events_mock.assert_not_called()
+        assert_that([event["timestamp"] for event in events]).is_equal_to([1622800800000, 1622804399999])
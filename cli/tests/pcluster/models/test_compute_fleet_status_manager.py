@@ -4,6 +4,7 @@ import os
 import pytest
 from assertpy import assert_that
 
+from pcluster.aws.common import AWSClientError
 from pcluster.models.compute_fleet_status_manager import (
     ComputeFleetStatus,
     ComputeFleetStatusManager,
@@ -195,3 +196,47 @@ class TestComputeFleetStatusManager:
     def test_get_manager(self, version, scheduler, expected_compute_fleet_status_manager_instance):
         compute_fleet_status_manager = ComputeFleetStatusManager.get_manager("cluster-name", version, scheduler)
         assert_that(compute_fleet_status_manager).is_instance_of(expected_compute_fleet_status_manager_instance)
+
+    @pytest.mark.parametrize(
+        "batch_get_items_response, expected_statuses",
+        [
+            (
+                {
+                    "parallelcluster-cluster1": [{"Id": "COMPUTE_FLEET", "Data": {"status": "RUNNING"}}],
+                    "parallelcluster-cluster2": [{"Id": "COMPUTE_FLEET", "Status": "STOPPED"}],
+                },
+                [ComputeFleetStatus.RUNNING, ComputeFleetStatus.STOPPED, ComputeFleetStatus.UNKNOWN],
+            ),
+            (
+                {
+                    "parallelcluster-cluster1": [{"Id": "COMPUTE_FLEET", "Data": {"status": "WRONG"}}],
+                    "parallelcluster-cluster2": [{"Id": "COMPUTE_FLEET", "Status": "STOPPING"}],
+                    "parallelcluster-cluster3": [{"Id": "COMPUTE_FLEET", "Data": {"status": "PROTECTED"}}],
+                },
+                [ComputeFleetStatus.UNKNOWN, ComputeFleetStatus.STOPPING, ComputeFleetStatus.PROTECTED],
+            ),
+            (AWSClientError("batch_get_item", "error"), [ComputeFleetStatus.UNKNOWN] * 3),
+        ],
+    )
+    def test_get_statuses(self, mocker, batch_get_items_response, expected_statuses):
+        ddb_resource_mock = mocker.MagicMock()
+        if isinstance(batch_get_items_response, Exception):
+            ddb_resource_mock.batch_get_items.side_effect = batch_get_items_response
+        else:
+            ddb_resource_mock.batch_get_items.return_value = batch_get_items_response
+        managers = [
+            JsonComputeFleetStatusManager("cluster1"),
+            PlainTextComputeFleetStatusManager("cluster2"),
+            JsonComputeFleetStatusManager("cluster3"),
+        ]
+
+        statuses = ComputeFleetStatusManager.get_statuses(managers, ddb_resource=ddb_resource_mock)
+
+        assert_that(statuses).is_equal_to(expected_statuses)
+        ddb_resource_mock.batch_get_items.assert_called_once_with(
+            {
+                "parallelcluster-cluster1": [{"Id": "COMPUTE_FLEET"}],
+                "parallelcluster-cluster2": [{"Id": "COMPUTE_FLEET"}],
+                "parallelcluster-cluster3": [{"Id": "COMPUTE_FLEET"}],
+            }
+        )
@@ -484,8 +484,7 @@ class TestImageBuilder:
         )
         mocker.patch("pcluster.aws.logs.LogsClient.log_group_exists", return_value=log_group_exists)
         download_stack_events_mock = mocker.patch("pcluster.models.imagebuilder.export_stack_events")
-        create_logs_archive_mock = mocker.patch("pcluster.models.imagebuilder.create_logs_archive")
-        upload_archive_mock = mocker.patch("pcluster.models.imagebuilder.upload_archive")
+        logs_archive_mock = mocker.patch("pcluster.models.imagebuilder.LogsArchive")
         presign_mock = mocker.patch("pcluster.models.imagebuilder.create_s3_presigned_url")
 
         # Following mocks are used only if CW loggins is enabled
@@ -493,7 +492,7 @@ class TestImageBuilder:
             "pcluster.models.imagebuilder.ImageBuilder._init_export_logs_filters",
             return_value=_MockExportImageLogsFiltersParser(),
         )
-        cw_logs_exporter_mock = mocker.patch("pcluster.models.imagebuilder.CloudWatchLogsExporter", autospec=True)
+        cw_logs_exporter_mock = mocker.patch("pcluster.models.imagebuilder.create_logs_exporter")
 
         kwargs.update({"bucket": "bucket_name"})
         if expected_error:
@@ -513,10 +512,9 @@ class TestImageBuilder:
             else:
                 cw_logs_exporter_mock.assert_not_called()
                 logs_filter_mock.assert_not_called()
-            create_logs_archive_mock.assert_called()
+            logs_archive_mock.assert_called()
 
         if "output_file" not in kwargs:
-            upload_archive_mock.assert_called()
             presign_mock.assert_called()
 
     @pytest.mark.parametrize(
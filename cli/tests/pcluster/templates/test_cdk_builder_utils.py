@@ -15,6 +15,7 @@ from assertpy import assert_that
 from aws_cdk import aws_ec2 as ec2
 from aws_cdk.core import CfnTag
 
+from pcluster.aws.common import Cache
 from pcluster.config.cluster_config import (
     BaseQueue,
     CapacityReservationTarget,
@@ -24,12 +25,14 @@ from pcluster.config.cluster_config import (
 )
 from pcluster.constants import PCLUSTER_CLUSTER_NAME_TAG, PCLUSTER_NODE_TYPE_TAG
 from pcluster.schemas.cluster_schema import ClusterSchema
+from pcluster.templates import cdk_builder_utils
 from pcluster.templates.cdk_builder import CDKTemplateBuilder
 from pcluster.templates.cdk_builder_utils import (
     CdkLaunchTemplateBuilder,
     dict_to_cfn_tags,
     get_cluster_tags,
     get_default_volume_tags,
+    get_user_data_content,
 )
 from pcluster.utils import load_yaml_dict, split_resource_prefix
 from tests.pcluster.aws.dummy_aws_api import mock_aws_api
@@ -404,6 +407,35 @@ class TestCdkLaunchTemplateBuilder:
             expected_response
         )
 
+    def test_get_user_data(self, mocker):
+        Cache.clear_all()
+        resource_filename_spy = mocker.spy(cdk_builder_utils.pkg_resources, "resource_filename")
+        launch_template_builder = CdkLaunchTemplateBuilder()
+
+        head_node_user_data = launch_template_builder.get_user_data(
+            "../resources/head_node/user_data.sh", {"Variable": "value"}
+        )
+        compute_user_data = launch_template_builder.get_user_data(
+            "../resources/compute_node/user_data.sh", {"Variable": "value", "Other": "value"}
+        )
+        # Identical renders reuse the same intrinsic, regardless of the order of the variables
+        assert_that(
+            launch_template_builder.get_user_data(
+                "../resources/compute_node/user_data.sh", {"Other": "value", "Variable": "value"}
+            )
+        ).is_equal_to(compute_user_data)
+        assert_that(
+            launch_template_builder.get_user_data("../resources/compute_node/user_data.sh", {"Variable": "other"})
+        ).is_not_in(compute_user_data, head_node_user_data)
+
+        assert_that(launch_template_builder.get_user_data_stats()).is_equal_to(
+            {"renders": 4, "deduplicated_renders": 1}
+        )
+        # Each user data file is read once
+        assert_that(resource_filename_spy.call_count).is_equal_to(2)
+        assert_that(get_user_data_content("../resources/head_node/user_data.sh")).contains("MIME-Version")
+        assert_that(resource_filename_spy.call_count).is_equal_to(2)
+
 
 def _check_policy_statement(list_policy_statement, iam_path, cluster_name):
     for statement in list_policy_statement:
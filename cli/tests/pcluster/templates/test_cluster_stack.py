@@ -11,6 +11,7 @@
 import json
 import os
 import re
+import sys
 from abc import ABC, abstractmethod
 from datetime import datetime
 
@@ -28,12 +29,14 @@ from pcluster.constants import (
     MAX_NUMBER_OF_QUEUES,
 )
 from pcluster.schemas.cluster_schema import ClusterSchema
+from pcluster.templates import cluster_stack
 from pcluster.templates.cdk_builder import CDKTemplateBuilder
 from pcluster.utils import load_json_dict, load_yaml_dict
 from tests.pcluster.aws.dummy_aws_api import mock_aws_api
 from tests.pcluster.models.dummy_s3_bucket import dummy_cluster_bucket, mock_bucket
 from tests.pcluster.utils import (
     assert_lambdas_have_expected_vpc_config_and_managed_policy,
+    get_resources,
     load_cluster_model_from_yaml,
 )
 
@@ -64,6 +67,29 @@ def test_cluster_builder_from_configuration_file(
     _generate_template(cluster, capsys)
 
 
+def test_compute_fleet_launch_templates_preparation(mocker):
+    """Verify that the parts of the launch templates shared by the compute resources are prepared once."""
+    mock_aws_api(mocker)
+    mock_bucket(mocker)
+    user_data_env_spy = mocker.spy(cluster_stack, "get_common_user_data_env")
+    instance_tags_spy = mocker.spy(cluster_stack, "get_default_instance_tags")
+    _, cluster = load_cluster_model_from_yaml("slurm.full.yaml")
+
+    template = CDKTemplateBuilder().build_cluster_template(
+        cluster_config=cluster, bucket=dummy_cluster_bucket(), stack_name="clustername"
+    )
+
+    queues = cluster.scheduling.queues
+    compute_resources = [resource for queue in queues for resource in queue.compute_resources]
+    assert_that(get_resources(template, type="AWS::EC2::LaunchTemplate")).is_length(len(compute_resources) + 1)
+    # One call for the head node and one for each queue
+    assert_that(user_data_env_spy.call_count).is_equal_to(len(queues) + 1)
+    compute_instance_tags_calls = [call for call in instance_tags_spy.call_args_list if call.args[3] == "Compute"]
+    assert_that(compute_instance_tags_calls).is_length(
+        len({(resource.architecture, bool(resource.efa and resource.efa.enabled)) for resource in compute_resources})
+    )
+
+
 def test_cluster_config_limits(mocker, capsys, tmpdir, pcluster_config_reader, test_datadir):
     """
     Build CFN template starting from config examples and assert CFN limits (file size and number of resources).
@@ -708,3 +734,14 @@ def test_cluster_lambda_functions_vpc_config(mocker, config_file_name, vpc_confi
     )
 
     assert_lambdas_have_expected_vpc_config_and_managed_policy(generated_template, vpc_config)
+
+
+def test_cdk_template_builder_warm_up(mocker):
+    app_mock = mocker.patch("aws_cdk.core.App")
+    stack_mock = mocker.patch("aws_cdk.core.Stack")
+
+    CDKTemplateBuilder.warm_up()
+
+    stack_mock.assert_called_once_with(app_mock.return_value, "WarmUp")
+    app_mock.return_value.synth.assert_called_once()
+    assert_that(sys.modules).contains("pcluster.templates.cluster_stack", "pcluster.templates.imagebuilder_stack")
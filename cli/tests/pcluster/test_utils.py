@@ -10,6 +10,7 @@
 # limitations under the License.
 # This module provides unit tests for the functions in the pcluster.utils module."""
 import os
+import stat
 import time
 
 import pytest
@@ -20,7 +21,7 @@ import pcluster.aws.common
 import pcluster.utils as utils
 from pcluster.aws.aws_api import AWSApi
 from pcluster.aws.aws_resources import InstanceTypeInfo
-from pcluster.aws.common import Cache
+from pcluster.aws.common import AWSCallsRecorder, Cache, PersistentCache
 from pcluster.models.cluster import Cluster, ClusterStack
 from pcluster.utils import yaml_load
 from tests.pcluster.aws.dummy_aws_api import mock_aws_api
@@ -165,6 +166,219 @@ class TestCache:
 
         assert_that(self.invocations).is_length(4)
 
+    def test_colliding_hashes(self):
+        # hash(-1) == hash(-2) in CPython, results must not be mixed up anyway
+        assert_that(self._cached_method_1(-1, 0)).is_equal_to((-1, 0))
+        assert_that(self._cached_method_1(-2, 0)).is_equal_to((-2, 0))
+        assert_that(self._cached_method_1([1, 2], 0)).is_equal_to(([1, 2], 0))
+        assert_that(self._cached_method_1((1, 2), 0)).is_equal_to(((1, 2), 0))
+
+        assert_that(self.invocations).is_length(4)
+
+    def test_lru_eviction_and_stats(self):
+        @Cache.cached(max_size=2)
+        def _bounded_method(arg):
+            TestCache.invocations.append(arg)
+            return arg
+
+        for arg in [1, 2, 1, 3, 1, 2]:
+            assert_that(_bounded_method(arg)).is_equal_to(arg)
+
+        # 2 is evicted when 3 is added, since 1 has been used more recently
+        assert_that(self.invocations).is_equal_to([1, 2, 3, 2])
+        assert_that(_bounded_method.cache.stats()).is_equal_to({"size": 2, "hits": 2, "misses": 4, "evictions": 2})
+        assert_that(Cache.get_stats()).contains_entry({_bounded_method.__qualname__: _bounded_method.cache.stats()})
+        # Locks of completed calls are released
+        assert_that(_bounded_method.call_locks).is_empty()
+
+    def test_recorded_lookups(self):
+        self._cached_method_1(1, 2)
+        with AWSCallsRecorder.record() as stats:
+            self._cached_method_1(1, 2)
+            self._cached_method_1(2, 1)
+            self._cached_method_1(2, 1)
+        # Lookups done outside of the recording block are not counted
+        self._cached_method_1(3, 4)
+
+        assert_that(stats).is_equal_to({"awsCalls": {}, "cacheHits": 2, "cacheMisses": 1})
+
+    def test_nested_recorded_lookups(self):
+        with AWSCallsRecorder.record() as outer_stats:
+            self._cached_method_1(1, 2)
+            with AWSCallsRecorder.record(cache_lookups=True) as inner_stats:
+                self._cached_method_1(1, 2)
+
+        assert_that(outer_stats).is_equal_to({"awsCalls": {}, "cacheHits": 1, "cacheMisses": 1})
+        assert_that(inner_stats).is_equal_to(
+            {"awsCalls": {}, "cacheHits": 1, "cacheMisses": 0, "cacheLookups": {self._cached_method_1.__qualname__}}
+        )
+
+    def test_ttl(self, mocker):
+        @Cache.cached(ttl=10)
+        def _expiring_method(arg):
+            TestCache.invocations.append(arg)
+            return arg
+
+        now = time.time()
+        time_mock = mocker.patch("pcluster.aws.common.time.time", return_value=now)
+        _expiring_method(1)
+        time_mock.return_value = now + 5
+        _expiring_method(1)
+        time_mock.return_value = now + 11
+        _expiring_method(1)
+
+        assert_that(self.invocations).is_equal_to([1, 1])
+
+
+class TestPersistentCache:
+    invocations = []
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        pcluster.aws.common.Cache.clear_all()
+
+    @pytest.fixture(autouse=True)
+    def clear_invocations(self):
+        del self.invocations[:]
+
+    @pytest.fixture(autouse=True)
+    def persistent_cache_dir(self, mocker, set_env, tmp_path):
+        set_env("PCLUSTER_PERSISTENT_CACHE_ENABLED", "true")
+        set_env("PCLUSTER_PERSISTENT_CACHE_DIR", str(tmp_path))
+        mocker.patch(
+            "pcluster.aws.common.PersistentCache._get_namespace_dir",
+            side_effect=lambda region=None, partition=None: os.path.join(
+                PersistentCache._get_partition_dir(partition), "us-east-1-123456789012-3.4.0"
+            ),
+        )
+        return tmp_path
+
+    @staticmethod
+    @Cache.cached(persistent_ttl=60)
+    def _persisted_method(arg1, arg2):
+        TestPersistentCache.invocations.append((arg1, arg2))
+        return {"args": [arg1, arg2]}
+
+    @staticmethod
+    @Cache.cached(persistent_ttl=60, persistent_partition="partition", persistent_max_size=400)
+    def _partitioned_method(arg1, arg2):
+        TestPersistentCache.invocations.append((arg1, arg2))
+        return {"args": [arg1, arg2]}
+
+    @staticmethod
+    @Cache.cached
+    def _not_persisted_method(arg1, arg2):
+        TestPersistentCache.invocations.append((arg1, arg2))
+        return {"args": [arg1, arg2]}
+
+    def test_persisted_across_invocations(self):
+        for _ in range(0, 2):
+            assert_that(self._persisted_method(1, 2)).is_equal_to({"args": [1, 2]})
+            assert_that(self._not_persisted_method(1, 2)).is_equal_to({"args": [1, 2]})
+            # Clearing the in-memory caches simulates a new CLI invocation
+            Cache.clear_all()
+
+        assert_that(self.invocations).is_length(3)
+
+    def test_disabled_persistent_cache(self, set_env):
+        set_env("PCLUSTER_PERSISTENT_CACHE_ENABLED", "false")
+        for _ in range(0, 2):
+            assert_that(self._persisted_method(1, 2)).is_equal_to({"args": [1, 2]})
+            Cache.clear_all()
+
+        assert_that(self.invocations).is_length(2)
+
+    def test_expired_entry(self, mocker):
+        assert_that(self._persisted_method(1, 2)).is_equal_to({"args": [1, 2]})
+        Cache.clear_all()
+        mocker.patch("pcluster.aws.common.time.time", return_value=time.time() + 61)
+        assert_that(self._persisted_method(1, 2)).is_equal_to({"args": [1, 2]})
+
+        assert_that(self.invocations).is_length(2)
+
+    def test_store_and_is_cached(self):
+        assert_that(self._persisted_method.is_cached(1, 2)).is_false()
+        self._persisted_method.store({"args": "stored"}, 1, 2)
+        Cache.clear_all()
+
+        assert_that(self._persisted_method.is_cached(1, 2)).is_true()
+        assert_that(self._persisted_method(1, 2)).is_equal_to({"args": "stored"})
+        assert_that(self.invocations).is_empty()
+
+    def test_eviction(self, mocker, persistent_cache_dir):
+        mocker.patch.object(PersistentCache, "max_size", 400)
+        for i in range(0, 5):
+            known_entries = set(persistent_cache_dir.rglob("*.pickle"))
+            self._persisted_method(i, "x" * 50)
+            # Set increasing access times to have a deterministic eviction order
+            for entry in set(persistent_cache_dir.rglob("*.pickle")) - known_entries:
+                os.utime(entry, (i, i))
+
+        entries = list(persistent_cache_dir.rglob("*.pickle"))
+        assert_that(sum(entry.stat().st_size for entry in entries)).is_less_than_or_equal_to(400)
+        assert_that(len(entries)).is_between(1, 4)
+        Cache.clear_all()
+        assert_that(self._persisted_method.is_cached(0, "x" * 50)).is_false()
+        assert_that(self._persisted_method.is_cached(4, "x" * 50)).is_true()
+
+    def test_size_tracked_without_scanning(self, mocker, persistent_cache_dir):
+        walk_mock = mocker.patch("pcluster.aws.common.os.walk", wraps=os.walk)
+        for i in range(0, 10):
+            self._persisted_method(i, 2)
+
+        # The cache directory is scanned only at the first write, then the size is tracked at each write
+        assert_that(walk_mock.call_count).is_equal_to(1)
+        assert_that(PersistentCache._sizes[str(persistent_cache_dir)]).is_equal_to(
+            sum(entry.stat().st_size for entry in persistent_cache_dir.rglob("*.pickle"))
+        )
+
+    def test_partition(self, mocker, persistent_cache_dir):
+        mocker.patch.object(PersistentCache, "max_size", 400)
+        self._persisted_method(0, "x" * 50)
+        for i in range(0, 5):
+            self._partitioned_method(i, "x" * 50)
+        partition_dir = persistent_cache_dir / "partitions" / "partition"
+
+        # Partitions have their own size limit, their entries do not evict the ones of the default partition
+        partition_entries = list(partition_dir.rglob("*.pickle"))
+        assert_that(sum(entry.stat().st_size for entry in partition_entries)).is_less_than_or_equal_to(400)
+        assert_that(len(partition_entries)).is_between(1, 4)
+        assert_that(PersistentCache._sizes[str(partition_dir)]).is_equal_to(
+            sum(entry.stat().st_size for entry in partition_entries)
+        )
+        assert_that(PersistentCache._sizes[str(persistent_cache_dir)]).is_equal_to(
+            sum(entry.stat().st_size for entry in persistent_cache_dir.glob("*/*.pickle"))
+        )
+        Cache.clear_all()
+        assert_that(self._persisted_method.is_cached(0, "x" * 50)).is_true()
+        assert_that(self._partitioned_method.is_cached(4, "x" * 50)).is_true()
+
+    @pytest.mark.parametrize("insecure_level", ["root", "namespace"])
+    def test_insecure_directory(self, persistent_cache_dir, insecure_level, caplog):
+        self._persisted_method(1, 2)
+        Cache.clear_all()
+        insecure_dir = (
+            persistent_cache_dir if insecure_level == "root" else persistent_cache_dir / "us-east-1-123456789012-3.4.0"
+        )
+        insecure_dir.chmod(0o777)
+
+        # Entries in directories writable by other users are neither read nor written
+        assert_that(self._persisted_method.is_cached(1, 2)).is_false()
+        self._persisted_method(3, 4)
+        assert_that(list(persistent_cache_dir.rglob("*.pickle"))).is_length(1)
+        assert_that(self.invocations).is_length(2)
+        assert_that(caplog.text).contains("WARNING").contains(f"Directory {insecure_dir} must be owned")
+
+    def test_created_cache_dir(self, set_env, persistent_cache_dir):
+        cache_dir = persistent_cache_dir / "parallelcluster" / "cache"
+        set_env("PCLUSTER_PERSISTENT_CACHE_DIR", str(cache_dir))
+        self._persisted_method(1, 2)
+        Cache.clear_all()
+
+        # The cache root is created accessible only by the current user, hence its entries are read
+        assert_that(stat.S_IMODE(cache_dir.stat().st_mode)).is_equal_to(0o700)
+        assert_that(self._persisted_method.is_cached(1, 2)).is_true()
+
 
 def test_init_from_instance_type(mocker, caplog):
     mock_aws_api(mocker, mock_instance_type_info=False)
@@ -350,3 +564,32 @@ def test_split_resource_prefix(resource_prefix, expected_output):
     iam_path_prefix, iam_role_prefix = utils.split_resource_prefix(resource_prefix=resource_prefix)
     assert_that(iam_path_prefix).is_equal_to(expected_output[0])
     assert_that(iam_role_prefix).is_equal_to(expected_output[1])
+
+
+def test_poll(mocker):
+    sleep_mock = mocker.patch("pcluster.utils.time.sleep")
+    func_mock = mocker.MagicMock(side_effect=["PENDING", "PENDING", "PENDING", "PENDING", "PENDING", "COMPLETED"])
+
+    result = utils.poll(func_mock, until=lambda status: status == "COMPLETED", initial_interval=1, max_interval=4)
+
+    assert_that(result).is_equal_to("COMPLETED")
+    assert_that(func_mock.call_count).is_equal_to(6)
+    # Jittered exponential backoff capped to max_interval
+    for call, interval in zip(sleep_mock.call_args_list, [1, 2, 4, 4, 4]):
+        assert_that(call[0][0]).is_between(interval / 2, interval)
+
+
+def test_poll_timeout(mocker):
+    current_time = [0]
+
+    def _sleep(seconds):
+        current_time[0] += seconds
+
+    mocker.patch("pcluster.utils.time.monotonic", side_effect=lambda: current_time[0])
+    sleep_mock = mocker.patch("pcluster.utils.time.sleep", side_effect=_sleep)
+
+    with pytest.raises(TimeoutError, match="Timeout expired after 10 seconds"):
+        utils.poll(lambda: "PENDING", until=lambda status: status == "COMPLETED", timeout=10, max_interval=8)
+    # The last wait is shortened not to overshoot the deadline
+    assert_that(current_time[0]).is_equal_to(10)
+    assert_that(sleep_mock.call_count).is_greater_than(1)
@@ -275,7 +275,8 @@ def test_slurm_validators_are_called_with_correct_argument(test_datadir, mocker)
                 queue_name="queue2",
                 subnet_ids=["subnet-23456789"],
             ),
-        ]
+        ],
+        any_order=True,
     )
     security_groups_validator.assert_has_calls(
         [call(security_group_ids=None), call(security_group_ids=None)], any_order=True
@@ -579,7 +580,8 @@ def test_scheduler_plugin_validators_are_called_with_correct_argument(test_datad
                 queue_name="queue2",
                 subnet_ids=["subnet-12345678"],
             ),
-        ]
+        ],
+        any_order=True,
     )
     security_groups_validator.assert_has_calls(
         [call(security_group_ids=None), call(security_group_ids=None)], any_order=True
@@ -654,7 +656,7 @@ def test_scheduler_plugin_validators_are_called_with_correct_argument(test_datad
     supported_versions_validator.assert_has_calls(
         [call(installed_version=get_installed_version(), supported_versions_string=">=3.1.0, <=3.4.2")]
     )
-    user_name_validator.assert_has_calls([call(user_name="user1"), call(user_name="user2")])
+    user_name_validator.assert_has_calls([call(user_name="user1"), call(user_name="user2")], any_order=True)
 
     # No assertion on the argument for minor validators
     name_validator.assert_called()
@@ -0,0 +1,64 @@
+#!/usr/bin/python
+#
+# Copyright 2022 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not
+# use this file except in compliance with the License. A copy of the License
+# is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, express or implied. See the License for the specific language
+# governing permissions and limitations under the License.
+#
+#
+# Measure the startup time of the pcluster CLI for commands that do not call any AWS service
+#
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import argparse
+
+COMMANDS = [["version"], ["--help"], ["list-clusters", "--help"]]
+CLI_SCRIPT = "import sys; from pcluster.cli.entrypoint import main; sys.argv = ['pcluster'] + sys.argv[1:]; main()"
+
+
+def _run_command(command, cache_dir):
+    env = dict(os.environ, PCLUSTER_PERSISTENT_CACHE_DIR=cache_dir)
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", CLI_SCRIPT] + command, check=True, stdout=subprocess.DEVNULL, env=env)
+    return time.perf_counter() - start
+
+
+def _run_interpreter():
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"], check=True)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the startup time of the pcluster CLI")
+    parser.add_argument("--runs", type=int, default=10, help="Number of runs for each command")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        # The first run compiles the CLI model and stores it in the empty cache directory
+        print(f"{'first run (cold cache)':<30} {_run_command(['version'], cache_dir) * 1000:8.1f} ms")
+        interpreter_timings = [_run_interpreter() for _ in range(args.runs)]
+        print(f"{'python interpreter':<30} {statistics.median(interpreter_timings) * 1000:8.1f} ms")
+        for command in COMMANDS:
+            timings = [_run_command(command, cache_dir) for _ in range(args.runs)]
+            print(
+                f"{' '.join(['pcluster'] + command):<30} {statistics.median(timings) * 1000:8.1f} ms "
+                f"(min {min(timings) * 1000:.1f} ms, max {max(timings) * 1000:.1f} ms)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/python
+#
+# Copyright 2022 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not
+# use this file except in compliance with the License. A copy of the License
+# is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, express or implied. See the License for the specific language
+# governing permissions and limitations under the License.
+#
+#
+# Measure the time needed to synthesize the cluster template as a function of the number of queues and
+# compute resources. AWS calls are mocked with the dummy AWS API of the unit tests, so the script must be
+# executed from the cli directory, e.g. python ../util/benchmark-template-synth.py --queues 1 10 --compute-resources 1 5
+#
+import os
+import statistics
+import sys
+import time
+from unittest import mock
+
+import argparse
+
+
+class _Patcher:
+    """Minimal replacement of the pytest-mock fixture used by the unit tests helpers."""
+
+    def __init__(self):
+        self._patches = []
+
+    def patch(self, target, **kwargs):
+        patch = mock.patch(target, **kwargs)
+        self._patches.append(patch)
+        return patch.start()
+
+    def stop_all(self):
+        for patch in reversed(self._patches):
+            patch.stop()
+
+
+def _generate_config(queues, compute_resources):
+    return {
+        "Image": {"Os": "alinux2"},
+        "HeadNode": {
+            "InstanceType": "t2.micro",
+            "Networking": {"SubnetId": "subnet-12345678"},
+            "Ssh": {"KeyName": "ec2-key-name"},
+        },
+        "Scheduling": {
+            "Scheduler": "slurm",
+            "SlurmQueues": [
+                {
+                    "Name": f"queue{queue_index}",
+                    "Networking": {"SubnetIds": ["subnet-12345678"]},
+                    "ComputeResources": [
+                        {"Name": f"compute-resource{resource_index}", "InstanceType": "c5.2xlarge"}
+                        for resource_index in range(compute_resources)
+                    ],
+                }
+                for queue_index in range(queues)
+            ],
+        },
+    }
+
+
+def _synthesize(queues, compute_resources):
+    from pcluster.schemas.cluster_schema import ClusterSchema
+    from pcluster.templates.cdk_builder import CDKTemplateBuilder
+    from tests.pcluster.models.dummy_s3_bucket import dummy_cluster_bucket
+
+    cluster_config = ClusterSchema(cluster_name="benchmark").load(_generate_config(queues, compute_resources))
+    start = time.perf_counter()
+    CDKTemplateBuilder.build_cluster_template(
+        cluster_config=cluster_config, bucket=dummy_cluster_bucket(), stack_name="benchmark"
+    )
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the synthesis time of the cluster template")
+    parser.add_argument("--queues", type=int, nargs="+", default=[1, 5, 10], help="Numbers of queues")
+    parser.add_argument(
+        "--compute-resources", type=int, nargs="+", default=[1, 5], help="Numbers of compute resources per queue"
+    )
+    parser.add_argument("--runs", type=int, default=3, help="Number of runs for each combination")
+    args = parser.parse_args()
+
+    sys.path.insert(0, os.getcwd())
+    from pcluster.templates.cdk_builder import CDKTemplateBuilder
+    from tests.pcluster.aws.dummy_aws_api import mock_aws_api
+    from tests.pcluster.models.dummy_s3_bucket import mock_bucket
+
+    patcher = _Patcher()
+    try:
+        mock_aws_api(patcher)
+        mock_bucket(patcher)
+        # Exclude the startup of the jsii runtime from the measures
+        CDKTemplateBuilder.warm_up()
+        print(f"{'queues':>8} {'resources':>10} {'launch templates':>17} {'median':>10} {'per template':>13}")
+        for queues in args.queues:
+            for compute_resources in args.compute_resources:
+                timings = [_synthesize(queues, compute_resources) for _ in range(args.runs)]
+                median = statistics.median(timings)
+                launch_templates = queues * compute_resources
+                print(
+                    f"{queues:>8} {compute_resources:>10} {launch_templates:>17} {median:>9.2f}s "
+                    f"{median / launch_templates * 1000:>10.1f} ms"
+                )
+    finally:
+        patcher.stop_all()
+
+
+if __name__ == "__main__":
+    main()